@@ -28,7 +28,7 @@ async def interactive_search():
         config = yaml.safe_load(f)
 
     # Initialize engine
-    engine = KnowledgeFusionEngine(config.get("knowledge_sources", {}))
+    engine = KnowledgeFusionEngine(config.get("knowledge_sources", {}), config.get("cache"))
     await engine.initialize()
 
     try:
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Build the offline Cycling '74 documentation mirror
+
+Fetches every object reference and tutorial listed in the object index
+and stores the parsed pages in the local doc store. Point --base-url at
+a local stand-in server to build the mirror without internet access.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from pathlib import Path
+
+import yaml
+
+from src.knowledge import Cycling74Connector
+
+
+async def build_mirror(args):
+    """Prefetch all documentation into the mirror"""
+    with open(args.config) as f:
+        config = yaml.safe_load(f)
+
+    cycling74_config = dict(config.get("knowledge_sources", {}).get("cycling74_docs", {}))
+    cycling74_config["offline"] = False
+    if args.output:
+        cycling74_config["mirror_path"] = args.output
+    if args.base_url:
+        cycling74_config["fetch_base_url"] = args.base_url
+    if args.concurrency:
+        cycling74_config["mirror_concurrency"] = args.concurrency
+        cycling74_config["max_concurrent_requests"] = args.concurrency
+
+    cycling74 = Cycling74Connector(cycling74_config, config.get("cache"))
+    try:
+        await cycling74.initialize()
+        print(f"📚 Mirroring {len(cycling74.object_index)} index entries to {cycling74.mirror_path}")
+
+        start = time.perf_counter()
+        stats = await cycling74.build_mirror()
+        elapsed = time.perf_counter() - start
+
+        print(f"✅ {stats['mirrored']} pages mirrored, {stats['failed']} failed in {elapsed:.1f}s")
+    finally:
+        await cycling74.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the offline Cycling '74 documentation mirror")
+    parser.add_argument("--config", type=Path, default=Path("config/config.yaml"), help="Configuration file")
+    parser.add_argument("--output", help="Mirror database path (defaults to cycling74_docs.mirror_path)")
+    parser.add_argument("--base-url", help="Fetch from this origin instead, e.g. http://127.0.0.1:8080")
+    parser.add_argument("--concurrency", type=int, help="Parallel requests")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    asyncio.run(build_mirror(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,13 +8,14 @@ This module provides the fusion of multiple knowledge sources:
 """
 
 from .cycling74_connector import Cycling74Connector
-from .engine import KnowledgeEntry, KnowledgeFusionEngine, Pattern, SearchResult
+from .engine import KnowledgeEntry, KnowledgeFusionEngine, Pattern, SearchResult, StreamUpdate
 from .minutiae_connector import MinutiaeConnector
 
 __all__ = [
     "KnowledgeFusionEngine",
     "KnowledgeEntry",
     "SearchResult",
+    "StreamUpdate",
     "Pattern",
     "Cycling74Connector",
     "MinutiaeConnector",
@@ -0,0 +1,76 @@
+"""
+Circuit Breaker
+
+Tracks the health of one upstream host. After a run of consecutive
+failures the circuit opens and requests fail fast; once the reset
+timeout has passed a single probe request is let through, and its
+outcome closes or reopens the circuit.
+"""
+
+import time
+from typing import Any, Callable, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe"""
+
+    def __init__(
+        self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at = 0.0
+
+        self.rejected = 0
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now; rejected requests should fail fast"""
+        if self.state == CLOSED:
+            return True
+
+        now = self.clock()
+        if self.state == OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+            self.probe_started_at = now
+            return True
+
+        # A probe that never reported back (e.g. cancelled) must not block the host forever
+        if self.state == HALF_OPEN and now - self.probe_started_at >= self.reset_timeout:
+            self.probe_started_at = now
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        """The host answered; close the circuit"""
+        self.state = CLOSED
+        self.failures = 0
+
+    def record_failure(self):
+        """The host failed or timed out; open the circuit after enough failures"""
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.times_opened += 1
+            self.state = OPEN
+            self.opened_at = self.clock()
+
+    def stats(self) -> Dict[str, Any]:
+        """Current state and counters"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+        }
@@ -6,20 +6,80 @@ real-time access to object references, tutorials, and guides.
 """
 
 import asyncio
-import json
+import heapq
 import logging
-import re
-from datetime import datetime, timedelta
+import math
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from urllib.parse import quote, urljoin
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+from urllib.parse import quote, urljoin, urlsplit, urlunsplit
 
 import aiohttp
 from aiofiles import open as aio_open
-from bs4 import BeautifulSoup
+
+from .circuit_breaker import CircuitBreaker
+from .doc_parsers import OBJECT_DOC_PARSERS, TUTORIAL_PARSERS
+from .doc_store import DocStore, StoredDoc
+from .listing_catalog import LISTING_FILES, build_catalog, sources_digest
+from .lru_cache import LRUCache
+from .name_index import CompletionIndex, NgramIndex
 
 logger = logging.getLogger(__name__)
 
+# Hand-written descriptions of well-known objects
+OBJECT_DESCRIPTIONS = {
+    "metro": "Output bang messages at a regular interval",
+    "counter": "Count and output numbers",
+    "pattrhub": "Route pattr messages between patchers",
+    "pattr": "Store and recall parameter values",
+    "pattrstorage": "Store and recall multiple pattr states",
+    "transport": "Control global timing and synchronization",
+    "jsui": "Create custom user interfaces with JavaScript",
+    "buffer~": "Store audio samples",
+    "cycle~": "Sinusoidal oscillator",
+    "groove~": "Variable-rate playback of buffer~ content",
+    "delay": "Delay messages by a specified time",
+    "random": "Generate random numbers",
+    "expr": "Evaluate mathematical expressions",
+    "scale": "Map input range to output range",
+    "route": "Route messages based on first element",
+    "gate": "Route input to one of several outputs",
+    "select": "Output a bang when input matches stored value",
+    "trigger": "Output multiple values in right-to-left order",
+    "print": "Print messages to the Max console",
+}
+
+# Store key of the catalog parsed from the listing files
+CATALOG_KEY = "object_index"
+
+# Marks a failed attempt worth retrying (timeouts, connection errors, 5xx, 429)
+_RETRY = object()
+
+# Parses fetched HTML into a documentation dictionary
+DocParser = Callable[[str], Awaitable[Dict[str, Any]]]
+
+
+class FetchResult(NamedTuple):
+    """A successful (200) or not-modified (304) response"""
+
+    status: int
+    text: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class CacheEntry(NamedTuple):
+    """A cached document with the HTTP validators it was fetched with"""
+
+    data: Dict[str, Any]
+    validators: Dict[str, str]
+    fresh: bool
+
 
 class Cycling74Connector:
     """
@@ -29,17 +89,56 @@ class Cycling74Connector:
     and comprehensive than newer versions.
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], cache_config: Optional[Dict[str, Any]] = None):
         self.base_url = config.get("base_url", "https://docs.cycling74.com/legacy/max8")
         self.cache_dir = Path(config.get("cache_dir", "./cache/cycling74"))
+        self.cache_path = Path(config.get("cache_path") or self.cache_dir / "docs.db")
+        # The size cap comes from the global cache section
+        self.cache_max_size = int((cache_config or {}).get("max_size_mb", 100) * 1024 * 1024)
         self.cache_duration = timedelta(seconds=config.get("cache_duration", 3600))
         self.max_concurrent = config.get("max_concurrent_requests", 5)
         self.timeout = config.get("request_timeout", 30)
         self.retry_attempts = config.get("retry_attempts", 3)
         self.retry_delay = config.get("retry_delay", 1.0)
-
-        # Create cache directory
+        self.retry_max_delay = config.get("retry_max_delay", 10.0)
+
+        # Per-host circuit breakers: fail fast to cached or summary data while a host is down
+        self.circuit_failure_threshold = config.get("circuit_failure_threshold", 5)
+        self.circuit_reset_timeout = config.get("circuit_reset_timeout", 30.0)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+        # Serve expired documents immediately and revalidate them in the background
+        self.stale_while_revalidate = config.get("stale_while_revalidate", True)
+
+        # Search: result count, and how long one query may wait for full documentation
+        self.search_limit = config.get("search_limit", 20)
+        self.search_deadline = config.get("search_deadline", 3.0)
+
+        # Offline mirror: a local doc store served without any HTTP when offline is set
+        self.mirror_path = Path(config.get("mirror_path", "./cache/cycling74/mirror.db"))
+        self.offline = config.get("offline", False)
+        self.mirror_concurrency = config.get("mirror_concurrency") or self.max_concurrent
+
+        # Fetch from another origin than the documentation links (e.g. a local stand-in server)
+        self.fetch_base_url = config.get("fetch_base_url")
+
+        # HTML parsing: "lxml" (XPath) or "soup" (BeautifulSoup) on a "thread" or "process" pool
+        self.html_parser = config.get("html_parser", "lxml")
+        if self.html_parser not in OBJECT_DOC_PARSERS:
+            logger.warning(f"HTML parser {self.html_parser!r} unavailable, using BeautifulSoup")
+            self.html_parser = "soup"
+        self.parse_executor_kind = config.get("parse_executor", "thread")
+        self.parse_workers = config.get("parse_workers") or os.cpu_count() or 1
+        self._parse_executor: Optional[Executor] = None
+
+        # Create cache directory and the size-capped document cache
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = DocStore(self.cache_path, max_size_bytes=self.cache_max_size)
+
+        # Parsed documents of hot keys, checked before the store
+        self.memory_cache: LRUCache[StoredDoc] = LRUCache(
+            config.get("memory_cache_size", 512), ttl=config.get("memory_cache_ttl", 300)
+        )
 
         # Session management
         self.session: Optional[aiohttp.ClientSession] = None
@@ -49,18 +148,72 @@ class Cycling74Connector:
         self.object_index: Dict[str, Dict[str, Any]] = {}
         self.index_loaded = False
 
+        # Listing files the object index is parsed from (defaults to the first known location)
+        listings_path = config.get("listings_path")
+        self.listings_path = Path(listings_path) if listings_path else None
+
+        # Lookup structures over the object index, rebuilt whenever it loads
+        self.completion_limit = config.get("completion_limit", 10)
+        self.index_generation = 0  # Bumped whenever the object index is rebuilt
+        self.doc_generation = 0  # Bumped whenever a cached doc is replaced by changed content
+        self._build_name_indexes()
+
+        # Late search fetches and background revalidations, referenced until done
+        self._background_tasks: Set[asyncio.Task] = set()
+
+        # One shared fetch-and-parse per key, however many callers want it
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.mirror: Optional[DocStore] = None
+
         logger.info(f"Cycling74 Connector initialized with base URL: {self.base_url}")
 
     async def initialize(self):
         """Initialize the connector and load object index"""
+        await asyncio.get_running_loop().run_in_executor(None, self._remove_legacy_cache)
+
+        if self.mirror_path.exists():
+            self.mirror = DocStore(self.mirror_path)
+            logger.info(f"Serving {len(self.mirror)} mirrored documents from {self.mirror_path}")
+        elif self.offline:
+            logger.warning(f"Offline mode without a documentation mirror at {self.mirror_path}")
+
         self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
         await self._load_object_index()
 
     async def close(self):
         """Close the connector and cleanup resources"""
+        for task in list(self._background_tasks):
+            task.cancel()
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
         if self.session:
             await self.session.close()
 
+        if self._parse_executor:
+            self._parse_executor.shutdown(wait=False)
+            self._parse_executor = None
+
+        if self.mirror:
+            self.mirror.close()
+        self.cache.close()
+
+    def _remove_legacy_cache(self):
+        """Delete the per-key JSON files and .meta sidecars the doc store replaced"""
+        removed = 0
+        for pattern in ("objects/*.json*", "tutorials/*.json*", "object_index.json*"):
+            for path in self.cache_dir.glob(pattern):
+                if path.is_file() and path.name.endswith((".json", ".json.meta")):
+                    path.unlink()
+                    removed += 1
+        for name in ("objects", "tutorials"):
+            directory = self.cache_dir / name
+            if directory.is_dir() and not any(directory.iterdir()):
+                directory.rmdir()
+        if removed:
+            logger.info(f"Removed {removed} files of the previous doc cache layout from {self.cache_dir}")
+
     async def get_object_doc(self, object_name: str) -> Optional[Dict[str, Any]]:
         """
         Get documentation for a specific Max object.
@@ -74,311 +227,569 @@ class Cycling74Connector:
         # Normalize object name
         object_name = object_name.lower().strip()
 
-        # Check cache first
-        cached = await self._get_cached(f"objects/{object_name}.json")
-        if cached:
-            return cached
-
-        # Construct URL for object reference
-        url = urljoin(self.base_url, f"/refpages/{quote(object_name)}")
-
         try:
-            html = await self._fetch_with_retry(url)
-            if not html:
-                return None
-
-            # Parse the documentation
-            doc = await self._parse_object_doc(html, object_name)
-
-            # Cache the result
-            if doc:
-                await self._cache_result(f"objects/{object_name}.json", doc)
-
-            return doc
+            parse = partial(self._parse_object_doc, object_name=object_name)
+            return await self._load_doc(f"objects/{object_name}", f"/refpages/{object_name}", parse)
 
         except Exception as e:
             logger.error(f"Error fetching documentation for {object_name}: {e}")
             return None
 
-    async def search(self, query: str) -> List[Dict[str, Any]]:
+    async def search(self, query: str, deadline: Optional[float] = None) -> List[Dict[str, Any]]:
         """
         Search the documentation for relevant content.
 
         Args:
             query: Search query
+            deadline: Seconds to wait for full object docs, capped by search_deadline
 
         Returns:
-            List of relevant documentation entries
+            List of relevant documentation entries; summaries of docs still
+            being fetched when the deadline passed have doc_pending set
         """
-        results = []
-        query_lower = query.lower()
+        return (await self.search_many([query], deadline))[0]
 
-        # If we have an object index, search it first
-        if self.object_index:
-            for obj_name, obj_info in self.object_index.items():
-                relevance = 0.0
-
-                # Check object name
-                if query_lower in obj_name.lower():
-                    relevance += 0.5
-
-                # Check description
-                desc = obj_info.get("description", "").lower()
-                if query_lower in desc:
-                    relevance += 0.3
-
-                # Check tags/categories
-                for tag in obj_info.get("tags", []):
-                    if query_lower in tag.lower():
-                        relevance += 0.2
-
-                if relevance > 0:
-                    # Fetch full documentation if highly relevant
-                    if relevance > 0.5:
-                        full_doc = await self.get_object_doc(obj_name)
-                        if full_doc:
-                            results.append(full_doc)
-                    else:
-                        # Add basic info
-                        results.append(
-                            {
-                                "object_name": obj_name,
-                                "description": obj_info.get("description", ""),
-                                "category": obj_info.get("category", ""),
-                                "relevance": relevance,
-                            }
-                        )
+    async def search_many(self, queries: Sequence[str], deadline: Optional[float] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several queries, fetching each needed document once.
 
-        # Sort by relevance
-        results.sort(key=lambda x: x.get("relevance", 0), reverse=True)
+        Returns:
+            One result list per query, as search() would return it
+        """
+        tops = [self._rank_index(query) for query in queries]
+
+        # Fetch full reference pages for the highly relevant objects of every query concurrently
+        wanted = dict.fromkeys(
+            obj_name
+            for top in tops
+            for relevance, obj_name in top
+            if relevance > 0.5 and not self.object_index[obj_name].get("category", "").startswith("documentation_")
+        )
+        full_docs, late = await self._fetch_docs(list(wanted), deadline)
+
+        batch_results = []
+        for top in tops:
+            results = []
+            for relevance, obj_name in top:
+                # Only this query's own highly relevant hits, as if it had been searched alone
+                full_doc = full_docs.get(obj_name) if relevance > 0.5 else None
+                if full_doc:
+                    results.append({**full_doc, "relevance": relevance})
+                else:
+                    # Add basic info
+                    obj_info = self.object_index[obj_name]
+                    summary = {
+                        "object_name": obj_name,
+                        "description": obj_info.get("description", ""),
+                        "category": obj_info.get("category", ""),
+                        "relevance": relevance,
+                    }
+                    if relevance > 0.5 and obj_name in late:
+                        summary["doc_pending"] = True
+                    results.append(summary)
+            batch_results.append(results)
 
-        return results[:20]  # Top 20 results
+        return batch_results
 
-    async def get_tutorial(self, tutorial_name: str) -> Optional[Dict[str, Any]]:
-        """Get a specific tutorial by name"""
-        # Check cache
-        cached = await self._get_cached(f"tutorials/{tutorial_name}.json")
-        if cached:
-            return cached
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the in-memory layer and occupancy of the document store"""
+        return {
+            "memory": self.memory_cache.stats(),
+            "store": {
+                "entries": len(self.cache),
+                "size_bytes": self.cache.size_bytes(),
+                "max_size_bytes": self.cache_max_size,
+                "evictions": self.cache.evictions,
+            },
+        }
 
-        # Construct URL
-        url = urljoin(self.base_url, f"/tutorials/{quote(tutorial_name)}")
+    def complete(self, prefix: str, k: int = 10) -> List[str]:
+        """
+        Complete a partial object name, e.g. "gro" -> groove~, grab.
 
-        try:
-            html = await self._fetch_with_retry(url)
-            if not html:
-                return None
+        Args:
+            prefix: What has been typed so far
+            k: Maximum number of completions
 
-            # Parse tutorial
-            tutorial = await self._parse_tutorial(html, tutorial_name)
+        Returns:
+            Object names starting with prefix, best first, followed by
+            close matches when fewer than k names start with it
+        """
+        return self._completions.complete(prefix.strip(), k)
 
-            # Cache result
-            if tutorial:
-                await self._cache_result(f"tutorials/{tutorial_name}.json", tutorial)
+    def get_object_names(self) -> List[str]:
+        """Names of all Max objects in the index (tutorials and guides excluded)"""
+        return [
+            name
+            for name, info in self.object_index.items()
+            if not info.get("category", "").startswith("documentation_")
+        ]
 
-            return tutorial
+    async def get_tutorial(self, tutorial_name: str) -> Optional[Dict[str, Any]]:
+        """Get a specific tutorial by name"""
+        try:
+            parse = partial(self._parse_tutorial, tutorial_name=tutorial_name)
+            return await self._load_doc(f"tutorials/{tutorial_name}", f"/tutorials/{tutorial_name}", parse)
 
         except Exception as e:
             logger.error(f"Error fetching tutorial {tutorial_name}: {e}")
             return None
 
+    async def build_mirror(self) -> Dict[str, int]:
+        """
+        Fetch and parse every object and tutorial in the object index into the mirror.
+
+        Pages are fetched by a fixed pool of workers, so at most
+        mirror_concurrency requests are in flight.
+
+        Returns:
+            Counts of mirrored and failed pages
+        """
+        if self.offline:
+            raise RuntimeError("Cannot build the documentation mirror in offline mode")
+
+        if not self.mirror:
+            self.mirror = DocStore(self.mirror_path)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for job in self._mirror_jobs():
+            queue.put_nowait(job)
+        total = queue.qsize()
+        logger.info(f"Mirroring {total} documentation pages to {self.mirror_path}")
+
+        parsed: List[Tuple[str, Dict[str, Any]]] = []
+        stats = {"mirrored": 0, "failed": 0}
+
+        async def worker():
+            while True:
+                try:
+                    key, kind, name, hrefs = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                doc = await self._fetch_page(kind, name, hrefs)
+                if doc:
+                    parsed.append((key, doc))
+                    stats["mirrored"] += 1
+                else:
+                    stats["failed"] += 1
+
+                # Write in batches; one transaction per page would dominate the run
+                if len(parsed) >= 100:
+                    self.mirror.put_many(parsed)
+                    parsed.clear()
+                    logger.info(f"Mirrored {stats['mirrored'] + stats['failed']}/{total} pages")
+
+        await asyncio.gather(*(worker() for _ in range(max(1, self.mirror_concurrency))))
+        self.mirror.put_many(parsed)
+        self.memory_cache.clear()
+        self.doc_generation += 1
+
+        logger.info(f"Documentation mirror complete: {stats['mirrored']} pages, {stats['failed']} failed")
+        return stats
+
     # Private helper methods
 
+    async def _fetch_docs(
+        self, object_names: List[str], deadline: Optional[float] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], Set[str]]:
+        """
+        Fetch object documentation concurrently within the search deadline.
+
+        Requests still share the connector semaphore. Fetches that miss the
+        deadline are not cancelled; they finish in the background and cache
+        their result for the next query.
+
+        Returns:
+            The fetched docs, and the names whose fetch missed the deadline
+        """
+        if not object_names:
+            return {}, set()
+
+        limits = [limit for limit in (deadline, self.search_deadline) if limit is not None]
+        timeout = max(min(limits), 0.0) if limits else None
+        tasks = {name: asyncio.ensure_future(self.get_object_doc(name)) for name in object_names}
+        done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+
+        if pending:
+            logger.debug(f"{len(pending)} documentation fetches missed the {timeout}s search deadline")
+            for task in pending:
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+        docs = {name: task.result() for name, task in tasks.items() if task in done and task.result()}
+        return docs, {name for name, task in tasks.items() if task in pending}
+
+    async def _load_doc(self, key: str, path: str, parse: DocParser) -> Optional[Dict[str, Any]]:
+        """
+        Serve a document from the cache, revalidating or fetching it as needed.
+
+        Expired entries are returned as-is and refreshed in the background
+        when stale_while_revalidate is enabled; otherwise the caller waits
+        for a conditional request. The URL is only built from path when a
+        request is actually made.
+        """
+        entry = await self._get_cache_entry(key)
+        if entry and entry.fresh:
+            return entry.data
+
+        if entry is None and self.offline:
+            # Nothing cached, and nothing may be fetched
+            return None
+
+        if entry and self.stale_while_revalidate:
+            self._schedule_revalidation(key, path, parse, entry)
+            return entry.data
+
+        # Shielded so a cancelled caller does not cancel the fetch other callers share
+        return await asyncio.shield(self._start_refresh(key, path, parse, entry))
+
+    def _start_refresh(self, key: str, path: str, parse: DocParser, entry: Optional[CacheEntry]) -> asyncio.Future:
+        """Join the in-flight refresh of key, or start one"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._refresh(key, path, parse, entry))
+            self._inflight[key] = future
+            future.add_done_callback(partial(self._refresh_done, key))
+        return future
+
+    def _refresh_done(self, key: str, future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Waiting callers see the error themselves; retrieve it so abandoned refreshes stay quiet
+        if not future.cancelled():
+            future.exception()
+
+    async def _refresh(
+        self, key: str, path: str, parse: DocParser, entry: Optional[CacheEntry]
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a document, conditionally when a cached copy exists"""
+        url = urljoin(self.base_url, quote(path))
+        headers = {}
+        if entry:
+            if "etag" in entry.validators:
+                headers["If-None-Match"] = entry.validators["etag"]
+            if "last_modified" in entry.validators:
+                headers["If-Modified-Since"] = entry.validators["last_modified"]
+
+        result = await self._fetch_response(url, headers)
+        if result is None:
+            # Keep serving what we have when the refresh fails
+            return entry.data if entry else None
+
+        if result.status == 304 and entry:
+            # Unchanged upstream: just restart the freshness clock
+            await asyncio.get_running_loop().run_in_executor(None, self.cache.touch, key)
+            self.memory_cache.invalidate(key)
+            return entry.data
+
+        if result.text is None:
+            return entry.data if entry else None
+
+        doc = await parse(result.text)
+        if doc:
+            validators = {"etag": result.etag, "last_modified": result.last_modified}
+            await self._cache_result(key, doc, {name: value for name, value in validators.items() if value})
+            if entry:
+                # The page changed upstream: results built on the old copy are out of date
+                self.doc_generation += 1
+        return doc
+
+    def _schedule_revalidation(self, key: str, path: str, parse: DocParser, entry: CacheEntry):
+        """Refresh an expired entry in the background, once per key at a time"""
+        if key in self._inflight:
+            return
+
+        def report(future: asyncio.Future):
+            if not future.cancelled() and future.exception():
+                logger.error(f"Error revalidating {key}: {future.exception()}")
+
+        task = self._start_refresh(key, path, parse, entry)
+        task.add_done_callback(report)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def _load_object_index(self):
         """Load the object index for quick searching"""
         try:
-            # Try to load from cache first
-            cached = await self._get_cached("object_index.json")
-            if cached:
-                self.object_index = cached
-                self.index_loaded = True
-                logger.info(f"Loaded object index with {len(self.object_index)} objects")
-                return
-
-            # Try to load from minutiae repository's comprehensive listing
-            minutiae_listing = await self._load_from_minutiae_listing()
-            if minutiae_listing:
-                self.object_index = minutiae_listing
+            # The catalog parsed from the listing files, reused while they are unchanged
+            catalog = await self._load_listing_catalog()
+            if catalog:
+                self.object_index = catalog
             else:
-                # Fall back to default objects
-                self.object_index = self._get_default_object_index()
+                # Without listing files keep the last catalog built from them, or fall back to default objects
+                self.object_index = self.cache.get(CATALOG_KEY) or self._get_default_object_index()
 
-            # Cache the index
-            await self._cache_result("object_index.json", self.object_index)
+            self._build_name_indexes()
             self.index_loaded = True
             logger.info(f"Loaded object index with {len(self.object_index)} objects")
 
         except Exception as e:
             logger.error(f"Error loading object index: {e}")
             self.object_index = {}
+            self._build_name_indexes()
+
+    def _rank_index(self, query: str) -> List[Tuple[float, str]]:
+        """Top (relevance, name) matches of the object index; only these are ever fetched"""
+        query_lower = query.lower()
+
+        # Score only the entries the indexes match
+        scores: Dict[int, float] = {}
+
+        # Check object name
+        for position in self._name_ngrams.find(query_lower):
+            scores[position] = 0.5
+
+        # Check description
+        for position in self._description_ngrams.find(query_lower):
+            scores[position] = scores.get(position, 0.0) + 0.3
+
+        # Check tags/categories
+        for tag, positions in self._tag_postings.items():
+            if query_lower in tag:
+                for position in positions:
+                    scores[position] = scores.get(position, 0.0) + 0.2
+
+        ranked = [(scores[position], self._index_names[position]) for position in sorted(scores)]
+
+        # Keyed so ties keep index order, as the previous stable sort did
+        return heapq.nlargest(self.search_limit, ranked, key=lambda item: item[0])
+
+    def _build_name_indexes(self):
+        """Index object names, descriptions and tags for search and completion"""
+        self.index_generation += 1
+        self._index_names = list(self.object_index)
+        self._name_ngrams = NgramIndex(self._index_names)
+        self._description_ngrams = NgramIndex([info.get("description", "") for info in self.object_index.values()])
+
+        # Tag -> positions, once per occurrence so repeated tags keep counting
+        self._tag_postings: Dict[str, List[int]] = {}
+        for position, info in enumerate(self.object_index.values()):
+            for tag in info.get("tags", []):
+                self._tag_postings.setdefault(tag.lower(), []).append(position)
+
+        # Objects listed in several places, or described by hand, complete first
+        names = self.get_object_names()
+        weights = [len(self.object_index[name].get("hrefs", [])) + (name in OBJECT_DESCRIPTIONS) for name in names]
+        self._completions = CompletionIndex(names, weights, top_k=self.completion_limit)
+
+    def _mirror_jobs(self) -> List[Tuple[str, str, str, List[str]]]:
+        """(store key, page kind, name, candidate URLs) for every page in the object index"""
+        jobs = []
+        seen = set()
+        for name, info in self.object_index.items():
+            hrefs = info.get("hrefs", [])
+            if not hrefs:
+                continue
+
+            if info.get("category", "").startswith("documentation_"):
+                # Tutorials and guides are addressed by the last segment of their URL
+                kind = "tutorials"
+                slug = urlsplit(hrefs[0]).path.rstrip("/").rsplit("/", 1)[-1]
+                key, page_name = f"tutorials/{slug}", slug
+            else:
+                kind = "objects"
+                page_name = name.lower().strip()
+                key = f"objects/{page_name}"
+
+            if key not in seen:
+                seen.add(key)
+                jobs.append((key, kind, page_name, hrefs))
+        return jobs
+
+    async def _fetch_page(self, kind: str, name: str, hrefs: List[str]) -> Optional[Dict[str, Any]]:
+        """Fetch and parse one documentation page, trying each of its links in turn"""
+        for href in hrefs:
+            try:
+                html = await self._fetch_with_retry(href)
+                if not html:
+                    continue
+
+                if kind == "objects":
+                    doc = await self._parse_object_doc(html, name)
+                else:
+                    doc = await self._parse_tutorial(html, name)
+                doc["url"] = href
+                return doc
+
+            except Exception as e:
+                logger.error(f"Error mirroring {href}: {e}")
+        return None
+
+    def _resolve_url(self, url: str) -> str:
+        """Point a documentation URL at fetch_base_url, when one is configured"""
+        if not self.fetch_base_url:
+            return url
+
+        origin = urlsplit(self.fetch_base_url)
+        parts = urlsplit(url)
+        return urlunsplit((origin.scheme, origin.netloc, parts.path, parts.query, parts.fragment))
 
     async def _fetch_with_retry(self, url: str) -> Optional[str]:
         """Fetch URL with retry logic"""
-        async with self.semaphore:
-            for attempt in range(self.retry_attempts):
-                try:
-                    if not self.session:
-                        logger.error("Session not initialized")
-                        return None
+        result = await self._fetch_response(url)
+        return result.text if result else None
+
+    async def _fetch_response(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[FetchResult]:
+        """Fetch URL with retry logic, keeping the response validators"""
+        if self.offline:
+            logger.debug(f"Offline, not fetching {url}")
+            return None
 
-                    async with self.session.get(url) as response:
-                        if response.status == 200:
-                            return await response.text()
-                        elif response.status == 404:
-                            logger.debug(f"404 Not Found: {url}")
-                            return None
-                        else:
-                            logger.warning(f"HTTP {response.status} for {url}")
+        url = self._resolve_url(url)
+        host = urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(self.circuit_failure_threshold, self.circuit_reset_timeout)
 
-                except asyncio.TimeoutError:
-                    logger.warning(f"Timeout fetching {url} (attempt {attempt + 1})")
-                except Exception as e:
-                    logger.error(f"Error fetching {url}: {e}")
+        for attempt in range(self.retry_attempts):
+            if not breaker.allow():
+                logger.debug(f"Circuit open for {host}, not fetching {url}")
+                return None
 
-                if attempt < self.retry_attempts - 1:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+            outcome = await self._fetch_once(url, headers, attempt)
+            if outcome is not _RETRY:
+                breaker.record_success()
+                return outcome
+            breaker.record_failure()
 
-            return None
+            if attempt < self.retry_attempts - 1:
+                # Exponential backoff with full jitter, slept without holding a request slot
+                await asyncio.sleep(random.uniform(0, min(self.retry_max_delay, self.retry_delay * 2**attempt)))
 
-    async def _load_from_minutiae_listing(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        return None
+
+    async def _fetch_once(self, url: str, headers: Optional[Dict[str, str]], attempt: int) -> Any:
         """
-        Load comprehensive object index from the consolidated documentation listing.
+        Make one request while holding a semaphore slot.
 
-        This is the single source of truth for all Max/MSP documentation links!
+        Returns:
+            FetchResult, None when the page is definitively unavailable,
+            or _RETRY for a transient failure
+        """
+        async with self.semaphore:
+            try:
+                if not self.session:
+                    logger.error("Session not initialized")
+                    return None
+
+                async with self.session.get(url, headers=headers) as response:
+                    if response.status in (200, 304):
+                        return FetchResult(
+                            response.status,
+                            await response.text() if response.status == 200 else None,
+                            response.headers.get("ETag"),
+                            response.headers.get("Last-Modified"),
+                        )
+                    elif response.status == 404:
+                        logger.debug(f"404 Not Found: {url}")
+                        return None
+                    elif response.status == 429 or response.status >= 500:
+                        logger.warning(f"HTTP {response.status} for {url} (attempt {attempt + 1})")
+                        return _RETRY
+                    else:
+                        logger.warning(f"HTTP {response.status} for {url}")
+                        return None
+
+            except asyncio.TimeoutError:
+                logger.warning(f"Timeout fetching {url} (attempt {attempt + 1})")
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {e}")
+            return _RETRY
+
+    def get_host_health(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit breaker state per upstream host"""
+        return {host: breaker.stats() for host, breaker in self._breakers.items()}
+
+    async def _load_listing_catalog(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Load the catalog of every listing in docs/knowledge_sources.
+
+        The catalog is cached under the content hash of the listing files,
+        so they are only parsed again when one of them changes.
         """
         try:
-            # Single source of truth - the consolidated documentation listing
-            listing_paths = [
-                "../docs/knowledge_sources/Max MSP Documentation Listings.md",
-                "../intelligent-max-mcp/docs/knowledge_sources/Max MSP Documentation Listings.md",
-                "./docs/knowledge_sources/Max MSP Documentation Listings.md",
-            ]
-
-            # Load the consolidated listing
-            content = None
-            loaded_path = None
-            for path in listing_paths:
+            listings_dir = self._find_listings_dir()
+            if listings_dir is None:
+                logger.warning("❌ Could not find the docs/knowledge_sources listings")
+                return None
+
+            listings = []
+            for name in LISTING_FILES:
                 try:
-                    async with aio_open(path, "r", encoding="utf-8") as f:
-                        content = await f.read()
-                        loaded_path = path
-                        logger.info(f"✅ Loaded consolidated Max/MSP documentation from: {path}")
-                        break
+                    async with aio_open(listings_dir / name, "rb") as f:
+                        listings.append((name, await f.read()))
                 except FileNotFoundError:
                     continue
-
-            if not content:
-                logger.warning("❌ Could not find consolidated Max MSP Documentation Listings.md")
+            if not listings:
+                logger.warning(f"❌ No listing files in {listings_dir}")
                 return None
 
-            # Parse the consolidated documentation
-            object_index = self._parse_object_listing_content(content)
+            digest = sources_digest(listings)
+            cached = self.cache.get_entry(CATALOG_KEY)
+            if cached and cached.meta.get("sources") == digest:
+                logger.info(f"🎵 Listings unchanged, using the cached catalog of {len(cached.data)} entries")
+                return cached.data
 
-            logger.info(f"🎵 Parsed {len(object_index)} objects from consolidated documentation")
-            logger.info(f"📚 Source: {loaded_path}")
-            return object_index
+            catalog = self._build_catalog([(name, raw.decode("utf-8")) for name, raw in listings])
+            await self._cache_result(CATALOG_KEY, catalog, {"sources": digest})
+
+            logger.info(f"🎵 Parsed {len(catalog)} entries from {len(listings)} listings in {listings_dir}")
+            return catalog
 
         except Exception as e:
-            logger.error(f"Error loading from consolidated documentation listing: {e}")
+            logger.error(f"Error loading the documentation listings: {e}")
             return None
 
-    def _parse_object_listing_content(self, content: str) -> Dict[str, Dict[str, Any]]:
-        """
-        Parse consolidated documentation content and return comprehensive object index.
+    def _find_listings_dir(self) -> Optional[Path]:
+        """The configured listings directory, or the first known location that exists"""
+        if self.listings_path:
+            return self.listings_path if self.listings_path.is_dir() else None
 
-        Extracts objects, tutorials, guides, and their URLs for future enhancement.
-        """
-        object_index = {}
-        current_category = "general"
+        candidates = [
+            Path("../docs/knowledge_sources"),
+            Path("../intelligent-max-mcp/docs/knowledge_sources"),
+            Path("./docs/knowledge_sources"),
+            Path(__file__).resolve().parents[2] / "docs" / "knowledge_sources",
+        ]
+        return next((path for path in candidates if path.is_dir()), None)
 
-        lines = content.split("\n")
-        for line in lines:
-            line = line.strip()
+    def _build_catalog(self, listings: List[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse (file name, content) listings into the object index.
 
-            # Detect category headers (## Control, ## Audio, etc.)
-            if line.startswith("## ") and not line.startswith("## A Functional"):
-                current_category = line[3:].lower().replace(" ", "_").replace("-", "_")
-                continue
+        Objects get descriptions and tags from their categories; tutorials
+        and guides keep their collection, page and chapter.
+        """
+        catalog = build_catalog(listings)
+
+        for name, entry in catalog.items():
+            if entry["kind"] == "object":
+                category = entry["categories"][0]
+                tags = self._generate_tags(name, category)
+                tags += [tag for tag in entry["categories"][1:] + [entry["domain"]] if tag not in tags]
+                entry.update(
+                    description=self._generate_description(name, category),
+                    category=category,
+                    tags=tags,
+                    source="cycling74_listing",
+                )
+            else:
+                doc_type = entry["kind"]
+                entry.update(
+                    description=f"{entry['collection'][:-1]}: {name}",
+                    category=f"documentation_{doc_type}",
+                    tags=[doc_type, "documentation", entry["domain"]],
+                    source="cycling74_docs",
+                )
 
-            # Extract objects from lines with Max object links
-            if "[" in line and "](https://docs.cycling74.com/max8/refpages/" in line:
-                # Pattern to capture both object name and full URL
-                pattern = r"\[([^\]]+)\]\((https://docs\.cycling74\.com/max8/refpages/[^)]+)\)"
-                matches = re.findall(pattern, line)
-
-                for obj_name, obj_url in matches:
-                    # Clean up object name
-                    obj_name = obj_name.strip()
-
-                    # Skip some special cases
-                    if obj_name in ["Reference page", "Technical Notes"]:
-                        continue
-
-                    # Add to index (don't overwrite existing entries)
-                    if obj_name not in object_index:
-                        object_index[obj_name] = {
-                            "description": self._generate_description(obj_name, current_category),
-                            "category": current_category,
-                            "tags": self._generate_tags(obj_name, current_category),
-                            "hrefs": [obj_url],  # Store the official documentation URL
-                            "source": "cycling74_listing",
-                        }
-                    else:
-                        # Add additional URL if we found the same object in multiple places
-                        if obj_url not in object_index[obj_name].get("hrefs", []):
-                            object_index[obj_name]["hrefs"].append(obj_url)
-
-            # Also extract other documentation links (tutorials, guides, etc.)
-            elif "[" in line and "](https://docs.cycling74.com/max8/" in line:
-                # Pattern for non-object documentation
-                pattern = r"\[([^\]]+)\]\((https://docs\.cycling74\.com/max8/[^)]+)\)"
-                matches = re.findall(pattern, line)
-
-                for doc_name, doc_url in matches:
-                    doc_name = doc_name.strip()
-
-                    # Create entries for tutorials, guides, etc. with special handling
-                    if doc_name not in object_index:
-                        # Determine if it's a tutorial, guide, or other documentation
-                        doc_type = "tutorial" if "tutorial" in doc_url.lower() else "guide"
-
-                        object_index[doc_name] = {
-                            "description": f"Max/MSP {doc_type}: {doc_name}",
-                            "category": f"documentation_{doc_type}",
-                            "tags": [doc_type, "documentation"],
-                            "hrefs": [doc_url],
-                            "source": "cycling74_docs",
-                        }
-
-        return object_index
+        return catalog
 
     def _generate_description(self, obj_name: str, category: str) -> str:
         """Generate a basic description for an object based on name and category"""
         # Special cases for well-known objects
-        descriptions = {
-            "metro": "Output bang messages at a regular interval",
-            "counter": "Count and output numbers",
-            "pattrhub": "Route pattr messages between patchers",
-            "pattr": "Store and recall parameter values",
-            "pattrstorage": "Store and recall multiple pattr states",
-            "transport": "Control global timing and synchronization",
-            "jsui": "Create custom user interfaces with JavaScript",
-            "buffer~": "Store audio samples",
-            "cycle~": "Sinusoidal oscillator",
-            "groove~": "Variable-rate playback of buffer~ content",
-            "delay": "Delay messages by a specified time",
-            "random": "Generate random numbers",
-            "expr": "Evaluate mathematical expressions",
-            "scale": "Map input range to output range",
-            "route": "Route messages based on first element",
-            "gate": "Route input to one of several outputs",
-            "select": "Output a bang when input matches stored value",
-            "trigger": "Output multiple values in right-to-left order",
-            "print": "Print messages to the Max console",
-        }
-
-        if obj_name in descriptions:
-            return descriptions[obj_name]
+        if obj_name in OBJECT_DESCRIPTIONS:
+            return OBJECT_DESCRIPTIONS[obj_name]
 
         # Generate generic description based on category
         category_descriptions = {
@@ -422,137 +833,68 @@ class Cycling74Connector:
         return tags
 
     async def _parse_object_doc(self, html: str, object_name: str) -> Dict[str, Any]:
-        """Parse object documentation from HTML"""
-        soup = BeautifulSoup(html, "lxml")
-
-        doc = {
-            "object_name": object_name,
-            "url": urljoin(self.base_url, f"/refpages/{object_name}"),
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        # Extract description
-        desc_elem = soup.find("div", class_="description")
-        if desc_elem:
-            doc["description"] = desc_elem.get_text(strip=True)
-
-        # Extract inlets
-        inlets = []
-        inlet_section = soup.find("div", class_="inlets")
-        if inlet_section:
-            for inlet in inlet_section.find_all("div", class_="inlet"):
-                inlets.append(
-                    {
-                        "index": len(inlets),
-                        "type": inlet.get("data-type", "signal"),
-                        "description": inlet.get_text(strip=True),
-                    }
-                )
-        doc["inlets"] = inlets
-
-        # Extract outlets
-        outlets = []
-        outlet_section = soup.find("div", class_="outlets")
-        if outlet_section:
-            for outlet in outlet_section.find_all("div", class_="outlet"):
-                outlets.append(
-                    {
-                        "index": len(outlets),
-                        "type": outlet.get("data-type", "signal"),
-                        "description": outlet.get_text(strip=True),
-                    }
-                )
-        doc["outlets"] = outlets
-
-        # Extract attributes
-        attributes = {}
-        attr_section = soup.find("div", class_="attributes")
-        if attr_section:
-            for attr in attr_section.find_all("div", class_="attribute"):
-                name = attr.find("span", class_="name")
-                if name:
-                    attributes[name.get_text(strip=True)] = {
-                        "type": attr.get("data-type", "float"),
-                        "description": attr.get_text(strip=True),
-                    }
-        doc["attributes"] = attributes
-
-        # Extract examples
-        examples = []
-        example_section = soup.find("div", class_="examples")
-        if example_section:
-            for example in example_section.find_all("div", class_="example"):
-                examples.append(
-                    {
-                        "description": example.get_text(strip=True),
-                        "code": (example.find("code").get_text() if example.find("code") else ""),
-                    }
-                )
-        doc["examples"] = examples
-
-        # Extract related objects
-        related = []
-        related_section = soup.find("div", class_="seealso")
-        if related_section:
-            for link in related_section.find_all("a"):
-                related.append(link.get_text(strip=True))
-        doc["related_objects"] = related
-
-        return doc
+        """Parse object documentation from HTML off the event loop"""
+        url = urljoin(self.base_url, f"/refpages/{object_name}")
+        parser = OBJECT_DOC_PARSERS[self.html_parser]
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_parse_executor(), parser, html, object_name, url
+        )
 
     async def _parse_tutorial(self, html: str, tutorial_name: str) -> Dict[str, Any]:
-        """Parse tutorial content from HTML"""
-        soup = BeautifulSoup(html, "lxml")
-
-        tutorial = {
-            "name": tutorial_name,
-            "url": urljoin(self.base_url, f"/tutorials/{tutorial_name}"),
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        # Extract title
-        title = soup.find("h1")
-        if title:
-            tutorial["title"] = title.get_text(strip=True)
-
-        # Extract content sections
-        sections = []
-        for section in soup.find_all(["h2", "h3", "p", "code"]):
-            sections.append({"type": section.name, "content": section.get_text(strip=True)})
-        tutorial["sections"] = sections
-
-        return tutorial
+        """Parse tutorial content from HTML off the event loop"""
+        url = urljoin(self.base_url, f"/tutorials/{tutorial_name}")
+        parser = TUTORIAL_PARSERS[self.html_parser]
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_parse_executor(), parser, html, tutorial_name, url
+        )
+
+    def _get_parse_executor(self) -> Executor:
+        """Worker pool for HTML parsing, created on first use"""
+        if self._parse_executor is None:
+            if self.parse_executor_kind == "process":
+                try:
+                    self._parse_executor = ProcessPoolExecutor(max_workers=self.parse_workers)
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"Process pool unavailable ({e}), parsing on threads")
+            if self._parse_executor is None:
+                self._parse_executor = ThreadPoolExecutor(
+                    max_workers=self.parse_workers, thread_name_prefix="cycling74-parse"
+                )
+        return self._parse_executor
 
     async def _get_cached(self, key: str) -> Optional[Dict[str, Any]]:
         """Get cached result if it exists and is fresh"""
-        cache_file = self.cache_dir / key
-
-        if not cache_file.exists():
-            return None
+        entry = await self._get_cache_entry(key)
+        return entry.data if entry and entry.fresh else None
 
+    async def _get_cache_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get a cached result with its validators, fresh or not: memory, then mirror, then store"""
         try:
-            # Check if cache is fresh
-            mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
-            if datetime.now() - mtime > self.cache_duration:
-                return None
-
-            # Read cached data
-            async with aio_open(cache_file, "r") as f:
-                content = await f.read()
-                return json.loads(content)
+            stored = self.memory_cache.get(key)
+            if stored is None:
+                stored = self.mirror.get_entry(key) if self.mirror else None
+                if stored is not None:
+                    # Mirrored documentation needs no network at all and never expires
+                    stored = stored._replace(stored_at=math.inf)
+                else:
+                    stored = self.cache.get_entry(key)
+                if stored is None:
+                    return None
+                self.memory_cache.put(key, stored)
+
+            fresh = time.time() - stored.stored_at <= self.cache_duration.total_seconds()
+            return CacheEntry(stored.data, stored.meta, fresh)
 
         except Exception as e:
             logger.error(f"Error reading cache for {key}: {e}")
             return None
 
-    async def _cache_result(self, key: str, data: Dict[str, Any]):
-        """Cache a result"""
-        cache_file = self.cache_dir / key
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
-
+    async def _cache_result(self, key: str, data: Dict[str, Any], validators: Optional[Dict[str, str]] = None):
+        """Cache a result, with the ETag/Last-Modified validators it was served with"""
         try:
-            async with aio_open(cache_file, "w") as f:
-                await f.write(json.dumps(data, indent=2))
+            # Compression and eviction stay off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self.cache.put, key, data, validators)
+            self.memory_cache.invalidate(key)
         except Exception as e:
             logger.error(f"Error caching result for {key}: {e}")
 
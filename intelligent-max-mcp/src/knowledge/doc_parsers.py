@@ -0,0 +1,297 @@
+"""
+Documentation Page Parsers
+
+Pure functions turning Cycling '74 reference and tutorial HTML into
+documentation dictionaries. They hold no connector state so they can run
+on a thread or process pool instead of the event loop.
+
+Two implementations produce the same structure: a BeautifulSoup one and
+a faster one walking lxml's native tree with precompiled XPath.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # lxml is optional for the soup parsers
+    etree = None
+
+# (html, name, url) -> documentation dictionary
+PageParser = Callable[[str, str, str], Dict[str, Any]]
+
+# Elements whose strings BeautifulSoup leaves out of get_text()
+SKIPPED_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching one class among several, like BeautifulSoup's class_"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if etree is not None:
+    XPATH_DESCRIPTION = etree.XPath(f"(//div[{_has_class('description')}])[1]")
+    XPATH_INLET_SECTION = etree.XPath(f"(//div[{_has_class('inlets')}])[1]")
+    XPATH_INLETS = etree.XPath(f".//div[{_has_class('inlet')}]")
+    XPATH_OUTLET_SECTION = etree.XPath(f"(//div[{_has_class('outlets')}])[1]")
+    XPATH_OUTLETS = etree.XPath(f".//div[{_has_class('outlet')}]")
+    XPATH_ATTRIBUTE_SECTION = etree.XPath(f"(//div[{_has_class('attributes')}])[1]")
+    XPATH_ATTRIBUTES = etree.XPath(f".//div[{_has_class('attribute')}]")
+    XPATH_ATTRIBUTE_NAME = etree.XPath(f"(.//span[{_has_class('name')}])[1]")
+    XPATH_EXAMPLE_SECTION = etree.XPath(f"(//div[{_has_class('examples')}])[1]")
+    XPATH_EXAMPLES = etree.XPath(f".//div[{_has_class('example')}]")
+    XPATH_FIRST_CODE = etree.XPath("(.//code)[1]")
+    XPATH_SEEALSO_SECTION = etree.XPath(f"(//div[{_has_class('seealso')}])[1]")
+    XPATH_LINKS = etree.XPath(".//a")
+    XPATH_TITLE = etree.XPath("(//h1)[1]")
+    XPATH_SECTIONS = etree.XPath("//h2 | //h3 | //p | //code")
+
+
+# lxml implementation
+
+
+def parse_object_doc_lxml(html: str, object_name: str, url: str) -> Dict[str, Any]:
+    """Parse object documentation from HTML with lxml and precompiled XPath"""
+    root = _html_root(html)
+
+    doc: Dict[str, Any] = {
+        "object_name": object_name,
+        "url": url,
+        "timestamp": datetime.now().isoformat(),
+    }
+    if root is None:
+        doc.update({"inlets": [], "outlets": [], "attributes": {}, "examples": [], "related_objects": []})
+        return doc
+
+    # Extract description
+    for desc_elem in XPATH_DESCRIPTION(root):
+        doc["description"] = _text(desc_elem, strip=True)
+
+    # Extract inlets and outlets
+    doc["inlets"] = _ports(root, XPATH_INLET_SECTION, XPATH_INLETS)
+    doc["outlets"] = _ports(root, XPATH_OUTLET_SECTION, XPATH_OUTLETS)
+
+    # Extract attributes
+    attributes = {}
+    for attr_section in XPATH_ATTRIBUTE_SECTION(root):
+        for attr in XPATH_ATTRIBUTES(attr_section):
+            for name in XPATH_ATTRIBUTE_NAME(attr):
+                attributes[_text(name, strip=True)] = {
+                    "type": attr.get("data-type", "float"),
+                    "description": _text(attr, strip=True),
+                }
+    doc["attributes"] = attributes
+
+    # Extract examples
+    examples = []
+    for example_section in XPATH_EXAMPLE_SECTION(root):
+        for example in XPATH_EXAMPLES(example_section):
+            code = XPATH_FIRST_CODE(example)
+            examples.append(
+                {
+                    "description": _text(example, strip=True),
+                    "code": _text(code[0], strip=False) if code else "",
+                }
+            )
+    doc["examples"] = examples
+
+    # Extract related objects
+    related = []
+    for related_section in XPATH_SEEALSO_SECTION(root):
+        related = [_text(link, strip=True) for link in XPATH_LINKS(related_section)]
+    doc["related_objects"] = related
+
+    return doc
+
+
+def parse_tutorial_lxml(html: str, tutorial_name: str, url: str) -> Dict[str, Any]:
+    """Parse tutorial content from HTML with lxml and precompiled XPath"""
+    root = _html_root(html)
+
+    tutorial: Dict[str, Any] = {
+        "name": tutorial_name,
+        "url": url,
+        "timestamp": datetime.now().isoformat(),
+    }
+    if root is None:
+        tutorial["sections"] = []
+        return tutorial
+
+    # Extract title
+    for title in XPATH_TITLE(root):
+        tutorial["title"] = _text(title, strip=True)
+
+    # Extract content sections, in document order
+    tutorial["sections"] = [
+        {"type": section.tag, "content": _text(section, strip=True)} for section in XPATH_SECTIONS(root)
+    ]
+
+    return tutorial
+
+
+def _html_root(html: str):
+    """Parse a page into an lxml tree, or None for an empty document"""
+    if not html.strip():
+        return None
+    try:
+        try:
+            return lxml.html.document_fromstring(html)
+        except ValueError:
+            # Unicode input with an XML encoding declaration must be passed as bytes
+            return lxml.html.document_fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return None
+
+
+def _ports(root, section_path, item_path) -> List[Dict[str, Any]]:
+    """Inlets or outlets of the first matching section"""
+    ports: List[Dict[str, Any]] = []
+    for section in section_path(root):
+        for port in item_path(section):
+            ports.append(
+                {
+                    "index": len(ports),
+                    "type": port.get("data-type", "signal"),
+                    "description": _text(port, strip=True),
+                }
+            )
+    return ports
+
+
+def _text(element, strip: bool) -> str:
+    """Equivalent of BeautifulSoup's get_text() (strip=True drops blank strings)"""
+    # Template contents never count as text, even below the template itself
+    if any(True for _ in element.iterancestors("template")):
+        return ""
+    if strip:
+        return "".join(piece.strip() for piece in _strings(element) if not piece.isspace())
+    return "".join(_strings(element))
+
+
+def _strings(element) -> Iterator[str]:
+    """Text and tails below element, skipping comments, scripts, styles and templates"""
+    if element.text:
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in SKIPPED_TEXT_TAGS:
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+# BeautifulSoup implementation
+
+
+def parse_object_doc_soup(html: str, object_name: str, url: str) -> Dict[str, Any]:
+    """Parse object documentation from HTML with BeautifulSoup"""
+    soup = BeautifulSoup(html, "lxml")
+
+    doc = {
+        "object_name": object_name,
+        "url": url,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+    # Extract description
+    desc_elem = soup.find("div", class_="description")
+    if desc_elem:
+        doc["description"] = desc_elem.get_text(strip=True)
+
+    # Extract inlets
+    inlets = []
+    inlet_section = soup.find("div", class_="inlets")
+    if inlet_section:
+        for inlet in inlet_section.find_all("div", class_="inlet"):
+            inlets.append(
+                {
+                    "index": len(inlets),
+                    "type": inlet.get("data-type", "signal"),
+                    "description": inlet.get_text(strip=True),
+                }
+            )
+    doc["inlets"] = inlets
+
+    # Extract outlets
+    outlets = []
+    outlet_section = soup.find("div", class_="outlets")
+    if outlet_section:
+        for outlet in outlet_section.find_all("div", class_="outlet"):
+            outlets.append(
+                {
+                    "index": len(outlets),
+                    "type": outlet.get("data-type", "signal"),
+                    "description": outlet.get_text(strip=True),
+                }
+            )
+    doc["outlets"] = outlets
+
+    # Extract attributes
+    attributes = {}
+    attr_section = soup.find("div", class_="attributes")
+    if attr_section:
+        for attr in attr_section.find_all("div", class_="attribute"):
+            name = attr.find("span", class_="name")
+            if name:
+                attributes[name.get_text(strip=True)] = {
+                    "type": attr.get("data-type", "float"),
+                    "description": attr.get_text(strip=True),
+                }
+    doc["attributes"] = attributes
+
+    # Extract examples
+    examples = []
+    example_section = soup.find("div", class_="examples")
+    if example_section:
+        for example in example_section.find_all("div", class_="example"):
+            examples.append(
+                {
+                    "description": example.get_text(strip=True),
+                    "code": (example.find("code").get_text() if example.find("code") else ""),
+                }
+            )
+    doc["examples"] = examples
+
+    # Extract related objects
+    related = []
+    related_section = soup.find("div", class_="seealso")
+    if related_section:
+        for link in related_section.find_all("a"):
+            related.append(link.get_text(strip=True))
+    doc["related_objects"] = related
+
+    return doc
+
+
+def parse_tutorial_soup(html: str, tutorial_name: str, url: str) -> Dict[str, Any]:
+    """Parse tutorial content from HTML with BeautifulSoup"""
+    soup = BeautifulSoup(html, "lxml")
+
+    tutorial = {
+        "name": tutorial_name,
+        "url": url,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+    # Extract title
+    title = soup.find("h1")
+    if title:
+        tutorial["title"] = title.get_text(strip=True)
+
+    # Extract content sections
+    sections = []
+    for section in soup.find_all(["h2", "h3", "p", "code"]):
+        sections.append({"type": section.name, "content": section.get_text(strip=True)})
+    tutorial["sections"] = sections
+
+    return tutorial
+
+
+# Parsers by name, as selected with the html_parser setting
+OBJECT_DOC_PARSERS: Dict[str, PageParser] = {"soup": parse_object_doc_soup}
+TUTORIAL_PARSERS: Dict[str, PageParser] = {"soup": parse_tutorial_soup}
+if etree is not None:
+    OBJECT_DOC_PARSERS["lxml"] = parse_object_doc_lxml
+    TUTORIAL_PARSERS["lxml"] = parse_tutorial_lxml
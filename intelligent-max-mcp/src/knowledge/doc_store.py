@@ -0,0 +1,239 @@
+"""
+Documentation Store
+
+Single-file SQLite store for parsed Cycling '74 documentation. It backs
+both the offline mirror, where every page is written once by the bulk
+prefetch, and the size-capped document cache. Payloads are compact JSON
+compressed with zlib; a capped store evicts least recently used entries.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    meta TEXT,
+    accessed_at REAL NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+# Access times are only recorded when older than this
+ACCESS_GRANULARITY = 60.0
+
+# Seconds a read waits on a locked database; under WAL readers are only blocked during recovery
+READ_TIMEOUT = 1.0
+
+# Eviction frees space down to this share of the cap, so it does not run on every write
+EVICTION_LOW_WATER = 0.9
+
+
+class StoredDoc(NamedTuple):
+    """A stored document with its metadata"""
+
+    data: Dict[str, Any]
+    meta: Dict[str, Any]
+    stored_at: float
+
+
+class DocStore:
+    """
+    Key -> parsed document store backed by one SQLite file.
+
+    Keys follow the cache layout ("objects/metro", "tutorials/basicchapter01").
+    Reads are synchronous: a primary-key lookup is far cheaper than a hop
+    to an executor. They use their own read-only connection and never
+    wait for writers, which under WAL read the last committed state.
+    Writes (put_many, touch) block on the database write lock and belong
+    in an executor. They take the lock up front (BEGIN IMMEDIATE), so
+    several processes can share one store. Reads of a capped store only
+    note access times; they are written back with the next write.
+    """
+
+    def __init__(self, path: Path, max_size_bytes: Optional[int] = None, busy_timeout: float = 30.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.evictions = 0
+
+        # Serializes writers of this process; readers never take it
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=busy_timeout, check_same_thread=False, isolation_level=None
+        )
+        # Must precede table creation to take effect on a new file
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+        self._reader = sqlite3.connect(
+            str(self.path), timeout=READ_TIMEOUT, check_same_thread=False, isolation_level=None
+        )
+        self._reader.execute("PRAGMA query_only=ON")
+
+        # Key -> access time noted by reads, not yet written back
+        self._accessed: Dict[str, float] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the document stored under key, if any"""
+        entry = self.get_entry(key)
+        return entry.data if entry else None
+
+    def get_entry(self, key: str) -> Optional[StoredDoc]:
+        """Return the document stored under key with its metadata and storage time"""
+        row = self._reader.execute(
+            "SELECT payload, meta, stored_at, accessed_at FROM docs WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        payload, meta, stored_at, accessed_at = row
+        if self.max_size_bytes is not None:
+            now = time.time()
+            if now - max(accessed_at, self._accessed.get(key, 0.0)) > ACCESS_GRANULARITY:
+                self._accessed[key] = now
+
+        return StoredDoc(json.loads(zlib.decompress(payload)), json.loads(meta) if meta else {}, stored_at)
+
+    def put(self, key: str, doc: Dict[str, Any], meta: Optional[Dict[str, Any]] = None):
+        """Store a single document"""
+        self.put_many([(key, doc, meta)])
+
+    def put_many(self, items: Iterable[Tuple[Any, ...]]):
+        """Store (key, doc) or (key, doc, meta) items in one transaction"""
+        now = time.time()
+        rows = []
+        for key, doc, *rest in items:
+            payload = zlib.compress(json.dumps(doc, separators=(",", ":")).encode())
+            meta = json.dumps(rest[0]) if rest and rest[0] else None
+            rows.append((key, payload, now, meta, now, len(key) + len(payload) + len(meta or "")))
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Recent reads count before choosing what to evict
+                self._write_access_times()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO docs (key, payload, stored_at, meta, accessed_at, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                evicted = self._evict()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            if evicted:
+                self._conn.execute("PRAGMA incremental_vacuum")
+
+    def touch(self, key: str):
+        """Restart the freshness clock of an entry"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE docs SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """Stored keys, optionally restricted to a prefix"""
+        rows = self._reader.execute(
+            "SELECT key FROM docs WHERE substr(key, 1, ?) = ? ORDER BY key", (len(prefix), prefix)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def size_bytes(self) -> int:
+        """Total stored size as counted against the cap"""
+        return self._reader.execute("SELECT COALESCE(SUM(size), 0) FROM docs").fetchone()[0]
+
+    def flush_access_times(self):
+        """Write back the access times noted by reads (blocks on the write lock)"""
+        if not self._accessed:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._write_access_times()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def __contains__(self, key: str) -> bool:
+        return self._reader.execute("SELECT 1 FROM docs WHERE key = ?", (key,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._reader.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def close(self):
+        """Write back pending access times and close both connections"""
+        try:
+            self.flush_access_times()
+        finally:
+            self._reader.close()
+            with self._lock:
+                self._conn.close()
+
+    def _write_access_times(self):
+        """Apply the noted access times; runs inside a write transaction"""
+        if not self._accessed:
+            return
+        # Swapped out first, so reads on other threads note into a fresh map
+        accessed, self._accessed = self._accessed, {}
+        self._conn.executemany(
+            "UPDATE docs SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+            [(accessed_at, key) for key, accessed_at in accessed.items()],
+        )
+
+    def _evict(self) -> int:
+        """Drop least recently used entries while over the cap; runs inside the write transaction"""
+        if self.max_size_bytes is None:
+            return 0
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM docs").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return 0
+
+        target = total - int(self.max_size_bytes * EVICTION_LOW_WATER)
+        victims = []
+        freed = 0
+        for key, size in self._conn.execute("SELECT key, size FROM docs ORDER BY accessed_at"):
+            if freed >= target:
+                break
+            victims.append((key,))
+            freed += size
+
+        self._conn.executemany("DELETE FROM docs WHERE key = ?", victims)
+        self.evictions += len(victims)
+        logger.debug(f"Evicted {len(victims)} documents ({freed} bytes) from {self.path.name}")
+        return len(victims)
+
+    def _create_schema(self):
+        """Create the table and its access-time index in a new store"""
+        with self._lock:
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+                return
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(SCHEMA)
+                self._conn.execute("CREATE INDEX IF NOT EXISTS docs_accessed_at ON docs (accessed_at)")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
@@ -6,16 +6,29 @@ our accumulated minutiae to create something greater than the sum of its parts.
 """
 
 import asyncio
+import json
 import logging
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 from ..knowledge.cycling74_connector import Cycling74Connector
+from ..knowledge.lru_cache import LRUCache
 from ..knowledge.minutiae_connector import MinutiaeConnector
 
 logger = logging.getLogger(__name__)
 
+# Sources in the order their entries are combined; equally confident entries keep this order
+SOURCE_ORDER = ("cycling74", "minutiae", "patterns")
+
+# Seconds of the Cycling '74 time limit left for building summaries once doc fetches stop waiting
+SUMMARY_MARGIN = 0.1
+
+# Tags boosted when the query context is temporal
+TEMPORAL_TAGS = frozenset(("temporal", "rhythm"))
+
 
 @dataclass
 class KnowledgeEntry:
@@ -42,6 +55,29 @@ class SearchResult:
     sources_queried: List[str]
     query_time_ms: float
     suggestions: List[str]  # Related searches
+    partial: bool = False  # Some sources missed the latency budget
+    skipped_sources: List[str] = field(default_factory=list)
+
+
+@dataclass
+class StreamUpdate:
+    """
+    One step of a streamed query.
+
+    Entries are sent once, in the update that adds them, under a key
+    unique within the stream; every update carries the full ranking as
+    keys, so clients re-order what they already hold.
+    """
+
+    query: str
+    sources: List[str]  # Sources merged in this step
+    added: Dict[int, KnowledgeEntry]  # New entries by stream key
+    ranking: List[int]  # Keys of every entry so far, best first
+    done: bool
+    elapsed_ms: float
+    suggestions: List[str] = field(default_factory=list)  # Set on the final update
+    partial: bool = False
+    skipped_sources: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -67,18 +103,38 @@ class KnowledgeFusionEngine:
     it learns from discoveries that it helps create.
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], cache_config: Optional[Dict[str, Any]] = None):
         self.config = config
-        self.cycling74 = Cycling74Connector(config.get("cycling74_docs", {}))
+        self.cycling74 = Cycling74Connector(config.get("cycling74_docs", {}), cache_config)
         self.minutiae = MinutiaeConnector(config.get("minutiae_repo", {}))
 
         # Pattern recognition and learning
         self.patterns: Dict[str, Pattern] = {}
         self.pattern_confidence_threshold = config.get("pattern_confidence_threshold", 0.8)
 
-        # Cache for fused knowledge
-        self.fusion_cache: Dict[str, Tuple[SearchResult, datetime]] = {}
-        self.cache_duration = timedelta(seconds=config.get("cache_duration", 300))
+        # Cache for fused knowledge, keyed by normalized query and context fingerprint. Results
+        # embed Cycling '74 docs, so they never outlive the docs' own freshness
+        self.fusion_cache: LRUCache[SearchResult] = LRUCache(
+            config.get("max_patterns_cache", 1000),
+            ttl=min(
+                config.get("pattern_expiry", config.get("cache_duration", 300)),
+                self.cycling74.cache_duration.total_seconds(),
+            ),
+        )
+        # Source index and doc generations the cached results were computed from
+        self._fusion_generation: Tuple[int, ...] = ()
+        self._patterns_generation = 0
+
+        # Latency budget of one query, and tighter per-source timeouts ("cycling74", "minutiae", "patterns")
+        self.query_budget: Optional[float] = config.get("query_budget", 2.0)
+        self.source_timeouts: Dict[str, float] = config.get("source_timeouts") or {}
+
+        # Ranking: score multiplier per source, and entries kept per result (None keeps all)
+        self.source_priors: Dict[str, float] = config.get("source_priors") or {}
+        self.max_results: Optional[int] = config.get("max_results")
+
+        # Sources still running after their query returned, referenced until done
+        self._background_tasks: Set[asyncio.Task] = set()
 
         # Learning state
         self.discovery_queue: List[Dict[str, Any]] = []
@@ -88,7 +144,10 @@ class KnowledgeFusionEngine:
 
     async def initialize(self):
         """Initialize all knowledge sources"""
-        await asyncio.gather(self.cycling74.initialize(), self.minutiae.initialize())
+        # The Cycling '74 object catalog drives object tagging in the minutiae index
+        await self.cycling74.initialize()
+        self.minutiae.set_object_catalog(self.cycling74.get_object_names())
+        await self.minutiae.initialize()
         await self._load_existing_patterns()
         logger.info("All knowledge sources initialized")
 
@@ -102,54 +161,27 @@ class KnowledgeFusionEngine:
         start_time = datetime.now()
 
         # Check cache first
-        if query in self.fusion_cache:
-            cached_result, cached_time = self.fusion_cache[query]
-            if datetime.now() - cached_time < self.cache_duration:
-                logger.debug(f"Cache hit for query: {query}")
-                return cached_result
-
-        # Parallel search across all sources
-        results = await asyncio.gather(
-            self._search_cycling74(query, context),
-            self._search_minutiae(query, context),
-            self._search_patterns(query, context),
-            return_exceptions=True,
-        )
+        normalized, cache_key, generation, cached_result = self._check_cache(query, context)
+        if cached_result is not None:
+            return cached_result
 
-        # Combine and rank results
-        all_entries = []
-        sources_queried = []
+        # Parallel search across all sources, waiting on each no longer than its timeout
+        tasks = self._start_searches(normalized, context)
+        skipped = await self._wait_for_sources(tasks)
 
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Error in knowledge source {i}: {result}")
-                continue
+        outputs = self._finished_outputs(tasks)
+        if skipped:
+            search_result = self._fuse(query, outputs, context, start_time, skipped)
+            logger.info(f"Query {query!r} returned without {', '.join(skipped)}")
 
-            if result:
-                all_entries.extend(result["entries"])
-                sources_queried.append(result["source"])
+            # Late sources keep running; their complete result is cached for the next identical query
+            self._finish_in_background(query, tasks, context, start_time, cache_key, generation)
+        else:
+            search_result = self._fuse(query, outputs, context, start_time)
 
-        # Apply intelligent ranking
-        ranked_entries = self._rank_results(all_entries, query, context)
-
-        # Generate suggestions
-        suggestions = self._generate_suggestions(ranked_entries, query)
-
-        # Calculate query time
-        query_time_ms = (datetime.now() - start_time).total_seconds() * 1000
-
-        # Create result
-        search_result = SearchResult(
-            query=query,
-            entries=ranked_entries,
-            total_results=len(ranked_entries),
-            sources_queried=sources_queried,
-            query_time_ms=query_time_ms,
-            suggestions=suggestions,
-        )
-
-        # Cache the result
-        self.fusion_cache[query] = (search_result, datetime.now())
+            # Cache the result, unless an index changed while the sources were searched
+            if self._cacheable(outputs, generation):
+                self.fusion_cache.put(cache_key, search_result)
 
         # Learn from the query if enabled
         if self.learning_enabled:
@@ -157,6 +189,173 @@ class KnowledgeFusionEngine:
 
         return search_result
 
+    async def query_stream(self, query: str, context: Optional[Dict[str, Any]] = None) -> AsyncIterator[StreamUpdate]:
+        """
+        Query all knowledge sources, yielding results as they arrive.
+
+        The local minutiae and pattern results come first; Cycling '74
+        results are merged in when they land, re-ranking what was sent.
+        Every ranking is the one query() gives for the sources so far, so
+        the last update, which has done set and carries suggestions,
+        matches query(). It is partial when Cycling '74 missed the latency
+        budget.
+        """
+        start_time = datetime.now()
+
+        normalized, cache_key, generation, cached_result = self._check_cache(query, context)
+        if cached_result is not None:
+            entries = dict(enumerate(cached_result.entries))
+            yield StreamUpdate(
+                query=query,
+                sources=cached_result.sources_queried,
+                added=entries,
+                ranking=list(entries),
+                done=True,
+                elapsed_ms=(datetime.now() - start_time).total_seconds() * 1000,
+                suggestions=cached_result.suggestions,
+                partial=cached_result.partial,
+                skipped_sources=cached_result.skipped_sources,
+            )
+            return
+
+        tasks = self._start_searches(normalized, context)
+        start = asyncio.get_running_loop().time()
+
+        # Stream key -> entry sent, and the stream key of each source entry by identity
+        entries: Dict[int, KnowledgeEntry] = {}
+        keys: Dict[int, int] = {}
+        ranking: List[int] = []
+        ranked_entries: List[KnowledgeEntry] = []
+        outputs: List[Dict[str, Any]] = []
+        skipped: List[str] = []
+        finished = False
+
+        try:
+            for phase in (("minutiae", "patterns"), ("cycling74",)):
+                skipped += await self._wait_for_sources({name: tasks[name] for name in phase}, start)
+
+                added: Dict[int, KnowledgeEntry] = {}
+                merged = []
+                for name in phase:
+                    task = tasks[name]
+                    if not task.done():
+                        continue
+                    if task.exception():
+                        logger.error(f"Error in knowledge source {name}: {task.exception()}")
+                        continue
+
+                    result = task.result()
+                    if not result:
+                        continue
+                    outputs.append(result)
+                    merged.append(name)
+
+                if merged:
+                    # Rank everything so far as query() would, on copies, in SOURCE_ORDER like _fuse()
+                    outputs.sort(key=lambda output: SOURCE_ORDER.index(output["source"]))
+                    originals = [entry for output in outputs for entry in output["entries"]]
+                    copies = [replace(entry) for entry in originals]
+                    origin = {id(copy): id(entry) for entry, copy in zip(originals, copies)}
+                    ranked_entries = self._rank_results(copies, query, context, self.max_results)
+
+                    # Entries are sent the first time they rank
+                    ranking = []
+                    for entry in ranked_entries:
+                        key = keys.get(origin[id(entry)])
+                        if key is None:
+                            key = keys[origin[id(entry)]] = len(entries)
+                            entries[key] = added[key] = entry
+                        ranking.append(key)
+                last = phase[0] == "cycling74"
+                if added or last:
+                    suggestions = self._generate_suggestions(ranked_entries, query) if last else []
+                    yield StreamUpdate(
+                        query=query,
+                        sources=merged,
+                        added=added,
+                        ranking=ranking,
+                        done=last,
+                        elapsed_ms=(datetime.now() - start_time).total_seconds() * 1000,
+                        suggestions=suggestions,
+                        partial=bool(skipped),
+                        skipped_sources=list(skipped),
+                    )
+            finished = True
+
+            if not skipped:
+                search_result = SearchResult(
+                    query=query,
+                    entries=ranked_entries,
+                    total_results=sum(len(output["entries"]) for output in outputs),
+                    sources_queried=[output["source"] for output in outputs],
+                    query_time_ms=(datetime.now() - start_time).total_seconds() * 1000,
+                    suggestions=suggestions,
+                )
+                if self._cacheable(outputs, generation):
+                    self.fusion_cache.put(cache_key, search_result)
+
+                if self.learning_enabled:
+                    asyncio.create_task(self._learn_from_query(query, search_result, context))
+
+        finally:
+            # Sources still running when the stream ended (or its consumer left) fill the caches later
+            if skipped or not finished:
+                self._finish_in_background(query, tasks, context, start_time, cache_key, generation)
+
+    async def query_many(self, queries: Sequence[str], context: Optional[Dict[str, Any]] = None) -> List[SearchResult]:
+        """
+        Run a batch of queries, e.g. every object class in a patcher.
+
+        Queries that normalize alike are searched once, each source runs
+        one pass over the whole batch, and Cycling '74 documents wanted by
+        several queries are fetched once. Batches wait for every source;
+        the latency budget only applies to interactive queries.
+
+        Returns:
+            One result per query, in order
+        """
+        start_time = datetime.now()
+
+        # Cache key -> result, and the first of each distinct uncached query with its normalized form
+        fused: Dict[Tuple[str, str], SearchResult] = {}
+        pending: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        keys = []
+        for query in queries:
+            cache_key = (self._normalize_query(query), self._context_fingerprint(context))
+            keys.append(cache_key)
+            if cache_key in fused or cache_key in pending:
+                continue
+
+            normalized, cache_key, generation, cached_result = self._check_cache(query, context)
+            if cached_result is not None:
+                fused[cache_key] = cached_result
+            else:
+                pending[cache_key] = (query, normalized)
+
+        if pending:
+            generation = self._index_generation()
+            batch = [normalized for _, normalized in pending.values()]
+            outputs = await asyncio.gather(
+                self._search_cycling74_many(batch, context),
+                self._search_minutiae_many(batch, context),
+                self._search_patterns_many(batch, context),
+            )
+
+            for position, (cache_key, (query, _)) in enumerate(pending.items()):
+                query_outputs = [source[position] for source in outputs]
+                search_result = self._fuse(query, query_outputs, context, start_time)
+                fused[cache_key] = search_result
+                if self._cacheable(query_outputs, generation):
+                    self.fusion_cache.put(cache_key, search_result)
+
+                if self.learning_enabled:
+                    asyncio.create_task(self._learn_from_query(query, search_result, context))
+
+        return [
+            fused[cache_key] if fused[cache_key].query == query else replace(fused[cache_key], query=query)
+            for query, cache_key in zip(queries, keys)
+        ]
+
     async def enhance_knowledge(self, discovery: Dict[str, Any]) -> bool:
         """
         Add a new discovery to our knowledge base.
@@ -173,6 +372,7 @@ class KnowledgeFusionEngine:
 
             # Add to our pattern database
             self.patterns[pattern.name] = pattern
+            self._patterns_generation += 1
 
             # If confidence is high enough, add to minutiae repository
             if pattern.confidence >= self.pattern_confidence_threshold:
@@ -234,125 +434,378 @@ class KnowledgeFusionEngine:
 
         return analysis
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters of the fused result cache and the documentation caches"""
+        return {"fusion": self.fusion_cache.stats(), "cycling74": self.cycling74.get_cache_stats()}
+
     # Private methods for the heavy lifting
 
-    async def _search_cycling74(self, query: str, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    def _check_cache(
+        self, query: str, context: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Tuple[str, str], Tuple[int, ...], Optional[SearchResult]]:
+        """Normalized query, cache key, current index generations and the cached result, if any"""
+        normalized = self._normalize_query(query)
+        cache_key = (normalized, self._context_fingerprint(context))
+        generation = self._index_generation()
+        if generation != self._fusion_generation:
+            # A source index or cached doc changed: every cached ranking may be out of date
+            self.fusion_cache.clear()
+            self._fusion_generation = generation
+
+        cached_result = self.fusion_cache.get(cache_key)
+        if cached_result is not None:
+            logger.debug(f"Cache hit for query: {query}")
+            if cached_result.query != query:
+                cached_result = replace(cached_result, query=query)
+        return normalized, cache_key, generation, cached_result
+
+    def _start_searches(self, query: str, context: Optional[Dict[str, Any]]) -> Dict[str, asyncio.Future]:
+        """Start searching every source concurrently, in SOURCE_ORDER"""
+        # Cycling '74 stops waiting for full docs in time to return summaries within its own limit
+        limit = self._source_limit("cycling74")
+        doc_deadline = None if limit is None else max(limit - SUMMARY_MARGIN, 0.0)
+        searches = {
+            "cycling74": self._search_cycling74(query, context, doc_deadline),
+            "minutiae": self._search_minutiae(query, context),
+            "patterns": self._search_patterns(query, context),
+        }
+        return {name: asyncio.ensure_future(searches[name]) for name in SOURCE_ORDER}
+
+    def _source_limit(self, name: str) -> Optional[float]:
+        """Seconds a query waits for one source: its timeout or the query budget, whichever is shorter"""
+        limits = [limit for limit in (self.query_budget, self.source_timeouts.get(name)) if limit is not None]
+        return min(limits) if limits else None
+
+    async def _wait_for_sources(self, tasks: Dict[str, asyncio.Future], start: Optional[float] = None) -> List[str]:
+        """
+        Wait for source searches until each one's deadline.
+
+        A source's deadline is its timeout or the query budget, whichever
+        is shorter, counted from start (loop time, defaulting to now).
+        Returns the sources still running, which are left to finish.
+        """
+        loop = asyncio.get_running_loop()
+        if start is None:
+            start = loop.time()
+        deadlines = {}
+        for name, task in tasks.items():
+            limit = self._source_limit(name)
+            deadlines[task] = None if limit is None else start + limit
+
+        pending = set(tasks.values())
+        while pending:
+            now = loop.time()
+            waiting = {task for task in pending if deadlines[task] is None or deadlines[task] > now}
+            if not waiting:
+                break
+
+            bounded = [deadlines[task] for task in waiting if deadlines[task] is not None]
+            timeout = min(bounded) - now if bounded else None
+            done, _ = await asyncio.wait(waiting, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            pending -= done
+
+        return [name for name, task in tasks.items() if task in pending]
+
+    @staticmethod
+    def _finished_outputs(tasks: Dict[str, asyncio.Future]) -> List[Dict[str, Any]]:
+        """Results of the source searches that finished without error"""
+        outputs = []
+        for name, task in tasks.items():
+            if not task.done():
+                continue
+            if task.exception():
+                logger.error(f"Error in knowledge source {name}: {task.exception()}")
+                continue
+            outputs.append(task.result())
+        return outputs
+
+    def _fuse(
+        self,
+        query: str,
+        outputs: List[Dict[str, Any]],
+        context: Optional[Dict[str, Any]],
+        start_time: datetime,
+        skipped: Optional[List[str]] = None,
+    ) -> SearchResult:
+        """Combine and rank source results"""
+        all_entries = []
+        sources_queried = []
+
+        for result in outputs:
+            if result:
+                all_entries.extend(result["entries"])
+                sources_queried.append(result["source"])
+
+        # Ranking adjusts confidences in place, so a partial ranking works on copies
+        if skipped:
+            all_entries = [replace(entry) for entry in all_entries]
+
+        # Apply intelligent ranking
+        ranked_entries = self._rank_results(all_entries, query, context, self.max_results)
+
+        # Generate suggestions
+        suggestions = self._generate_suggestions(ranked_entries, query)
+
+        # Calculate query time
+        query_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+
+        return SearchResult(
+            query=query,
+            entries=ranked_entries,
+            total_results=len(all_entries),
+            sources_queried=sources_queried,
+            query_time_ms=query_time_ms,
+            suggestions=suggestions,
+            partial=bool(skipped),
+            skipped_sources=list(skipped or []),
+        )
+
+    def _finish_in_background(
+        self,
+        query: str,
+        tasks: Dict[str, asyncio.Future],
+        context: Optional[Dict[str, Any]],
+        start_time: datetime,
+        cache_key: Tuple[str, str],
+        generation: Tuple[int, ...],
+    ):
+        """Let unfinished sources complete, then cache the complete result"""
+        late = asyncio.create_task(self._complete_late(query, tasks, context, start_time, cache_key, generation))
+        self._background_tasks.add(late)
+        late.add_done_callback(self._background_tasks.discard)
+
+    async def _complete_late(
+        self,
+        query: str,
+        tasks: Dict[str, asyncio.Future],
+        context: Optional[Dict[str, Any]],
+        start_time: datetime,
+        cache_key: Tuple[str, str],
+        generation: Tuple[int, ...],
+    ):
+        """Cache the complete result of a partial query once its late sources finish"""
+        await asyncio.wait(tasks.values())
+        outputs = self._finished_outputs(tasks)
+        if self._cacheable(outputs, generation):
+            self.fusion_cache.put(cache_key, self._fuse(query, outputs, context, start_time))
+
+    def _cacheable(self, outputs: List[Dict[str, Any]], generation: Tuple[int, ...]) -> bool:
+        """
+        Whether a fused result may be cached: no index changed while the
+        sources were searched, and no Cycling '74 entry fell back to a
+        summary because its doc was still being fetched. The fetch fills
+        the doc cache, so the next identical query gets the full doc.
+        """
+        if self._index_generation() != generation:
+            return False
+        return not any(output.get("docs_pending") for output in outputs)
+
+    def _index_generation(self) -> Tuple[int, ...]:
+        """Generations of every index and doc cache a fused result depends on"""
+        return (
+            self.cycling74.index_generation,
+            self.cycling74.doc_generation,
+            self.minutiae.index_generation,
+            self._patterns_generation,
+        )
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Sources match case-insensitively, so the normalized query is what gets searched and cached"""
+        return " ".join(query.lower().split())
+
+    @staticmethod
+    def _context_fingerprint(context: Optional[Dict[str, Any]]) -> str:
+        """Canonical form of a query context; equal contexts share cache entries"""
+        if not context:
+            return ""
+        return json.dumps(context, sort_keys=True, separators=(",", ":"), default=str)
+
+    async def _search_cycling74(
+        self, query: str, context: Optional[Dict[str, Any]], doc_deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Search official Cycling '74 documentation"""
+        return (await self._search_cycling74_many([query], context, doc_deadline))[0]
+
+    async def _search_cycling74_many(
+        self, queries: Sequence[str], context: Optional[Dict[str, Any]], doc_deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Search official Cycling '74 documentation for several queries, sharing doc fetches"""
         try:
-            docs = await self.cycling74.search(query)
-            entries = [
-                KnowledgeEntry(
-                    source="cycling74",
-                    object_name=doc.get("object_name"),
-                    pattern_name=None,
-                    description=doc.get("description", ""),
-                    content=doc,
-                    confidence=1.0,  # Official docs have high confidence
-                    tags=doc.get("tags", []),
-                    timestamp=datetime.now(),
-                    metadata={"url": doc.get("url")},
-                )
-                for doc in docs
+            batch_docs = await self.cycling74.search_many(queries, doc_deadline)
+            return [
+                {
+                    "source": "cycling74",
+                    "docs_pending": any(doc.get("doc_pending") for doc in docs),
+                    "entries": [
+                        KnowledgeEntry(
+                            source="cycling74",
+                            object_name=doc.get("object_name"),
+                            pattern_name=None,
+                            description=doc.get("description", ""),
+                            content=doc,
+                            confidence=1.0,  # Official docs have high confidence
+                            tags=doc.get("tags", []),
+                            timestamp=datetime.now(),
+                            metadata={"url": doc.get("url")},
+                        )
+                        for doc in docs
+                    ],
+                }
+                for docs in batch_docs
             ]
-            return {"source": "cycling74", "entries": entries}
         except Exception as e:
             logger.error(f"Error searching Cycling74 docs: {e}")
-            return {"source": "cycling74", "entries": []}
+            return [{"source": "cycling74", "entries": []} for _ in queries]
 
     async def _search_minutiae(self, query: str, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Search our minutiae knowledge repository"""
+        return (await self._search_minutiae_many([query], context))[0]
+
+    async def _search_minutiae_many(
+        self, queries: Sequence[str], context: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Search our minutiae knowledge repository for several queries in one index pass"""
         try:
-            results = await self.minutiae.search(query, context)
-            entries = [
-                KnowledgeEntry(
-                    source="minutiae",
-                    object_name=result.get("object_name"),
-                    pattern_name=result.get("pattern_name"),
-                    description=result.get("description", ""),
-                    content=result,
-                    confidence=result.get("confidence", 0.9),
-                    tags=result.get("tags", []),
-                    timestamp=datetime.now(),
-                    metadata=result.get("metadata", {}),
-                )
-                for result in results
+            batch_results = await self.minutiae.search_many(queries, context)
+            return [
+                {
+                    "source": "minutiae",
+                    "entries": [
+                        KnowledgeEntry(
+                            source="minutiae",
+                            object_name=result.get("object_name"),
+                            pattern_name=result.get("pattern_name"),
+                            description=result.get("description", ""),
+                            content=result,
+                            confidence=result.get("confidence", 0.9),
+                            tags=result.get("tags", []),
+                            timestamp=datetime.now(),
+                            metadata=result.get("metadata", {}),
+                        )
+                        for result in results
+                    ],
+                }
+                for results in batch_results
             ]
-            return {"source": "minutiae", "entries": entries}
         except Exception as e:
             logger.error(f"Error searching minutiae: {e}")
-            return {"source": "minutiae", "entries": []}
+            return [{"source": "minutiae", "entries": []} for _ in queries]
 
     async def _search_patterns(self, query: str, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Search discovered patterns"""
-        entries = []
-        query_lower = query.lower()
-
-        for pattern in self.patterns.values():
-            # Simple relevance scoring
-            relevance = 0.0
-            if query_lower in pattern.name.lower():
-                relevance += 0.5
-            if query_lower in pattern.description.lower():
-                relevance += 0.3
-            for tag in pattern.metadata.get("tags", []):
-                if query_lower in tag.lower():
-                    relevance += 0.2
-
-            if relevance > 0:
-                entries.append(
-                    KnowledgeEntry(
-                        source="discovery",
-                        object_name=None,
-                        pattern_name=pattern.name,
-                        description=pattern.description,
-                        content={
-                            "examples": pattern.examples,
-                            "usage_count": pattern.usage_count,
-                        },
-                        confidence=pattern.confidence * relevance,
-                        tags=pattern.metadata.get("tags", []),
-                        timestamp=pattern.discovered_at,
-                        metadata=pattern.metadata,
+        return (await self._search_patterns_many([query], context))[0]
+
+    async def _search_patterns_many(
+        self, queries: Sequence[str], context: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Search discovered patterns for several queries, lowercasing each pattern once"""
+        lowered = [
+            (
+                pattern,
+                pattern.name.lower(),
+                pattern.description.lower(),
+                [tag.lower() for tag in pattern.metadata.get("tags", [])],
+            )
+            for pattern in self.patterns.values()
+        ]
+
+        batch = []
+        for query in queries:
+            entries = []
+            query_lower = query.lower()
+
+            for pattern, name, description, tags in lowered:
+                # Simple relevance scoring
+                relevance = 0.0
+                if query_lower in name:
+                    relevance += 0.5
+                if query_lower in description:
+                    relevance += 0.3
+                for tag in tags:
+                    if query_lower in tag:
+                        relevance += 0.2
+
+                if relevance > 0:
+                    entries.append(
+                        KnowledgeEntry(
+                            source="discovery",
+                            object_name=None,
+                            pattern_name=pattern.name,
+                            description=pattern.description,
+                            content={
+                                "examples": pattern.examples,
+                                "usage_count": pattern.usage_count,
+                            },
+                            confidence=pattern.confidence * relevance,
+                            tags=pattern.metadata.get("tags", []),
+                            timestamp=pattern.discovered_at,
+                            metadata=pattern.metadata,
+                        )
                     )
-                )
 
-        # Sort by confidence
-        entries.sort(key=lambda x: x.confidence, reverse=True)
-        return {"source": "patterns", "entries": entries[:10]}  # Top 10
+            # Sort by confidence
+            entries.sort(key=lambda x: x.confidence, reverse=True)
+            batch.append({"source": "patterns", "entries": entries[:10]})  # Top 10
+
+        return batch
 
     def _rank_results(
         self,
         entries: List[KnowledgeEntry],
         query: str,
         context: Optional[Dict[str, Any]],
+        limit: Optional[int] = None,
     ) -> List[KnowledgeEntry]:
         """
         Intelligent ranking of search results based on relevance,
         confidence, and context.
+
+        Candidates are scored as columns (base confidence, source prior,
+        tag matches, age) in one vectorized pass. Only the best limit
+        entries are ordered and returned, with their boosted confidence;
+        ties keep the higher base confidence, then the input order.
         """
-        # For now, simple confidence-based ranking
-        # TODO: Implement more sophisticated ranking with ML
-        ranked = sorted(entries, key=lambda x: x.confidence, reverse=True)
+        count = len(entries)
+        if not count:
+            return []
+
+        base = np.fromiter((entry.confidence for entry in entries), dtype=float, count=count)
+        scores = base.copy()
+        if self.source_priors:
+            scores *= np.fromiter(
+                (self.source_priors.get(entry.source, 1.0) for entry in entries), dtype=float, count=count
+            )
 
         # Apply context-based adjustments
         if context:
             # If user is working on temporal patterns, boost those results
             if context.get("domain") == "temporal":
-                for entry in ranked:
-                    if "temporal" in entry.tags or "rhythm" in entry.tags:
-                        entry.confidence *= 1.2
+                untagged = np.fromiter(map(TEMPORAL_TAGS.isdisjoint, (entry.tags for entry in entries)), bool, count)
+                scores[~untagged] *= 1.2
 
             # Recent entries get a small boost
             now = datetime.now()
-            for entry in ranked:
-                age_days = (now - entry.timestamp).days
-                if age_days < 7:
-                    entry.confidence *= 1.1
-                elif age_days < 30:
-                    entry.confidence *= 1.05
-
-        # Re-sort after adjustments
-        return sorted(ranked, key=lambda x: x.confidence, reverse=True)
+            age_days = np.fromiter(((now - entry.timestamp).days for entry in entries), dtype=int, count=count)
+            scores *= np.where(age_days < 7, 1.1, np.where(age_days < 30, 1.05, 1.0))
+
+        # Top-k candidates, including every entry tied with the k-th score
+        candidates = np.arange(count)
+        if limit is not None and limit < count:
+            if limit <= 0:
+                return []
+            kth = scores[np.argpartition(-scores, limit - 1)[limit - 1]]
+            candidates = np.flatnonzero(scores >= kth)
+
+        # Best score first, then best base confidence; the sort is stable, so then input order
+        order = candidates[np.lexsort((-base[candidates], -scores[candidates]))][:limit]
+
+        ranked = []
+        for index, score in zip(order.tolist(), scores[order].tolist()):
+            entry = entries[index]
+            entry.confidence = score
+            ranked.append(entry)
+        return ranked
 
     def _generate_suggestions(self, entries: List[KnowledgeEntry], query: str) -> List[str]:
         """Generate related search suggestions based on results"""
@@ -0,0 +1,162 @@
+"""
+Compact Index Records
+
+Slotted storage for minutiae index entries. Repeated strings (tags,
+categories, object classes) are interned and timestamps are stored as
+floats, so holding several index generations in memory stays cheap.
+The content preview and code examples of markdown stay on disk as offsets.
+Records are turned back into plain dictionaries only when returned.
+"""
+
+import sys
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+# Entry fields with a dedicated slot, in result order
+_FIELD_KEYS = ("name", "title", "description", "tags", "modified")
+
+# Entry keys with a dedicated slot; anything else is kept in `details`
+_SLOT_KEYS = ("file_path", "type") + _FIELD_KEYS + ("preview_chars", "code_spans")
+
+# Fields read back from the indexed file, in result order
+TEXT_KEYS = ("content_preview", "code_examples")
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _compact(value: Any) -> Any:
+    """Intern strings and freeze lists inside type-specific details"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return tuple(_compact(item) for item in value)
+    if isinstance(value, dict):
+        return {_intern(key): _compact(item) for key, item in value.items()}
+    return value
+
+
+def decode_text(raw: bytes) -> str:
+    """Decode file contents with the newline handling of text mode"""
+    return raw.decode("utf-8", "replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _expand(value: Any) -> Any:
+    """Inverse of _compact for hydration"""
+    if isinstance(value, tuple):
+        return [_expand(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _expand(item) for key, item in value.items()}
+    return value
+
+
+class IndexRecord:
+    """One indexed file entry"""
+
+    __slots__ = (
+        "entry_id",
+        "category",
+        "file_path",
+        "type",
+        "name",
+        "title",
+        "description",
+        "tags",
+        "modified",
+        "preview_chars",
+        "code_spans",
+        "details",
+    )
+
+    def __init__(self, entry_id: int, category: str, entry: Dict[str, Any]):
+        self.entry_id = entry_id
+        self.category = sys.intern(category)
+        self.file_path: str = entry.get("file_path", "")
+        self.type: str = sys.intern(entry.get("type", ""))
+        self.name: Optional[str] = entry.get("name")
+        self.title: Optional[str] = entry.get("title")
+        self.description: Optional[str] = entry.get("description")
+        self.tags: Tuple[str, ...] = tuple(sys.intern(tag) for tag in entry.get("tags", ()))
+        # Length of the content preview and (language, start, end) byte ranges of code blocks
+        self.preview_chars: Optional[int] = entry.get("preview_chars")
+        self.code_spans: Optional[Tuple[Tuple[str, int, int], ...]] = (
+            tuple((sys.intern(language), start, end) for language, start, end in entry["code_spans"])
+            if "code_spans" in entry
+            else None
+        )
+
+        modified = entry.get("modified")
+        self.modified: Optional[float] = datetime.fromisoformat(modified).timestamp() if modified else None
+
+        details = {key: value for key, value in entry.items() if key not in _SLOT_KEYS}
+        self.details: Optional[Dict[str, Any]] = _compact(details) if details else None
+
+    @property
+    def has_text(self) -> bool:
+        """Whether hydration needs fields read back from the indexed file"""
+        return self.preview_chars is not None or self.code_spans is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dictionary-style access to a single resident field (not the TEXT_KEYS read from disk)"""
+        if key in _SLOT_KEYS:
+            value = getattr(self, key)
+            if value is None:
+                return default
+            if key == "tags":
+                return list(value)
+            if key == "modified":
+                return datetime.fromtimestamp(value).isoformat()
+            return value
+
+        if self.details and key in self.details:
+            return _expand(self.details[key])
+        return default
+
+    def load_text(self, raw: bytes) -> Dict[str, Any]:
+        """Cut the content preview and code examples out of the indexed file's bytes"""
+        fields: Dict[str, Any] = {}
+        if self.preview_chars is not None:
+            fields["content_preview"] = decode_text(raw)[: self.preview_chars]
+        if self.code_spans is not None:
+            fields["code_examples"] = [
+                {"language": language, "code": decode_text(raw[start:end])} for language, start, end in self.code_spans
+            ]
+        return fields
+
+    def to_dict(self, text: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Hydrate the record into the plain entry dictionary.
+
+        Args:
+            text: Fields from load_text(); omitted when the file could not be read back
+        """
+        entry: Dict[str, Any] = {"file_path": self.file_path, "type": self.type}
+        for key in _FIELD_KEYS:
+            value = self.get(key)
+            if value is not None:
+                entry[key] = value
+        if text:
+            for key in TEXT_KEYS:
+                if key in text:
+                    entry[key] = text[key]
+        if self.details:
+            entry.update(_expand(self.details))
+        return entry
+
+
+class PassageRecord:
+    """
+    Location of one heading-delimited passage of an indexed file.
+
+    Only the byte range is kept; the text is read from the file on demand.
+    """
+
+    __slots__ = ("entry_id", "heading", "anchor", "start", "end")
+
+    def __init__(self, entry_id: int, heading: str, anchor: str, start: int, end: int):
+        self.entry_id = entry_id
+        self.heading = heading
+        self.anchor = anchor
+        self.start = start
+        self.end = end
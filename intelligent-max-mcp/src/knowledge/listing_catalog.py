@@ -0,0 +1,139 @@
+"""
+Listing Catalog
+
+Parses the Cycling '74 listing files kept in docs/knowledge_sources (the
+Max and MSP object functional listings, guides and tutorials) into one
+structured catalog. Each file is scanned once with a single precompiled
+pattern matching both headings and documentation links.
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Tuple
+from urllib.parse import urlsplit
+
+# Listing files, in catalog order; the consolidated listing repeats the others
+LISTING_FILES = (
+    "Max Object Functional Listing.md",
+    "MSP Object Functional Listing.md",
+    "Max Guides.md",
+    "MSP Guides.md",
+    "Max Tutorials.md",
+    "MSP Tutorials.md",
+    "Max MSP Documentation Listings.md",
+)
+
+# Bump when the catalog structure changes, so cached catalogs are rebuilt
+CATALOG_VERSION = 1
+
+# Headings and documentation links, in document order
+LISTING_TOKEN_PATTERN = re.compile(
+    r"^(#{1,6})[ \t]+(.+?)[ \t#]*$|\[([^\]\n]+)\]\((https?://docs\.cycling74\.com/[^)\s]+)\)", re.MULTILINE
+)
+FUNCTIONAL_LISTING_PATTERN = re.compile(r"functional listing of all (max|msp) objects", re.IGNORECASE)
+COLLECTION_PATTERN = re.compile(r"^(max|msp)\b.*\b(?:guides|tutorials)$", re.IGNORECASE)
+CHAPTER_PATTERN = re.compile(r"^(.+?)\s+(\d+):\s*(.+)$")
+SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+
+# Headings that only structure the files
+STRUCTURAL_HEADINGS = frozenset(("contents", "guides", "tutorials", "objects functional listing"))
+
+# Links in the listings' prose rather than to listed pages
+SKIPPED_LINKS = frozenset(("Reference page", "Technical Notes"))
+
+
+class ListingLink(NamedTuple):
+    """One documentation link with the listing context it appeared in"""
+
+    name: str
+    url: str
+    kind: str  # "object" | "guide" | "tutorial"
+    domain: str  # "max" | "msp"
+    category: str  # Functional category of an object, "general" for documentation
+
+
+def scan_listing(content: str) -> Iterator[ListingLink]:
+    """Documentation links of one listing file, in a single pass"""
+    domain = "max"
+    category = "general"
+
+    for match in LISTING_TOKEN_PATTERN.finditer(content):
+        heading, name = match.group(2), match.group(3)
+
+        if heading is not None:
+            functional = FUNCTIONAL_LISTING_PATTERN.search(heading)
+            collection = COLLECTION_PATTERN.match(heading)
+            if functional or collection:
+                domain = (functional or collection).group(1).lower()
+                category = "general"
+            elif heading.lower() not in STRUCTURAL_HEADINGS:
+                category = SLUG_PATTERN.sub("_", heading.lower()).strip("_")
+            continue
+
+        name = name.strip()
+        if name in SKIPPED_LINKS:
+            continue
+
+        url = match.group(4)
+        path = urlsplit(url).path
+        if "/refpages/" in path:
+            yield ListingLink(name, url, "object", domain, category)
+        else:
+            kind = "tutorial" if "tutorial" in path.lower() else "guide"
+            yield ListingLink(name, url, kind, domain, "general")
+
+
+def build_catalog(listings: Iterable[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Merge (file name, content) listings into one catalog.
+
+    Entries are keyed by object name or page title. An object listed in
+    several places collects every category and URL; the first entry for
+    a name wins otherwise.
+    """
+    catalog: Dict[str, Dict[str, Any]] = {}
+
+    for source, content in listings:
+        for link in scan_listing(content):
+            entry = catalog.get(link.name)
+            if entry is None:
+                entry = catalog[link.name] = _new_entry(link)
+            elif entry["kind"] != link.kind:
+                continue
+
+            if link.url not in entry["hrefs"]:
+                entry["hrefs"].append(link.url)
+            if link.kind == "object" and link.category not in entry["categories"]:
+                entry["categories"].append(link.category)
+            if source not in entry["listings"]:
+                entry["listings"].append(source)
+
+    return catalog
+
+
+def sources_digest(listings: Iterable[Tuple[str, bytes]]) -> str:
+    """Content hash of (file name, raw content) listings, identifying the catalog built from them"""
+    digest = hashlib.sha256(f"catalog-v{CATALOG_VERSION}".encode())
+    for source, raw in listings:
+        digest.update(source.encode())
+        digest.update(hashlib.sha256(raw).digest())
+    return digest.hexdigest()
+
+
+def _new_entry(link: ListingLink) -> Dict[str, Any]:
+    """Catalog entry for the first link to a name"""
+    entry: Dict[str, Any] = {"kind": link.kind, "domain": link.domain, "hrefs": [], "listings": []}
+    if link.kind == "object":
+        entry["categories"] = []
+        return entry
+
+    collection = "MSP" if link.domain == "msp" else "Max"
+    entry["collection"] = f"{collection} {link.kind.title()}s"
+    entry["page"] = urlsplit(link.url).path.rstrip("/").rsplit("/", 1)[-1]
+
+    # "MSP Basics Tutorial 1: Test Tone" -> series and chapter
+    chapter = CHAPTER_PATTERN.match(link.name)
+    if chapter:
+        entry["series"] = chapter.group(1)
+        entry["chapter"] = int(chapter.group(2))
+    return entry
@@ -0,0 +1,97 @@
+"""
+LRU Cache
+
+Bounded in-memory cache with least-recently-used eviction and an
+optional time-to-live, plus hit/miss counters for monitoring.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class LRUCache(Generic[V]):
+    """
+    Mapping of at most max_size entries, each valid for ttl seconds.
+
+    Lookups refresh an entry's recency but not its age; an entry
+    expires ttl seconds after it was stored.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max(1, max_size)
+        self.ttl = ttl
+        self.clock = clock
+
+        # key -> (value, stored at)
+        self._entries: "OrderedDict[Hashable, Tuple[V, float]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Return the cached value, counting the lookup as a hit or miss"""
+        item = self._entries.get(key, _MISSING)
+        if item is _MISSING:
+            self.misses += 1
+            return default
+
+        value, stored_at = item
+        if self.ttl is not None and self.clock() - stored_at > self.ttl:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: V):
+        """Store a value, evicting the least recently used entries beyond max_size"""
+        self._entries[key] = (value, self.clock())
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop one entry, returning whether it was cached"""
+        if self._entries.pop(key, _MISSING) is _MISSING:
+            return False
+        self.invalidations += 1
+        return True
+
+    def clear(self):
+        """Drop every entry"""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and occupancy"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        item = self._entries.get(key)
+        return item is not None and (self.ttl is None or self.clock() - item[1] <= self.ttl)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -6,18 +6,84 @@ our accumulated knowledge, patterns, and discoveries.
 """
 
 import asyncio
+import heapq
 import json
 import logging
-import re
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import aiofiles
 from git import Repo
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; the working tree is polled instead
+    FileSystemEventHandler = object
+    Observer = None
+
+from .index_records import IndexRecord, PassageRecord
+from .minutiae_indexers import (
+    FALLBACK_OBJECTS,
+    PASSAGE_FIELDS,
+    ParsedFile,
+    parse_batch,
+    parse_javascript,
+    parse_json,
+    parse_markdown,
+    parse_maxpat,
+    set_tagger,
+)
+from .object_tagger import ObjectTagger
+from .search_index import InvertedIndex, tokenize
+
 logger = logging.getLogger(__name__)
 
+# BM25F field weights for minutiae entries
+SEARCH_FIELD_WEIGHTS = {
+    "name": 3.0,
+    "description": 1.5,
+    "tags": 2.0,
+    "file_path": 0.5,
+}
+
+# BM25F field weights for passages, in PASSAGE_FIELDS order
+PASSAGE_FIELD_WEIGHTS = dict(zip(PASSAGE_FIELDS, (2.0, 1.0)))
+
+# Score at which a BM25F match maps to relevance 0.5
+BM25_SATURATION = 2.0
+
+# Share of an entry's best passage score added to its own score
+PASSAGE_SCORE_WEIGHT = 0.5
+
+# Bump whenever the indexed entry layout changes so old snapshots are ignored
+INDEX_VERSION = 7
+SNAPSHOT_MAGIC = b"MINUTIAE-INDEX\n"
+
+
+class _WorkingTreeHandler(FileSystemEventHandler):
+    """Forwards watchdog events from the observer thread to the event loop"""
+
+    def __init__(self, callback, loop: asyncio.AbstractEventLoop):
+        self.callback = callback
+        self.loop = loop
+
+    def on_any_event(self, event):
+        if event.event_type in ("opened", "closed_no_write"):
+            return
+        # A directory is "modified" whenever an entry inside it is created, deleted or renamed;
+        # those entries carry their own events
+        if event.is_directory and event.event_type == "modified":
+            return
+
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path:
+                self.loop.call_soon_threadsafe(self.callback, os.fsdecode(path), event.is_directory)
+
 
 class MinutiaeConnector:
     """
@@ -34,8 +100,24 @@ class MinutiaeConnector:
         self.update_interval = config.get("update_interval", 300)
         self.watch_for_changes = config.get("watch_for_changes", True)
 
+        # Offline mode never fetches from remotes (air-gapped deployments)
+        self.offline = config.get("offline", False)
+
+        # Working tree watching: "auto" (filesystem events when watchdog is installed), "events" or "poll"
+        self.watch_mode = config.get("watch_mode", "auto")
+        self.debounce_interval = config.get("debounce_interval", 0.25)
+        self.poll_interval = config.get("poll_interval", 2.0)
+        self.snapshot_enabled = config.get("index_snapshot", True)
+        self.snapshot_path = Path(config.get("snapshot_path", "./cache/minutiae/index_snapshot.pkl"))
+        self.snapshot_delay = config.get("snapshot_delay", 5.0)
+
+        # Parallel parsing: "process" or "thread" pool, files per batch and worker count
+        self.index_executor = config.get("index_executor", "process")
+        self.index_batch_size = max(1, config.get("index_batch_size", 32))
+        self.index_workers = config.get("index_workers") or os.cpu_count() or 1
+
         # Knowledge index
-        self.knowledge_index: Dict[str, List[Dict[str, Any]]] = {
+        self.knowledge_index: Dict[str, List[IndexRecord]] = {
             "patterns": [],
             "objects": [],
             "techniques": [],
@@ -43,12 +125,27 @@ class MinutiaeConnector:
             "temporal": [],
         }
 
+        # Inverted index over all entries, keyed by entry id
+        self.search_index = InvertedIndex(SEARCH_FIELD_WEIGHTS)
+        self.entries: Dict[int, IndexRecord] = {}
+        self.path_entries: Dict[str, List[int]] = {}
+        self._next_entry_id = 0
+
+        # Passage index over markdown sections; text stays on disk
+        self.passage_index = InvertedIndex(PASSAGE_FIELD_WEIGHTS)
+        self.passages: Dict[int, PassageRecord] = {}
+        self.entry_passages: Dict[int, Tuple[int, ...]] = {}
+        self._next_passage_id = 0
+
+        # (mtime_ns, size) of every indexed file when it was last read, to reconcile snapshots with the working tree
+        self.file_stats: Dict[str, Tuple[int, int]] = {}
+
         # File patterns to index
         self.index_patterns = {
-            "*.md": self._index_markdown,
-            "*.maxpat": self._index_maxpat,
-            "*.js": self._index_javascript,
-            "*.json": self._index_json,
+            "*.md": parse_markdown,
+            "*.maxpat": parse_maxpat,
+            "*.js": parse_javascript,
+            "*.json": parse_json,
         }
 
         # Important directories in the repository
@@ -60,10 +157,33 @@ class MinutiaeConnector:
             "presets": "Preset patterns and templates",
         }
 
+        # Important root-level files
+        self.root_files = ["README.md", "DISCOVERIES.md", "PATTERNS.md"]
+
+        # Directory names never descended into while walking the repository
+        self.ignore_dirs: Set[str] = set(config.get("ignore_dirs", [".git", "cache", "node_modules", "__pycache__"]))
+        self.index_suffixes = {pattern.lstrip("*") for pattern in self.index_patterns}
+
+        # Object/concept tagger for markdown, replaced once the Cycling '74 catalog is known
+        self.tagger = ObjectTagger(FALLBACK_OBJECTS)
+
         # Git repository handle
         self.repo: Optional[Repo] = None
         self.last_commit_hash: Optional[str] = None
 
+        # Bumped on every index change, so callers can drop results computed from an older index
+        self.index_generation = 0
+
+        # Watcher state; index updates are serialized so debounced batches apply in order
+        self._index_lock = asyncio.Lock()
+        self._observer = None
+        self._watch_tasks: List[asyncio.Task] = []
+        self._pending_paths: Set[str] = set()
+        self._pending_dirs: Set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._snapshot_handle: Optional[asyncio.TimerHandle] = None
+        self._snapshot_task: Optional[asyncio.Task] = None
+
         logger.info(f"Minutiae Connector initialized with repo path: {self.repo_path}")
 
     async def initialize(self):
@@ -73,12 +193,18 @@ class MinutiaeConnector:
             self.repo = Repo(self.repo_path)
             self.last_commit_hash = self.repo.head.commit.hexsha
 
-            # Build initial index
-            await self._build_index()
+            # Reuse the on-disk snapshot when it matches HEAD, catching up on working tree edits,
+            # otherwise build from scratch
+            if self._load_snapshot(self.last_commit_hash):
+                await self._reconcile_working_tree()
+            else:
+                await self._build_index()
+                await self._save_snapshot()
 
             # Start watching for changes if enabled
             if self.watch_for_changes:
-                asyncio.create_task(self._watch_repository())
+                self._watch_tasks.append(asyncio.create_task(self._watch_working_tree()))
+                self._watch_tasks.append(asyncio.create_task(self._watch_repository()))
 
             logger.info(f"Minutiae repository indexed: {len(self.knowledge_index['patterns'])} patterns found")
 
@@ -86,6 +212,39 @@ class MinutiaeConnector:
             logger.error(f"Error initializing Minutiae connector: {e}")
             raise
 
+    async def close(self):
+        """Stop watching the repository"""
+        self.watch_for_changes = False
+
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        for task in self._watch_tasks:
+            task.cancel()
+        self._watch_tasks.clear()
+
+        if self._observer:
+            observer, self._observer = self._observer, None
+            observer.stop()
+            await asyncio.get_running_loop().run_in_executor(None, observer.join)
+
+        # Write out a snapshot still waiting on its debounce, so edits survive the restart
+        if self._snapshot_handle:
+            self._snapshot_handle.cancel()
+            self._snapshot_handle = None
+            await self._save_snapshot()
+        elif self._snapshot_task:
+            await self._snapshot_task
+
+    def set_object_catalog(self, object_names: Iterable[str]):
+        """
+        Tag markdown against a full Max object catalog.
+
+        Must be called before initialize() for the catalog to apply to
+        the initial index.
+        """
+        self.tagger = ObjectTagger(object_names)
+        logger.info(f"Object tagger built with {self.tagger.object_count} object names")
+
     async def search(self, query: str, context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Search the minutiae repository for relevant content.
@@ -97,35 +256,202 @@ class MinutiaeConnector:
         Returns:
             List of relevant knowledge entries
         """
-        results = []
-        query_lower = query.lower()
-        query_tokens = set(query_lower.split())
+        return (await self.search_many([query], context))[0]
+
+    async def search_many(
+        self, queries: Sequence[str], context: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several queries in one pass.
+
+        Each distinct token is scored once across the batch, and entries
+        found by several queries are materialized once.
+
+        Returns:
+            One result list per query, as search() would return it
+        """
+        ranked = self._rank_many(queries, context, 50)
+        entry_ids = list(dict.fromkeys(entry_id for hits, _ in ranked for entry_id, _ in hits))
+        hydrated = dict(zip(entry_ids, await self.hydrate_many(entry_ids)))
+
+        batch_results = []
+        for hits, best_passages in ranked:
+            results = []
+            for entry_id, relevance in hits:
+                result = dict(hydrated[entry_id], relevance=relevance)
+                passage_id = best_passages.get(entry_id)
+                if passage_id is not None:
+                    result["matching_passage"] = self._passage_location(self.passages[passage_id])
+                results.append(result)
+            batch_results.append(results)
+        return batch_results
+
+    def search_hits(
+        self, query: str, context: Optional[Dict[str, Any]] = None, limit: int = 50
+    ) -> List[Tuple[int, float]]:
+        """
+        Rank entries without materializing them.
+
+        Returns:
+            (entry_id, relevance) pairs, best first
+        """
+        return self._rank(query, context, limit)[0]
+
+    async def search_passages(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search markdown sections rather than whole files.
+
+        Passage text is read back from the working tree; it is None when
+        the file changed since it was indexed.
+
+        Returns:
+            Passage dictionaries with file, heading, anchor and text, best first
+        """
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
 
-        # Search all knowledge categories
-        for category, entries in self.knowledge_index.items():
-            for entry in entries:
-                relevance = self._calculate_relevance(entry, query_lower, query_tokens)
+        scores = self.passage_index.score(query_tokens)
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        passages = [self.passages[passage_id] for passage_id, _ in top]
+        texts = await asyncio.get_running_loop().run_in_executor(None, self._read_passages, passages)
+
+        results = []
+        for (passage_id, score), passage, text in zip(top, passages, texts):
+            record = self.entries[passage.entry_id]
+            result = self._passage_location(passage)
+            result.update(
+                {
+                    "file_path": record.file_path,
+                    "title": record.title,
+                    "category": record.category,
+                    "relevance": score / (score + BM25_SATURATION),
+                    "text": text,
+                }
+            )
+            results.append(result)
+        return results
+
+    def _rank(
+        self, query: str, context: Optional[Dict[str, Any]], limit: int
+    ) -> Tuple[List[Tuple[int, float]], Dict[int, int]]:
+        """Score entries and passages, returning the top hits and each entry's best passage"""
+        return self._rank_many([query], context, limit)[0]
+
+    def _rank_many(
+        self, queries: Sequence[str], context: Optional[Dict[str, Any]], limit: int
+    ) -> List[Tuple[List[Tuple[int, float]], Dict[int, int]]]:
+        """Rank several queries, scoring each distinct token once"""
+        token_lists = [tokenize(query) for query in queries]
+
+        # Only entries sharing a token (or token prefix) with a query are scored
+        entry_scores = self.search_index.score_many(token_lists)
+        passage_scores = self.passage_index.score_many(token_lists)
+
+        now = datetime.now().timestamp()
+        ranked = []
+        for query_tokens, scores, query_passage_scores in zip(token_lists, entry_scores, passage_scores):
+            if not query_tokens:
+                ranked.append(([], {}))
+                continue
+
+            # Content deep inside a document surfaces the document through its best passage
+            best_passages: Dict[int, int] = {}
+            best_scores: Dict[int, float] = {}
+            for passage_id, score in query_passage_scores.items():
+                entry_id = self.passages[passage_id].entry_id
+                if score > best_scores.get(entry_id, 0.0):
+                    best_scores[entry_id] = score
+                    best_passages[entry_id] = passage_id
+            for entry_id, score in best_scores.items():
+                scores[entry_id] = scores.get(entry_id, 0.0) + PASSAGE_SCORE_WEIGHT * score
+
+            scored = []
+            for entry_id, score in scores.items():
+                record = self.entries[entry_id]
+                relevance = self._calculate_relevance(record, score, now)
 
                 # Apply context-based boosting
                 if context:
-                    relevance = self._apply_context_boost(entry, relevance, context)
+                    relevance = self._apply_context_boost(record, relevance, context)
 
                 if relevance > 0.1:  # Threshold
-                    result = entry.copy()
-                    result["relevance"] = relevance
-                    result["category"] = category
-                    results.append(result)
-
-        # Sort by relevance
-        results.sort(key=lambda x: x["relevance"], reverse=True)
-
-        return results[:50]  # Top 50 results
+                    scored.append((relevance, entry_id))
+
+            hits = [(entry_id, relevance) for relevance, entry_id in heapq.nlargest(limit, scored)]
+            ranked.append((hits, best_passages))
+
+        return ranked
+
+    async def hydrate(self, entry_id: int, relevance: Optional[float] = None) -> Dict[str, Any]:
+        """Materialize an indexed entry as a result dictionary"""
+        result = (await self.hydrate_many([entry_id]))[0]
+        if relevance is not None:
+            result["relevance"] = relevance
+        return result
+
+    async def hydrate_many(self, entry_ids: Sequence[int]) -> List[Dict[str, Any]]:
+        """Materialize several entries, reading their files back once off the event loop"""
+        records = [self.entries[entry_id] for entry_id in entry_ids]
+        results = await self._to_dicts(records)
+        for record, result in zip(records, results):
+            result["category"] = record.category
+        return results
+
+    async def _to_dicts(self, records: List[IndexRecord]) -> List[Dict[str, Any]]:
+        """Entry dictionaries of records, with previews and code examples read from their files"""
+        with_text = [record for record in records if record.has_text]
+        texts: Dict[int, Optional[Dict[str, Any]]] = {}
+        if with_text:
+            loaded = await asyncio.get_running_loop().run_in_executor(None, self._read_texts, with_text)
+            texts = {record.entry_id: text for record, text in zip(with_text, loaded)}
+        return [record.to_dict(texts.get(record.entry_id)) for record in records]
+
+    @staticmethod
+    def _passage_location(passage: PassageRecord) -> Dict[str, Any]:
+        return {"heading": passage.heading, "anchor": passage.anchor, "start": passage.start, "end": passage.end}
+
+    def _read_indexed(self, record: IndexRecord) -> Optional[bytes]:
+        """Contents of a record's file, or None when it changed since indexing"""
+        file_path = self.repo_path / record.file_path
+        try:
+            if record.modified is None or abs(file_path.stat().st_mtime - record.modified) > 1e-3:
+                return None
+            with open(file_path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _read_texts(self, records: List[IndexRecord]) -> List[Optional[Dict[str, Any]]]:
+        """Read back the preview and code examples of records, skipping files modified since indexing"""
+        texts: List[Optional[Dict[str, Any]]] = []
+        for record in records:
+            raw = self._read_indexed(record)
+            texts.append(record.load_text(raw) if raw is not None else None)
+        return texts
+
+    def _read_passages(self, passages: List[PassageRecord]) -> List[Optional[str]]:
+        """Read passage text by byte range, skipping files modified since indexing"""
+        texts: List[Optional[str]] = []
+        for passage in passages:
+            record = self.entries[passage.entry_id]
+            file_path = self.repo_path / record.file_path
+            try:
+                if record.modified is None or abs(file_path.stat().st_mtime - record.modified) > 1e-3:
+                    texts.append(None)
+                    continue
+                with open(file_path, "rb") as f:
+                    f.seek(passage.start)
+                    texts.append(f.read(passage.end - passage.start).decode("utf-8", "replace"))
+            except OSError:
+                texts.append(None)
+        return texts
 
     async def get_pattern(self, pattern_name: str) -> Optional[Dict[str, Any]]:
         """Get a specific pattern by name"""
-        for pattern in self.knowledge_index["patterns"]:
-            if pattern.get("name") == pattern_name:
-                return pattern
+        for record in self.knowledge_index["patterns"]:
+            if record.name == pattern_name:
+                return (await self._to_dicts([record]))[0]
         return None
 
     async def add_pattern(self, pattern: Any) -> bool:
@@ -175,11 +501,13 @@ class MinutiaeConnector:
 
     async def get_temporal_scaffolding_examples(self) -> List[Dict[str, Any]]:
         """Get all temporal scaffolding examples"""
-        return [entry for entry in self.knowledge_index["temporal"] if "scaffolding" in entry.get("tags", [])]
+        return await self._to_dicts(
+            [record for record in self.knowledge_index["temporal"] if "scaffolding" in record.tags]
+        )
 
     async def get_jsui_templates(self) -> List[Dict[str, Any]]:
         """Get all JSUI templates and examples"""
-        return self.knowledge_index["jsui"]
+        return await self._to_dicts(self.knowledge_index["jsui"])
 
     # Private methods
 
@@ -187,318 +515,392 @@ class MinutiaeConnector:
         """Build the knowledge index from repository files"""
         logger.info("Building knowledge index...")
 
-        # Index key directories
-        for dir_path, description in self.key_directories.items():
-            full_path = self.repo_path / dir_path
-            if full_path.exists():
-                await self._index_directory(full_path, description)
+        async with self._index_lock:
+            # Index key directories and root-level important files
+            loop = asyncio.get_running_loop()
+            files = await loop.run_in_executor(None, self._collect_files)
+            # Stat before reading, so an edit racing the build shows up as a change later
+            stats = await loop.run_in_executor(None, self._stat_files, files)
+            parsed = await self._parse_files(files)
 
-        # Also index root-level important files
-        await self._index_root_files()
+            # Swap the new entries in at once so queries never see a half-built index
+            self._reset_index()
+            self._merge_parsed(parsed)
+            self.file_stats = stats
 
         logger.info(f"Index built: {sum(len(v) for v in self.knowledge_index.values())} total entries")
 
-    async def _index_directory(self, directory: Path, description: str):
-        """Index all relevant files in a directory"""
-        for pattern, indexer in self.index_patterns.items():
-            for file_path in directory.rglob(pattern):
-                try:
-                    await self._index_file(file_path)
-                except Exception as e:
-                    logger.error(f"Error indexing {file_path}: {e}")
+    def _collect_files(self) -> List[Path]:
+        """
+        Collect indexable files in a single os.scandir walk of the repository.
+
+        Only key directories (and the directories leading to them) are
+        descended into, ignored directories are pruned, and files reachable
+        through several paths (symlinks, overlapping key directories) are
+        returned once.
+        """
+        key_dirs = [directory.strip("/") for directory in self.key_directories]
+        seen_files: Set[str] = set()
+        seen_dirs: Set[str] = set()
+        files: List[Path] = []
+
+        stack = [("", str(self.repo_path))]
+        while stack:
+            rel_dir, directory = stack.pop()
+
+            real_dir = os.path.realpath(directory)
+            if real_dir in seen_dirs:
+                continue
+            seen_dirs.add(real_dir)
+
+            in_key_dir = any(rel_dir == key or rel_dir.startswith(f"{key}/") for key in key_dirs)
+
+            try:
+                with os.scandir(directory) as scanner:
+                    for item in scanner:
+                        rel_path = f"{rel_dir}/{item.name}" if rel_dir else item.name
+
+                        if item.is_dir():
+                            if item.name in self.ignore_dirs:
+                                continue
+                            if in_key_dir or any(
+                                key == rel_path or key.startswith(f"{rel_path}/") or rel_path.startswith(f"{key}/")
+                                for key in key_dirs
+                            ):
+                                stack.append((rel_path, item.path))
+
+                        elif item.is_file():
+                            if not (in_key_dir or rel_path in self.root_files):
+                                continue
+                            if os.path.splitext(item.name)[1].lower() not in self.index_suffixes:
+                                continue
+
+                            real_path = os.path.realpath(item.path)
+                            if real_path not in seen_files:
+                                seen_files.add(real_path)
+                                files.append(Path(item.path))
+
+            except OSError as e:
+                logger.warning(f"Error scanning {directory}: {e}")
+
+        return files
 
     async def _index_file(self, file_path: Path):
         """Index a single file based on its type"""
-        suffix = file_path.suffix.lower()
-
-        if suffix == ".md":
-            await self._index_markdown(file_path)
-        elif suffix == ".maxpat":
-            await self._index_maxpat(file_path)
-        elif suffix == ".js":
-            await self._index_javascript(file_path)
-        elif suffix == ".json":
-            await self._index_json(file_path)
-
-    async def _index_markdown(self, file_path: Path):
-        """Index a markdown file"""
-        try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                content = await f.read()
-
-            # Extract metadata
-            entry = {
-                "file_path": str(file_path.relative_to(self.repo_path)),
-                "type": "markdown",
-                "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
-            }
-
-            # Extract title
-            title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-            if title_match:
-                entry["title"] = title_match.group(1)
-                entry["name"] = title_match.group(1)
-
-            # Extract description (first paragraph after title)
-            desc_match = re.search(r"^#\s+.+\n\n(.+?)(?:\n\n|$)", content, re.MULTILINE | re.DOTALL)
-            if desc_match:
-                entry["description"] = desc_match.group(1).strip()
-
-            # Extract code blocks
-            code_blocks = re.findall(r"```(\w+)?\n(.*?)\n```", content, re.DOTALL)
-            entry["code_examples"] = [{"language": lang or "text", "code": code} for lang, code in code_blocks]
-
-            # Extract tags from content
-            tags = set()
-
-            # Common Max objects mentioned
-            max_objects = re.findall(r"\b([a-z]+~?)\b(?:\s+object|\s+is|\s+the)", content.lower())
-            tags.update(obj for obj in max_objects if self._is_likely_max_object(obj))
-
-            # Key concepts
-            if "temporal" in content.lower():
-                tags.add("temporal")
-            if "scaffolding" in content.lower():
-                tags.add("scaffolding")
-            if "jsui" in content.lower():
-                tags.add("jsui")
-            if "buffer" in content.lower():
-                tags.add("buffer")
-            if "sample" in content.lower():
-                tags.add("sample")
-
-            entry["tags"] = list(tags)
-            entry["content_preview"] = content[:500]
-
-            # Categorize
-            category = self._categorize_entry(file_path, entry)
-            self.knowledge_index[category].append(entry)
+        async with self._index_lock:
+            self._merge_parsed(await self._parse_files([file_path]))
 
-        except Exception as e:
-            logger.error(f"Error indexing markdown {file_path}: {e}")
+    async def _parse_files(self, files: List[Path]) -> List[ParsedFile]:
+        """
+        Read and parse files off the event loop.
 
-    async def _index_maxpat(self, file_path: Path):
-        """Index a Max patcher file"""
+        Files are split into batches which run concurrently on a worker
+        pool; results are returned once every batch has completed.
+        """
+        if not files:
+            return []
+
+        pairs = [(str(path), str(path.relative_to(self.repo_path))) for path in files]
+        batches = [pairs[i : i + self.index_batch_size] for i in range(0, len(pairs), self.index_batch_size)]
+
+        loop = asyncio.get_running_loop()
+        set_tagger(self.tagger)
+        executor = self._create_executor(len(batches))
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                content = await f.read()
-                patcher_data = json.loads(content)
-
-            entry = {
-                "file_path": str(file_path.relative_to(self.repo_path)),
-                "type": "maxpat",
-                "name": file_path.stem,
-                "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
-            }
-
-            # Extract patcher info
-            patcher = patcher_data.get("patcher", {})
-
-            # Count objects by type
-            object_counts = {}
-            for box in patcher.get("boxes", []):
-                obj_class = box.get("class", "unknown")
-                object_counts[obj_class] = object_counts.get(obj_class, 0) + 1
-
-            entry["object_counts"] = object_counts
-            entry["total_objects"] = sum(object_counts.values())
-            entry["unique_objects"] = list(object_counts.keys())
-
-            # Detect patterns
-            patterns = []
-            if "metro" in object_counts and "counter" in object_counts:
-                patterns.append("timing-counter")
-            if "buffer~" in object_counts and "groove~" in object_counts:
-                patterns.append("sample-playback")
-            if "jsui" in object_counts:
-                patterns.append("custom-ui")
-
-            entry["patterns"] = patterns
-            entry["tags"] = list(set(patterns + list(object_counts.keys())[:5]))
-
-            # Add description based on content
-            if patterns:
-                entry["description"] = f"Max patcher demonstrating: {', '.join(patterns)}"
-            else:
-                entry["description"] = f"Max patcher with {entry['total_objects']} objects"
+            futures = [loop.run_in_executor(executor, parse_batch, batch) for batch in batches]
+            parsed: List[ParsedFile] = []
+            for future in asyncio.as_completed(futures):
+                parsed.extend(await future)
+            return parsed
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def _create_executor(self, batch_count: int) -> Optional[Executor]:
+        """Pick a worker pool for parsing; small jobs use the loop's default executor"""
+        if batch_count <= 1 or self.index_workers <= 1:
+            return None
+
+        workers = min(self.index_workers, batch_count)
+        if self.index_executor == "process":
+            try:
+                return ProcessPoolExecutor(max_workers=workers, initializer=set_tagger, initargs=(self.tagger,))
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Process pool unavailable ({e}), parsing on threads")
+
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="minutiae-index")
+
+    def _merge_parsed(self, parsed: List[ParsedFile]):
+        """Replace the index entries of each parsed file"""
+        for rel_path, entries, error in parsed:
+            # Replace whatever was indexed for this file before
+            self._remove_path(rel_path)
+
+            if error:
+                logger.error(f"Error indexing {rel_path}: {error}")
+                continue
+
+            for category, entry in entries:
+                self._add_entry(category, entry)
+
+    def _add_entry(self, category: str, entry: Dict[str, Any]) -> int:
+        """Register an entry in its category and in the search index"""
+        entry_id = self._next_entry_id
+        self._next_entry_id += 1
+        self.index_generation += 1
+
+        passages = entry.pop("passages", ())
+        record = IndexRecord(entry_id, category, entry)
+        self.knowledge_index[category].append(record)
+        self.entries[entry_id] = record
+        self.path_entries.setdefault(record.file_path, []).append(entry_id)
+        self.search_index.add(
+            entry_id,
+            {
+                "name": record.name or "",
+                "description": record.description or "",
+                "tags": " ".join(record.tags),
+                "file_path": record.file_path,
+            },
+        )
+
+        passage_ids = []
+        for passage in passages:
+            passage_id = self._next_passage_id
+            self._next_passage_id += 1
+            self.passages[passage_id] = PassageRecord(
+                entry_id, passage["heading"], passage["anchor"], passage["start"], passage["end"]
+            )
+            self.passage_index.add_analyzed(passage_id, passage["terms"])
+            passage_ids.append(passage_id)
+        if passage_ids:
+            self.entry_passages[entry_id] = tuple(passage_ids)
+
+        return entry_id
+
+    def _remove_path(self, rel_path: str) -> int:
+        """Drop every entry indexed from a file, returning how many were removed"""
+        entry_ids = self.path_entries.pop(rel_path, None)
+        if not entry_ids:
+            return 0
+        self.index_generation += 1
+
+        removed_by_category: Dict[str, Set[int]] = {}
+        for entry_id in entry_ids:
+            record = self.entries.pop(entry_id)
+            removed_by_category.setdefault(record.category, set()).add(entry_id)
+            self.search_index.remove(entry_id)
+            for passage_id in self.entry_passages.pop(entry_id, ()):
+                del self.passages[passage_id]
+                self.passage_index.remove(passage_id)
+
+        for category, removed in removed_by_category.items():
+            self.knowledge_index[category] = [
+                record for record in self.knowledge_index[category] if record.entry_id not in removed
+            ]
+
+        return len(entry_ids)
+
+    def _reset_index(self):
+        """Clear all indexed entries"""
+        self.index_generation += 1
+        for entries in self.knowledge_index.values():
+            entries.clear()
+        self.entries.clear()
+        self.path_entries.clear()
+        self.search_index.clear()
+        self.passages.clear()
+        self.entry_passages.clear()
+        self.passage_index.clear()
+        self.file_stats.clear()
+
+    def _snapshot_state(self) -> Dict[str, Any]:
+        """Collect every structure needed to restore the index"""
+        return {
+            "knowledge_index": self.knowledge_index,
+            "entries": self.entries,
+            "path_entries": self.path_entries,
+            "next_entry_id": self._next_entry_id,
+            "search_index": self.search_index,
+            "passages": self.passages,
+            "entry_passages": self.entry_passages,
+            "next_passage_id": self._next_passage_id,
+            "passage_index": self.passage_index,
+            "file_stats": self.file_stats,
+        }
 
-            # Categorize
-            if "jsui" in object_counts:
-                self.knowledge_index["jsui"].append(entry)
-            elif any(p in patterns for p in ["timing-counter", "tempo"]):
-                self.knowledge_index["temporal"].append(entry)
-            else:
-                self.knowledge_index["patterns"].append(entry)
+    def _snapshot_header(self, commit_hash: str) -> bytes:
+        """Snapshot key: indexer version, commit and the object catalog used for tagging"""
+        header = {"version": INDEX_VERSION, "commit": commit_hash, "catalog": self.tagger.fingerprint}
+        return json.dumps(header, sort_keys=True).encode() + b"\n"
 
-        except Exception as e:
-            logger.error(f"Error indexing maxpat {file_path}: {e}")
+    async def _save_snapshot(self):
+        """Persist the current index keyed by commit hash and indexer version"""
+        if not self.snapshot_enabled or not self.last_commit_hash:
+            return
 
-    async def _index_javascript(self, file_path: Path):
-        """Index a JavaScript file (likely for jsui)"""
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                content = await f.read()
-
-            entry = {
-                "file_path": str(file_path.relative_to(self.repo_path)),
-                "type": "javascript",
-                "name": file_path.stem,
-                "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
-            }
-
-            # Extract function definitions
-            functions = re.findall(r"function\s+(\w+)\s*\([^)]*\)", content)
-            entry["functions"] = functions
-
-            # Look for Max-specific patterns
-            if "mgraphics" in content:
-                entry["tags"] = ["jsui", "graphics"]
-                entry["description"] = "JSUI graphics script"
-                self.knowledge_index["jsui"].append(entry)
-            elif "outlet" in content or "inlet" in content:
-                entry["tags"] = ["js", "max-integration"]
-                entry["description"] = "Max JavaScript integration"
-                self.knowledge_index["objects"].append(entry)
+            # Every index change takes the lock, so the index cannot change while the executor pickles it
+            async with self._index_lock:
+                header = self._snapshot_header(self.last_commit_hash)
+                state = self._snapshot_state()
+                await asyncio.get_running_loop().run_in_executor(None, self._write_snapshot, header, state)
+            logger.debug(f"Index snapshot saved for commit {self.last_commit_hash[:8]}")
 
         except Exception as e:
-            logger.error(f"Error indexing JavaScript {file_path}: {e}")
+            logger.error(f"Error saving index snapshot: {e}")
+
+    def _write_snapshot(self, header: bytes, state: Dict[str, Any]):
+        """Pickle the index state to the snapshot file, replacing it atomically"""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(header)
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.snapshot_path)
+
+    def _schedule_snapshot(self):
+        """Save the snapshot once changes have been quiet for snapshot_delay, so a burst of edits writes once"""
+        if not self.snapshot_enabled:
+            return
+
+        if self._snapshot_handle:
+            self._snapshot_handle.cancel()
+        self._snapshot_handle = asyncio.get_running_loop().call_later(self.snapshot_delay, self._start_snapshot)
+
+    def _start_snapshot(self):
+        """Debounce timer callback: run the save as a task"""
+        self._snapshot_handle = None
+        self._snapshot_task = asyncio.ensure_future(self._save_snapshot())
+
+    def _load_snapshot(self, commit_hash: str) -> bool:
+        """
+        Restore the index from a snapshot matching commit_hash, if one exists.
+
+        The snapshot is unpickled, so snapshot_path must be in a cache
+        directory that only this server can write to.
+        """
+        if not self.snapshot_enabled or not self.snapshot_path.exists():
+            return False
 
-    async def _index_json(self, file_path: Path):
-        """Index a JSON file"""
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                content = await f.read()
-                json.loads(content)  # Validate JSON format
-
-            entry = {
-                "file_path": str(file_path.relative_to(self.repo_path)),
-                "type": "json",
-                "name": file_path.stem,
-                "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
-            }
-
-            # Check if it's a preset or configuration
-            if "preset" in file_path.stem.lower():
-                entry["tags"] = ["preset", "configuration"]
-                entry["description"] = f"Preset configuration: {file_path.stem}"
-                self.knowledge_index["patterns"].append(entry)
+            with open(self.snapshot_path, "rb") as f:
+                if f.readline() != SNAPSHOT_MAGIC:
+                    return False
+                if f.readline() != self._snapshot_header(commit_hash):
+                    logger.info("Index snapshot is stale, rebuilding")
+                    return False
+
+                state = pickle.load(f)
+
+            self.knowledge_index = state["knowledge_index"]
+            self.entries = state["entries"]
+            self.path_entries = state["path_entries"]
+            self._next_entry_id = state["next_entry_id"]
+            self.search_index = state["search_index"]
+            self.passages = state["passages"]
+            self.entry_passages = state["entry_passages"]
+            self._next_passage_id = state["next_passage_id"]
+            self.passage_index = state["passage_index"]
+            self.file_stats = state["file_stats"]
+            self.index_generation += 1
+
+            logger.info(f"Loaded index snapshot for commit {commit_hash[:8]}: {len(self.entries)} entries")
+            return True
 
         except Exception as e:
-            logger.error(f"Error indexing JSON {file_path}: {e}")
-
-    async def _index_root_files(self):
-        """Index important root-level files"""
-        important_files = ["README.md", "DISCOVERIES.md", "PATTERNS.md"]
-
-        for filename in important_files:
-            file_path = self.repo_path / filename
-            if file_path.exists():
-                await self._index_file(file_path)
-
-    def _categorize_entry(self, file_path: Path, entry: Dict[str, Any]) -> str:
-        """Categorize an entry based on its path and content"""
-        path_str = str(file_path).lower()
-
-        if "temporal" in path_str or "scaffolding" in path_str:
-            return "temporal"
-        elif "jsui" in path_str:
-            return "jsui"
-        elif "sample" in path_str or "buffer" in path_str:
-            return "techniques"
-        elif "meta-programming" in path_str:
-            return "patterns"
-        else:
-            # Default based on tags
-            tags = entry.get("tags", [])
-            if "temporal" in tags:
-                return "temporal"
-            elif "jsui" in tags:
-                return "jsui"
-            else:
-                return "patterns"
-
-    def _calculate_relevance(self, entry: Dict[str, Any], query_lower: str, query_tokens: Set[str]) -> float:
-        """Calculate relevance score for a search result"""
-        relevance = 0.0
-
-        # Title/name match
-        name = entry.get("name", "").lower()
-        if query_lower in name:
-            relevance += 0.5
-        elif any(token in name for token in query_tokens):
-            relevance += 0.3
-
-        # Description match
-        desc = entry.get("description", "").lower()
-        if query_lower in desc:
-            relevance += 0.3
-        elif any(token in desc for token in query_tokens):
-            relevance += 0.2
-
-        # Tag match
-        tags = [t.lower() for t in entry.get("tags", [])]
-        matching_tags = sum(1 for token in query_tokens if any(token in tag for tag in tags))
-        relevance += matching_tags * 0.1
-
-        # File path match
-        file_path = entry.get("file_path", "").lower()
-        if any(token in file_path for token in query_tokens):
-            relevance += 0.1
+            logger.warning(f"Error loading index snapshot, rebuilding: {e}")
+            return False
+
+    def _in_index_scope(self, rel_path: str) -> bool:
+        """Check whether a repository-relative path belongs in the index"""
+        if Path(rel_path).suffix.lower() not in self.index_suffixes:
+            return False
+        if rel_path in self.root_files:
+            return True
+        return any(rel_path.startswith(f"{directory}/") for directory in self.key_directories)
+
+    async def _update_index(self, old_hash: str, new_hash: str):
+        """
+        Incrementally update the index from the diff between two commits.
+
+        Only added, modified and renamed files are re-read; deleted files
+        simply drop out of the index.
+        """
+        loop = asyncio.get_running_loop()
+        diff = await loop.run_in_executor(None, lambda: self.repo.commit(old_hash).diff(new_hash))
+
+        changed: List[str] = []
+        removed: List[str] = []
+        for change in diff:
+            if change.change_type in ("D", "R") and change.a_path:
+                removed.append(change.a_path)
+            if change.change_type != "D" and change.b_path:
+                changed.append(change.b_path)
+
+        await self._reindex_paths(changed, removed)
+
+    async def _reindex_paths(self, changed: List[str], removed: List[str]):
+        """Re-index changed files and drop removed ones"""
+        async with self._index_lock:
+            removed_count = 0
+            for rel_path in removed:
+                removed_count += self._remove_path(rel_path)
+                self.file_stats.pop(rel_path, None)
+
+            files: List[Path] = []
+            stats: Dict[str, Tuple[int, int]] = {}
+            for rel_path in changed:
+                if not self._in_index_scope(rel_path):
+                    continue
+
+                file_path = self.repo_path / rel_path
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    removed_count += self._remove_path(rel_path)
+                    self.file_stats.pop(rel_path, None)
+                    continue
+                files.append(file_path)
+                stats[rel_path] = (stat.st_mtime_ns, stat.st_size)
+
+            self._merge_parsed(await self._parse_files(files))
+            self.file_stats.update(stats)
+
+        logger.info(f"Index updated: {len(files)} files re-indexed, {removed_count} entries removed")
+
+    def _calculate_relevance(self, record: IndexRecord, score: float, now: float) -> float:
+        """Map a BM25F score onto the 0..1 relevance scale"""
+        relevance = score / (score + BM25_SATURATION)
 
         # Boost recent entries slightly
-        if "modified" in entry:
-            try:
-                modified = datetime.fromisoformat(entry["modified"])
-                days_old = (datetime.now() - modified).days
-                if days_old < 30:
-                    relevance *= 1.1
-                elif days_old < 90:
-                    relevance *= 1.05
-            except:
-                pass
+        if record.modified is not None:
+            days_old = (now - record.modified) / 86400
+            if days_old < 30:
+                relevance *= 1.1
+            elif days_old < 90:
+                relevance *= 1.05
 
         return min(relevance, 1.0)  # Cap at 1.0
 
-    def _apply_context_boost(self, entry: Dict[str, Any], relevance: float, context: Dict[str, Any]) -> float:
+    def _apply_context_boost(self, record: IndexRecord, relevance: float, context: Dict[str, Any]) -> float:
         """Apply context-based relevance boosting"""
         # Boost based on current domain
         domain = context.get("domain")
         if domain:
-            tags = entry.get("tags", [])
-            if domain in tags:
+            if domain in record.tags:
                 relevance *= 1.3
 
         # Boost based on recent objects used
         recent_objects = context.get("recent_objects", [])
-        if recent_objects:
-            entry_objects = entry.get("unique_objects", [])
+        if recent_objects and record.details:
+            entry_objects = record.details.get("unique_objects", ())
             if any(obj in entry_objects for obj in recent_objects):
                 relevance *= 1.2
 
         return min(relevance, 1.0)
 
-    def _is_likely_max_object(self, name: str) -> bool:
-        """Check if a string is likely a Max object name"""
-        # Common Max object patterns
-        if name.endswith("~"):  # Audio objects
-            return True
-        if name in [
-            "metro",
-            "counter",
-            "bang",
-            "toggle",
-            "message",
-            "route",
-            "gate",
-            "sel",
-            "prepend",
-            "append",
-            "pack",
-            "unpack",
-        ]:
-            return True
-        return False
-
     def _generate_pattern_markdown(self, pattern: Any) -> str:
         """Generate markdown content for a pattern"""
         content = f"""# {pattern.name}
@@ -533,15 +935,152 @@ class MinutiaeConnector:
                 await asyncio.sleep(self.update_interval)
 
                 if self.repo and self.auto_update:
-                    # Check for new commits
-                    self.repo.remotes.origin.fetch()
+                    # Check for new commits; the fetch is network I/O, so keep it off the loop
+                    if not self.offline:
+                        await asyncio.get_running_loop().run_in_executor(None, self.repo.remotes.origin.fetch)
                     current_hash = self.repo.head.commit.hexsha
 
                     if current_hash != self.last_commit_hash:
-                        logger.info("Repository updated, rebuilding index...")
+                        logger.info("Repository updated, updating index...")
+                        previous_hash = self.last_commit_hash
                         self.last_commit_hash = current_hash
-                        await self._build_index()
+
+                        try:
+                            await self._update_index(previous_hash, current_hash)
+                        except Exception as e:
+                            # e.g. the previous commit vanished after a force-push
+                            logger.warning(f"Incremental update failed ({e}), rebuilding index...")
+                            await self._build_index()
+
+                        self._schedule_snapshot()
 
             except Exception as e:
                 logger.error(f"Error watching repository: {e}")
                 await asyncio.sleep(60)  # Wait longer on error
+
+    async def _watch_working_tree(self):
+        """Feed working tree edits to incremental re-indexing"""
+        use_events = self.watch_mode == "events" or (self.watch_mode == "auto" and Observer is not None)
+        if use_events:
+            try:
+                self._start_event_watcher()
+                return
+            except Exception as e:
+                logger.warning(f"Filesystem events unavailable ({e}), polling the working tree instead")
+
+        await self._poll_working_tree()
+
+    def _start_event_watcher(self):
+        """Watch key directories (recursively) and the repository root for file events"""
+        if Observer is None:
+            raise RuntimeError("watchdog is not installed")
+
+        handler = _WorkingTreeHandler(self._queue_change, asyncio.get_running_loop())
+        observer = Observer()
+        for directory in self.key_directories:
+            full_path = self.repo_path / directory
+            if full_path.is_dir():
+                observer.schedule(handler, str(full_path), recursive=True)
+        observer.schedule(handler, str(self.repo_path), recursive=False)
+        observer.start()
+
+        self._observer = observer
+        logger.info("Watching working tree for file events")
+
+    async def _poll_working_tree(self):
+        """Fallback watcher comparing file modification times at poll_interval"""
+        loop = asyncio.get_running_loop()
+        logger.info(f"Polling working tree every {self.poll_interval}s")
+        previous = await loop.run_in_executor(None, self._scan_file_stats)
+
+        while self.watch_for_changes:
+            try:
+                await asyncio.sleep(self.poll_interval)
+                current = await loop.run_in_executor(None, self._scan_file_stats)
+
+                for rel_path in current.keys() | previous.keys():
+                    if current.get(rel_path) != previous.get(rel_path):
+                        self._pending_paths.add(rel_path)
+                previous = current
+
+                if self._pending_paths:
+                    await self._flush_changes()
+
+            except Exception as e:
+                logger.error(f"Error polling working tree: {e}")
+
+    def _scan_file_stats(self) -> Dict[str, Tuple[int, int]]:
+        """Modification time and size of every indexable file"""
+        return self._stat_files(self._collect_files())
+
+    def _stat_files(self, files: List[Path]) -> Dict[str, Tuple[int, int]]:
+        """Repository-relative path -> (mtime_ns, size) of the given files that still exist"""
+        stats = {}
+        for file_path in files:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            stats[str(file_path.relative_to(self.repo_path))] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    async def _reconcile_working_tree(self):
+        """Re-index files added, edited or deleted since the loaded snapshot was saved"""
+        current = await asyncio.get_running_loop().run_in_executor(None, self._scan_file_stats)
+        changed = sorted(rel_path for rel_path, stat in current.items() if self.file_stats.get(rel_path) != stat)
+        removed = sorted(rel_path for rel_path in self.file_stats if rel_path not in current)
+        if not changed and not removed:
+            return
+
+        logger.info(f"Working tree differs from the index snapshot: {len(changed)} changed, {len(removed)} removed")
+        await self._reindex_paths(changed, removed)
+        await self._save_snapshot()
+
+    def _queue_change(self, path: str, is_directory: bool):
+        """Record a changed path and (re)start the debounce timer"""
+        rel_path = os.path.relpath(path, self.repo_path).replace(os.sep, "/")
+        if rel_path.startswith("..") or any(part in self.ignore_dirs for part in rel_path.split("/")):
+            return
+
+        if is_directory:
+            if rel_path == ".":
+                return
+            self._pending_dirs.add(rel_path)
+        elif self._in_index_scope(rel_path):
+            self._pending_paths.add(rel_path)
+        else:
+            return
+
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        self._flush_handle = asyncio.get_running_loop().call_later(
+            self.debounce_interval, lambda: asyncio.ensure_future(self._flush_changes())
+        )
+
+    async def _flush_changes(self):
+        """Re-index every path changed since the last flush"""
+        self._flush_handle = None
+        paths, self._pending_paths = self._pending_paths, set()
+        directories, self._pending_dirs = self._pending_dirs, set()
+
+        # Directories created, moved or deleted as a whole carry no per-file events
+        for directory in directories:
+            prefix = f"{directory}/"
+            paths.update(rel_path for rel_path in self.path_entries if rel_path.startswith(prefix))
+            full_path = self.repo_path / directory
+            if full_path.is_dir():
+                for root, dirs, filenames in os.walk(full_path):
+                    dirs[:] = [name for name in dirs if name not in self.ignore_dirs]
+                    for filename in filenames:
+                        rel_path = os.path.relpath(os.path.join(root, filename), self.repo_path).replace(os.sep, "/")
+                        if self._in_index_scope(rel_path):
+                            paths.add(rel_path)
+
+        if paths:
+            try:
+                await self._reindex_paths(sorted(paths), [])
+            except Exception as e:
+                logger.error(f"Error re-indexing changed files: {e}")
+                return
+            # Keep the snapshot in step with the working tree, so a restart does not lose these edits
+            self._schedule_snapshot()
@@ -0,0 +1,354 @@
+"""
+Minutiae File Indexers
+
+Pure parsing functions that turn repository files into knowledge index
+entries. They are kept free of connector state so that batches can be
+parsed on a process pool without blocking the event loop.
+"""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .object_tagger import ObjectTagger
+from .patcher_stream import scan_patcher
+from .search_index import analyze_fields
+
+# (category, entry) pairs produced for one file
+ParsedEntries = List[Tuple[str, Dict[str, Any]]]
+
+# (relative path, parsed entries, error message) for one file of a batch
+ParsedFile = Tuple[str, ParsedEntries, Optional[str]]
+
+TITLE_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+DESCRIPTION_PATTERN = re.compile(r"^#\s+.+\n\n(.+?)(?:\n\n|$)", re.MULTILINE | re.DOTALL)
+# Fenced code with any newline style, matched on raw bytes so offsets stay byte offsets
+CODE_BLOCK_PATTERN = re.compile(rb"```(\w+)?(?:\r\n|\r|\n)(.*?)(?:\r\n|\r|\n)```", re.DOTALL)
+JS_FUNCTION_PATTERN = re.compile(r"function\s+(\w+)\s*\([^)]*\)")
+
+# Headings and code fences, matched on raw bytes so offsets stay byte offsets
+PASSAGE_BOUNDARY_PATTERN = re.compile(rb"^(?:(```|~~~)[^\r\n]*|(#{1,6})[ \t]+(.*?)[ \t#]*)\r?$", re.MULTILINE)
+PARAGRAPH_BREAK_PATTERN = re.compile(rb"\r?\n[ \t]*\r?\n")
+ANCHOR_STRIP_PATTERN = re.compile(r"[^\w\- ]")
+
+# Fields of the passage index, in posting order
+PASSAGE_FIELDS = ("heading", "text")
+
+# Sections longer than this are split further at paragraph breaks
+MAX_PASSAGE_BYTES = 4096
+
+# Characters of markdown returned as the content preview
+PREVIEW_CHARS = 500
+
+# Objects tagged when no Cycling '74 catalog has been provided
+FALLBACK_OBJECTS = (
+    "metro",
+    "counter",
+    "bang",
+    "toggle",
+    "message",
+    "route",
+    "gate",
+    "sel",
+    "prepend",
+    "append",
+    "pack",
+    "unpack",
+    "buffer~",
+    "groove~",
+    "cycle~",
+    "dac~",
+    "adc~",
+    "line~",
+    "play~",
+    "record~",
+)
+
+# Tagger used by the parsers of this process (set per worker process)
+_tagger: Optional[ObjectTagger] = None
+
+
+def set_tagger(tagger: Optional[ObjectTagger]):
+    """Install the object tagger; also used as the process pool initializer"""
+    global _tagger
+    _tagger = tagger
+
+
+def get_tagger() -> ObjectTagger:
+    """Return the installed tagger, building the fallback one on first use"""
+    if _tagger is None:
+        set_tagger(ObjectTagger(FALLBACK_OBJECTS))
+    return _tagger
+
+
+def parse_batch(files: List[Tuple[str, str]]) -> List[ParsedFile]:
+    """
+    Read and parse a batch of files.
+
+    Args:
+        files: (absolute path, repository-relative path) pairs
+
+    Returns:
+        One (relative path, entries, error) tuple per file
+    """
+    results = []
+    for path, rel_path in files:
+        try:
+            results.append((rel_path, parse_file(Path(path), rel_path), None))
+        except Exception as e:
+            results.append((rel_path, [], str(e)))
+    return results
+
+
+def parse_file(file_path: Path, rel_path: str) -> ParsedEntries:
+    """Parse a single file based on its type"""
+    parser = FILE_PARSERS.get(file_path.suffix.lower())
+    if parser is None:
+        return []
+
+    modified = datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+    return parser(file_path, rel_path, modified)
+
+
+def read_text(file_path: Path) -> str:
+    """Read a whole text file"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def heading_anchor(heading: str, seen: Dict[str, int]) -> str:
+    """GitHub-style anchor slug, numbered when a heading repeats"""
+    slug = ANCHOR_STRIP_PATTERN.sub("", heading.strip().lower()).replace(" ", "-")
+    count = seen.get(slug, 0)
+    seen[slug] = count + 1
+    return f"{slug}-{count}" if count else slug
+
+
+def split_passages(raw: bytes) -> List[Dict[str, Any]]:
+    """
+    Split markdown into heading-delimited passages.
+
+    Each passage records its heading, anchor and byte range in the file,
+    plus the analyzed terms of its text. The text itself is not kept;
+    it is read back from the file by offset when a passage is returned.
+    """
+    sections: List[Tuple[str, int, int]] = []
+    heading, start = "", 0
+    in_fence = False
+
+    for match in PASSAGE_BOUNDARY_PATTERN.finditer(raw):
+        if match.group(1):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        sections.append((heading, start, match.start()))
+        heading, start = match.group(3).decode("utf-8", "replace"), match.start()
+    sections.append((heading, start, len(raw)))
+
+    passages = []
+    seen: Dict[str, int] = {}
+    for heading, start, end in sections:
+        anchor = heading_anchor(heading, seen) if heading else ""
+        for chunk_start, chunk_end in _split_long_section(raw, start, end):
+            text = raw[chunk_start:chunk_end].decode("utf-8", "replace")
+            if not text.strip():
+                continue
+            passages.append(
+                {
+                    "heading": heading,
+                    "anchor": anchor,
+                    "start": chunk_start,
+                    "end": chunk_end,
+                    "terms": analyze_fields(PASSAGE_FIELDS, {"heading": heading, "text": text}),
+                }
+            )
+    return passages
+
+
+def _split_long_section(raw: bytes, start: int, end: int) -> List[Tuple[int, int]]:
+    """Break an oversized section into paragraph-aligned byte ranges"""
+    if end - start <= MAX_PASSAGE_BYTES:
+        return [(start, end)]
+
+    ranges = []
+    chunk_start = start
+    for match in PARAGRAPH_BREAK_PATTERN.finditer(raw, start, end):
+        if match.end() - chunk_start >= MAX_PASSAGE_BYTES:
+            ranges.append((chunk_start, match.end()))
+            chunk_start = match.end()
+    if chunk_start < end:
+        ranges.append((chunk_start, end))
+    return ranges
+
+
+def parse_markdown(file_path: Path, rel_path: str, modified: str) -> ParsedEntries:
+    """Parse a markdown file"""
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    # Same newline handling as reading in text mode
+    content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    # Extract metadata
+    entry: Dict[str, Any] = {
+        "file_path": rel_path,
+        "type": "markdown",
+        "modified": modified,
+    }
+
+    # Extract title
+    title_match = TITLE_PATTERN.search(content)
+    if title_match:
+        entry["title"] = title_match.group(1)
+        entry["name"] = title_match.group(1)
+
+    # Extract description (first paragraph after title)
+    desc_match = DESCRIPTION_PATTERN.search(content)
+    if desc_match:
+        entry["description"] = desc_match.group(1).strip()
+
+    # Locate code blocks; their text is read back from the file for returned hits
+    entry["code_spans"] = [
+        (match.group(1).decode() if match.group(1) else "text", match.start(2), match.end(2))
+        for match in CODE_BLOCK_PATTERN.finditer(raw)
+    ]
+
+    # Tag every Max object and key concept mentioned, in one pass
+    max_objects, concepts = get_tagger().tag(content.lower())
+
+    entry["tags"] = list(max_objects | concepts)
+    entry["preview_chars"] = min(len(content), PREVIEW_CHARS)
+    entry["passages"] = split_passages(raw)
+
+    # Categorize
+    return [(categorize_entry(file_path, entry), entry)]
+
+
+def parse_maxpat(file_path: Path, rel_path: str, modified: str) -> ParsedEntries:
+    """Parse a Max patcher file"""
+    # Stream the patcher; generated patchers can be tens of megabytes
+    with open(file_path, "r", encoding="utf-8") as f:
+        structure = scan_patcher(f)
+
+    entry: Dict[str, Any] = {
+        "file_path": rel_path,
+        "type": "maxpat",
+        "name": file_path.stem,
+        "modified": modified,
+    }
+
+    # Objects by type across the patcher and its subpatchers
+    object_counts = structure["object_counts"]
+
+    entry["object_counts"] = object_counts
+    entry["total_objects"] = sum(object_counts.values())
+    entry["unique_objects"] = list(object_counts.keys())
+    entry["total_lines"] = structure["total_lines"]
+    entry["subpatchers"] = structure["subpatchers"]
+    entry["max_depth"] = structure["max_depth"]
+
+    # Detect patterns
+    patterns = []
+    if "metro" in object_counts and "counter" in object_counts:
+        patterns.append("timing-counter")
+    if "buffer~" in object_counts and "groove~" in object_counts:
+        patterns.append("sample-playback")
+    if "jsui" in object_counts:
+        patterns.append("custom-ui")
+
+    entry["patterns"] = patterns
+    entry["tags"] = list(set(patterns + list(object_counts.keys())[:5]))
+
+    # Add description based on content
+    if patterns:
+        entry["description"] = f"Max patcher demonstrating: {', '.join(patterns)}"
+    else:
+        entry["description"] = f"Max patcher with {entry['total_objects']} objects"
+
+    # Categorize
+    if "jsui" in object_counts:
+        return [("jsui", entry)]
+    elif any(p in patterns for p in ["timing-counter", "tempo"]):
+        return [("temporal", entry)]
+    else:
+        return [("patterns", entry)]
+
+
+def parse_javascript(file_path: Path, rel_path: str, modified: str) -> ParsedEntries:
+    """Parse a JavaScript file (likely for jsui)"""
+    content = read_text(file_path)
+
+    entry: Dict[str, Any] = {
+        "file_path": rel_path,
+        "type": "javascript",
+        "name": file_path.stem,
+        "modified": modified,
+    }
+
+    # Extract function definitions
+    entry["functions"] = JS_FUNCTION_PATTERN.findall(content)
+
+    # Look for Max-specific patterns
+    if "mgraphics" in content:
+        entry["tags"] = ["jsui", "graphics"]
+        entry["description"] = "JSUI graphics script"
+        return [("jsui", entry)]
+    elif "outlet" in content or "inlet" in content:
+        entry["tags"] = ["js", "max-integration"]
+        entry["description"] = "Max JavaScript integration"
+        return [("objects", entry)]
+
+    return []
+
+
+def parse_json(file_path: Path, rel_path: str, modified: str) -> ParsedEntries:
+    """Parse a JSON file"""
+    json.loads(read_text(file_path))  # Validate JSON format
+
+    entry: Dict[str, Any] = {
+        "file_path": rel_path,
+        "type": "json",
+        "name": file_path.stem,
+        "modified": modified,
+    }
+
+    # Check if it's a preset or configuration
+    if "preset" in file_path.stem.lower():
+        entry["tags"] = ["preset", "configuration"]
+        entry["description"] = f"Preset configuration: {file_path.stem}"
+        return [("patterns", entry)]
+
+    return []
+
+
+def categorize_entry(file_path: Path, entry: Dict[str, Any]) -> str:
+    """Categorize an entry based on its path and content"""
+    path_str = str(file_path).lower()
+
+    if "temporal" in path_str or "scaffolding" in path_str:
+        return "temporal"
+    elif "jsui" in path_str:
+        return "jsui"
+    elif "sample" in path_str or "buffer" in path_str:
+        return "techniques"
+    elif "meta-programming" in path_str:
+        return "patterns"
+    else:
+        # Default based on tags
+        tags = entry.get("tags", [])
+        if "temporal" in tags:
+            return "temporal"
+        elif "jsui" in tags:
+            return "jsui"
+        else:
+            return "patterns"
+
+
+FILE_PARSERS = {
+    ".md": parse_markdown,
+    ".maxpat": parse_maxpat,
+    ".js": parse_javascript,
+    ".json": parse_json,
+}
@@ -0,0 +1,136 @@
+"""
+Name Indexes
+
+In-memory lookup structures over the short strings of the object index
+(object names, descriptions, tags). Built once when the index loads so
+keystroke-rate completion and substring search never scan the whole
+index.
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+
+class NgramIndex:
+    """
+    Substring lookup through a character n-gram index.
+
+    Every gram of length 1..n is posted, so queries up to n characters
+    are answered by a single posting list; longer queries intersect
+    their n-gram postings and verify the survivors.
+    """
+
+    def __init__(self, texts: Sequence[str], n: int = 3):
+        self.n = n
+        self.texts = [text.lower() for text in texts]
+
+        postings: Dict[str, List[int]] = {}
+        for text_id, text in enumerate(self.texts):
+            grams = {text[i : i + size] for size in range(1, n + 1) for i in range(len(text) - size + 1)}
+            for gram in grams:
+                postings.setdefault(gram, []).append(text_id)
+        self.postings: Dict[str, Tuple[int, ...]] = {gram: tuple(ids) for gram, ids in postings.items()}
+
+    def find(self, substring: str) -> Sequence[int]:
+        """Ids of the texts containing substring, in ascending order"""
+        substring = substring.lower()
+        if not substring:
+            return range(len(self.texts))
+        if len(substring) <= self.n:
+            return self.postings.get(substring, ())
+
+        lists = []
+        for i in range(len(substring) - self.n + 1):
+            ids = self.postings.get(substring[i : i + self.n])
+            if not ids:
+                return ()
+            lists.append(ids)
+        lists.sort(key=len)
+
+        candidates: Set[int] = set(lists[0])
+        for ids in lists[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                return ()
+        return sorted(text_id for text_id in candidates if substring in self.texts[text_id])
+
+
+class CompletionIndex:
+    """
+    Prefix completion over names.
+
+    Names are kept sorted for bisect range lookups, and the best top_k
+    completions of every prefix are precomputed, so a completion is a
+    single dict lookup. Completions rank by weight, then shorter names,
+    then alphabetically.
+    """
+
+    def __init__(self, names: Sequence[str], weights: Optional[Sequence[float]] = None, top_k: int = 10):
+        self.top_k = top_k
+        if weights is None:
+            weights = [0.0] * len(names)
+
+        # Sorted (lowercased name, name) pairs for range lookups
+        entries = sorted(zip((name.lower() for name in names), names))
+        self.keys = [key for key, _ in entries]
+        self.names = [name for _, name in entries]
+
+        weight_of = dict(zip(names, weights))
+        self.rank_keys = [(-weight_of[name], len(name), key) for key, name in entries]
+
+        # Prefix -> best completions, best first
+        tops: Dict[str, List[int]] = {}
+        for position in sorted(range(len(self.names)), key=self.rank_keys.__getitem__):
+            key = self.keys[position]
+            for end in range(1, len(key) + 1):
+                top = tops.setdefault(key[:end], [])
+                if len(top) < top_k:
+                    top.append(position)
+        self.top: Dict[str, Tuple[str, ...]] = {
+            prefix: tuple(self.names[position] for position in positions) for prefix, positions in tops.items()
+        }
+
+        # Bigram -> positions, for near misses of prefixes without enough completions
+        bigrams: Dict[str, List[int]] = {}
+        for position, key in enumerate(self.keys):
+            for gram in {key[i : i + 2] for i in range(len(key) - 1)}:
+                bigrams.setdefault(gram, []).append(position)
+        self.bigrams: Dict[str, Tuple[int, ...]] = {gram: tuple(positions) for gram, positions in bigrams.items()}
+
+    def complete(self, prefix: str, k: int = 10) -> List[str]:
+        """Up to k names starting with prefix, best first; near misses fill the remaining slots"""
+        prefix = prefix.lower()
+        if k <= 0 or not prefix:
+            return []
+
+        if k <= self.top_k:
+            matches = list(self.top.get(prefix, ())[:k])
+        else:
+            lo, hi = self._range(prefix)
+            matches = [self.names[position] for position in sorted(range(lo, hi), key=self.rank_keys.__getitem__)[:k]]
+
+        if len(matches) < k:
+            matches += self._near(prefix, k - len(matches))
+        return matches
+
+    def _near(self, prefix: str, k: int) -> List[str]:
+        """Names sharing the first letter and at least one bigram with prefix but not the whole prefix"""
+        # Postings are sorted by position, so the names sharing the first letter are one slice of each
+        lo, hi = self._range(prefix[0])
+        skip_lo, skip_hi = self._range(prefix)
+        shared: Dict[int, int] = {}
+        for gram in {prefix[i : i + 2] for i in range(len(prefix) - 1)}:
+            positions = self.bigrams.get(gram, ())
+            start = bisect_left(positions, lo)
+            for position in positions[start : bisect_left(positions, hi, start)]:
+                if not skip_lo <= position < skip_hi:
+                    shared[position] = shared.get(position, 0) + 1
+
+        scored = [(-count, self.rank_keys[position], position) for position, count in shared.items()]
+        scored.sort()
+        return [self.names[position] for _, _, position in scored[:k]]
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        """Positions of the sorted names starting with prefix"""
+        lo = bisect_left(self.keys, prefix)
+        return lo, bisect_left(self.keys, prefix + "\uffff", lo)
@@ -0,0 +1,179 @@
+"""
+Object Tagger
+
+Aho-Corasick automaton over the Max object catalog and concept keywords.
+A document is tagged in a single linear pass regardless of how many
+object names the catalog holds.
+"""
+
+import hashlib
+import re
+import string
+from bisect import bisect_right
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Concepts are matched anywhere in the text, like plain substring checks
+CONCEPT_KEYWORDS = ("temporal", "scaffolding", "jsui", "buffer", "sample")
+
+# Object names that are also everyday English words. These only match in
+# code context: a code span or block, or right after "[" as in "[line 0 500]"
+AMBIGUOUS_NAMES = frozenset(
+    (
+        "append bag bucket button change clip comment counter date delay dial filter float gate int iter join key "
+        "line match message meter next number pack past peak pipe print random receive record route scale select "
+        "send slider sort split step swap switch table text thresh timer toggle trigger value"
+    ).split()
+)
+
+# Fenced code blocks (possibly left open) and inline code spans
+CODE_PATTERN = re.compile(r"```.*?(?:```|\Z)|~~~.*?(?:~~~|\Z)|`[^`\n]+`", re.DOTALL)
+
+# Characters that continue an object name; a match touching one of these
+# is part of a longer word (e.g. "line" inside "line~" or "jit.line")
+NAME_CHARS = frozenset(string.ascii_lowercase + string.digits + "~_-.")
+WORD_CHARS = frozenset(string.ascii_lowercase + string.digits)
+
+# (keyword, is_object) pairs ending at an automaton state
+Outputs = Tuple[Tuple[str, bool], ...]
+
+
+class ObjectTagger:
+    """
+    Multi-pattern matcher tagging Max objects and concept keywords.
+
+    Object names only match as whole names, and ambiguous names only in
+    code context; concept keywords match as substrings. Transitions are
+    fully expanded into a DFA so scanning is one dictionary lookup per
+    character.
+    """
+
+    def __init__(
+        self,
+        object_names: Iterable[str],
+        concepts: Iterable[str] = CONCEPT_KEYWORDS,
+        ambiguous: Iterable[str] = AMBIGUOUS_NAMES,
+    ):
+        names = sorted({name.lower().strip() for name in object_names if self._is_taggable(name)})
+        self.ambiguous = frozenset(name.lower() for name in ambiguous).intersection(names)
+        self.fingerprint = hashlib.sha1("\n".join(names + [""] + sorted(self.ambiguous)).encode()).hexdigest()
+        self.object_count = len(names)
+
+        keywords: Dict[str, Set[bool]] = {}
+        for name in names:
+            keywords.setdefault(name, set()).add(True)
+        for concept in concepts:
+            keywords.setdefault(concept.lower(), set()).add(False)
+
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.outputs: List[Outputs] = [()]
+        self._build(keywords)
+
+    def tag(self, text: str) -> Tuple[Set[str], Set[str]]:
+        """
+        Find every object and concept mentioned in lowercase text.
+
+        Returns:
+            (object names, concept keywords)
+        """
+        objects: Set[str] = set()
+        concepts: Set[str] = set()
+        transitions = self.transitions
+        outputs = self.outputs
+        ambiguous = self.ambiguous
+        length = len(text)
+        # Code spans as (starts, ends), found on the first ambiguous match
+        code_spans: Optional[Tuple[List[int], List[int]]] = None
+
+        state = 0
+        for position, char in enumerate(text):
+            state = transitions[state].get(char, 0)
+            if not outputs[state]:
+                continue
+
+            for keyword, is_object in outputs[state]:
+                if not is_object:
+                    concepts.add(keyword)
+                    continue
+
+                start = position - len(keyword) + 1
+                if keyword in objects or not self._is_whole_name(text, start, position, length):
+                    continue
+                if keyword in ambiguous:
+                    if code_spans is None:
+                        code_spans = self._code_spans(text)
+                    if not self._in_code(text, start, code_spans):
+                        continue
+                objects.add(keyword)
+
+        return objects, concepts
+
+    def _build(self, keywords: Dict[str, Set[bool]]):
+        """Build the trie, failure links and expanded transition table"""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[Tuple[str, bool]]] = [[]]
+
+        for keyword, kinds in keywords.items():
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].extend((keyword, is_object) for is_object in sorted(kinds))
+
+        # Breadth-first: every state's failure target is resolved before its children
+        fail = [0] * len(goto)
+        transitions: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            failure = fail[state]
+
+            transitions[state] = {**transitions[failure], **goto[state]}
+            outputs[state].extend(outputs[failure])
+
+            for char, child in goto[state].items():
+                fail[child] = transitions[failure].get(char, 0)
+                queue.append(child)
+
+        self.transitions = transitions
+        self.outputs = [tuple(output) for output in outputs]
+
+    @staticmethod
+    def _is_whole_name(text: str, start: int, end: int, length: int) -> bool:
+        """Check that text[start:end + 1] is not part of a longer name"""
+        if start > 0 and text[start - 1] in NAME_CHARS:
+            return False
+        if end + 1 < length:
+            following = text[end + 1]
+            if following in NAME_CHARS and following != ".":
+                return False
+            # A trailing period ends a sentence unless a name continues after it
+            if following == "." and end + 2 < length and text[end + 2] in WORD_CHARS:
+                return False
+        return True
+
+    @staticmethod
+    def _code_spans(text: str) -> Tuple[List[int], List[int]]:
+        """Start and end offsets of the code spans and blocks in text"""
+        spans = [match.span() for match in CODE_PATTERN.finditer(text)]
+        return [start for start, _ in spans], [end for _, end in spans]
+
+    @staticmethod
+    def _in_code(text: str, start: int, code_spans: Tuple[List[int], List[int]]) -> bool:
+        """Check whether a name at start is in a code span or block, or opens a [name ...] box"""
+        if start > 0 and text[start - 1] == "[":
+            return True
+        starts, ends = code_spans
+        index = bisect_right(starts, start) - 1
+        return index >= 0 and start < ends[index]
+
+    @staticmethod
+    def _is_taggable(name: str) -> bool:
+        """Skip names too short or symbolic to tag reliably (e.g. "+", "t")"""
+        name = name.strip()
+        return len(name) >= 3 and not any(char.isspace() for char in name) and any(char.isalpha() for char in name)
@@ -0,0 +1,257 @@
+"""
+Streaming Max Patcher Scanner
+
+Extracts object classes, patch cord counts and subpatcher structure from
+.maxpat JSON without loading the whole document. The file is read in
+fixed-size chunks and tokenized incrementally; string state carries over
+between chunks, so every character is scanned once and memory stays
+bounded by the chunk size plus the class fields of one box.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, TextIO
+
+# Box fields that determine the object class
+CLASS_FIELDS = ("class", "maxclass", "text")
+
+# Keys whose object or array values make up the patcher structure
+STRUCTURE_KEYS = ("patcher", "boxes", "lines", "box")
+
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_PLAIN = r'[^"{}\[\]]*'
+_FIELDS = "|".join(CLASS_FIELDS)
+_KEYS = "|".join(STRUCTURE_KEYS)
+_FIELD_START = rf'"(?:{_FIELDS})"\s*:\s*"'
+_KEY_OPEN = rf'"(?:{_KEYS})"\s*:\s*[{{\[]'
+# A key of interest at the very end of the buffer, whose value is still to come
+_PENDING_KEY = rf'"(?:{_FIELDS}|{_KEYS})"\s*:?\s*\Z'
+
+# Everything without structure we need: commas, scalars, other keys and
+# strings, and arrays holding only scalars and strings (coordinates,
+# outlet types). Each piece matches one way only, so a failed match
+# backtracks linearly.
+_FLAT_ARRAY = rf"\[{_PLAIN}(?:{_STRING}{_PLAIN})*\]"
+_OTHER_STRING = rf"(?!{_FIELD_START}|{_KEY_OPEN}|{_PENDING_KEY}){_STRING}"
+SKIPPED_PATTERN = re.compile(rf"{_PLAIN}(?:(?:{_FLAT_ARRAY}|{_OTHER_STRING}){_PLAIN})*")
+
+# Skipped text followed by the opening quote of a class field value, a
+# structure key with its opening bracket, or any other bracket
+TOKEN_PATTERN = re.compile(
+    SKIPPED_PATTERN.pattern + rf'(?:"({_FIELDS})"\s*:\s*"|"({_KEYS})"\s*:\s*([{{\[])|([{{\[])|([}}\]]))'
+)
+FIELD, KEY, KEY_BRACKET, OPEN, CLOSE = range(1, 6)
+
+PENDING_KEY_PATTERN = re.compile(_PENDING_KEY)
+
+# String contents up to the closing quote or the end of the buffer
+STRING_BODY_PATTERN = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+# Unterminated strings up to this long are carried into the next chunk (they
+# may be a key of interest); longer ones are skipped in place
+MAX_CARRY = 64
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _Frame:
+    """One open JSON object or array"""
+
+    __slots__ = ("role", "box")
+
+    def __init__(self, role: Optional[str]):
+        self.role = role
+        self.box: Optional[Dict[str, str]] = {} if role == "box_item" else None
+
+
+class PatcherScanner:
+    """
+    Incremental tokenizer that tracks just enough JSON structure to
+    recognise patchers, their boxes and their patch cords.
+    """
+
+    def __init__(self):
+        self.stack: List[_Frame] = [_Frame("root")]
+        self.object_counts: Dict[str, int] = {}
+        self.total_lines = 0
+        self.patcher_count = 0
+        self.depth = 0
+        self.max_depth = 0
+
+        # Start of a token cut off by the end of the previous chunk
+        self._carry = ""
+        # Inside a string: the class field it is the value of (None when skipping it),
+        # its contents so far, and whether the previous chunk ended on a backslash
+        self._in_string = False
+        self._field: Optional[str] = None
+        self._parts: List[str] = []
+        self._escaped = False
+
+    def feed(self, chunk: str):
+        """Consume the next chunk of the document"""
+        text = self._carry + chunk if self._carry else chunk
+        self._carry = ""
+
+        position = 0
+        if self._in_string:
+            position = self._read_string(text, 0)
+            if position is None:
+                return
+
+        while True:
+            match = TOKEN_PATTERN.match(text, position)
+            if match is None:
+                break
+            position = match.end()
+            kind = match.lastindex
+
+            if kind == OPEN:
+                self._open(match.group(OPEN) == "{", None)
+            elif kind == CLOSE:
+                self._close()
+            elif kind == KEY_BRACKET:
+                self._open(match.group(KEY_BRACKET) == "{", match.group(KEY))
+            else:
+                self._in_string = True
+                # Only box fields name an object; other values are skipped like any string
+                self._field = match.group(FIELD) if self.stack[-1].role in ("box_item", "box") else None
+                position = self._read_string(text, position)
+                if position is None:
+                    return
+
+        # What is left holds no complete token: at most an unterminated string or a pending key
+        position = SKIPPED_PATTERN.match(text, position).end()
+        if position == len(text):
+            return
+        if len(text) - position <= MAX_CARRY or PENDING_KEY_PATTERN.match(text, position):
+            self._carry = text[position:]
+        else:
+            self._in_string = True
+            self._field = None
+            self._read_string(text, position + 1)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the extracted patcher structure"""
+        if self._in_string or self._carry and PENDING_KEY_PATTERN.match(self._carry) is None:
+            raise ValueError("Unterminated string in patcher")
+        if len(self.stack) != 1 or self._carry:
+            raise ValueError("Truncated patcher document")
+
+        return {
+            "object_counts": self.object_counts,
+            "total_lines": self.total_lines,
+            "subpatchers": max(self.patcher_count - 1, 0),
+            "max_depth": self.max_depth,
+        }
+
+    def _read_string(self, text: str, position: int) -> Optional[int]:
+        """
+        Continue the open string at position.
+
+        Returns:
+            Position after the closing quote, or None when the string
+            runs past the end of text
+        """
+        start = position
+        if self._escaped:
+            if position == len(text):
+                return None
+            self._escaped = False
+            position += 1
+
+        end = STRING_BODY_PATTERN.match(text, position).end()
+        closed = end < len(text) and text[end] == '"'
+        if not closed and end < len(text):
+            # A trailing backslash escapes the first character of the next chunk
+            self._escaped = True
+            end = len(text)
+
+        if self._field is not None:
+            self._parts.append(text[start:end])
+        if not closed:
+            return None
+
+        if self._field is not None:
+            self._on_value(self._field, _decode(f'"{"".join(self._parts)}"'))
+            self._parts = []
+        self._in_string = False
+        self._field = None
+        return end + 1
+
+    def _open(self, is_object: bool, key: Optional[str]):
+        parent = self.stack[-1]
+        role = None
+
+        if key == "patcher":
+            if is_object:
+                role = "patcher"
+                self.patcher_count += 1
+                self.depth += 1
+                self.max_depth = max(self.max_depth, self.depth)
+        elif key in ("boxes", "lines"):
+            if not is_object and parent.role == "patcher":
+                role = key
+        elif key == "box":
+            if is_object and parent.role == "box_item":
+                role = "box"
+        elif is_object and parent.role == "boxes":
+            role = "box_item"
+        elif is_object and parent.role == "lines":
+            self.total_lines += 1
+
+        self.stack.append(_Frame(role))
+
+    def _close(self):
+        if len(self.stack) == 1:
+            raise ValueError("Unbalanced brackets in patcher")
+
+        frame = self.stack.pop()
+        if frame.role == "patcher":
+            self.depth -= 1
+        elif frame.role == "box_item":
+            obj_class = _box_class(frame.box)
+            self.object_counts[obj_class] = self.object_counts.get(obj_class, 0) + 1
+
+    def _on_value(self, field: str, value: str):
+        top = self.stack[-1]
+        if top.role == "box_item":
+            top.box.setdefault(field, value)
+        elif top.role == "box":
+            self.stack[-2].box.setdefault(field, value)
+
+
+def _decode(token: str) -> str:
+    """Decode a JSON string literal"""
+    return json.loads(token) if "\\" in token else token[1:-1]
+
+
+def _box_class(box: Dict[str, str]) -> str:
+    """Resolve the object class of a box ("newobj" boxes are named by their text)"""
+    if "class" in box:
+        return box["class"]
+
+    maxclass = box.get("maxclass")
+    if maxclass == "newobj" and box.get("text", "").strip():
+        return box["text"].split()[0]
+    return maxclass or "unknown"
+
+
+def scan_patcher(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """
+    Scan a patcher from a text stream.
+
+    Args:
+        stream: Open text file positioned at the start of the patcher
+        chunk_size: Characters read per step
+
+    Returns:
+        Dictionary with object_counts, total_lines, subpatchers and max_depth
+    """
+    scanner = PatcherScanner()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        scanner.feed(chunk)
+
+    return scanner.summary()
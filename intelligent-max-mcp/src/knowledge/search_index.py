@@ -0,0 +1,236 @@
+"""
+Inverted Search Index
+
+A small in-memory inverted index with BM25F-style field weighting.
+Queries only touch the posting lists of their own tokens, so lookup
+cost follows the number of matching entries rather than corpus size.
+"""
+
+import math
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Max object names keep their trailing tilde ("groove~"), everything else
+# splits on non-alphanumerics
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+~?")
+
+
+# Per-token field frequencies and per-field token counts of one document
+AnalyzedFields = Tuple[Dict[str, Tuple[int, ...]], Tuple[int, ...]]
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def analyze_fields(fields: Sequence[str], field_values: Dict[str, str]) -> AnalyzedFields:
+    """
+    Tokenize a document's fields into term frequencies.
+
+    Kept separate from indexing so worker processes can analyze text
+    and ship only the counts back.
+    """
+    frequencies: Dict[str, List[int]] = {}
+    lengths = []
+    for position, field in enumerate(fields):
+        tokens = tokenize(field_values.get(field) or "")
+        lengths.append(len(tokens))
+        for token in tokens:
+            # Let "groove" find "groove~" as well
+            variants = (token, token[:-1]) if token.endswith("~") and len(token) > 1 else (token,)
+            for variant in variants:
+                counts = frequencies.get(variant)
+                if counts is None:
+                    counts = frequencies[variant] = [0] * len(fields)
+                counts[position] += 1
+
+    return {token: tuple(counts) for token, counts in frequencies.items()}, tuple(lengths)
+
+
+class InvertedIndex:
+    """
+    Token -> posting list index over a fixed set of weighted fields.
+
+    Each posting stores the per-field term frequencies of one document,
+    which lets scoring apply BM25F length normalisation per field.
+    """
+
+    def __init__(
+        self,
+        field_weights: Dict[str, float],
+        k1: float = 1.2,
+        b: float = 0.75,
+        prefix_discount: float = 0.5,
+    ):
+        self.fields: Tuple[str, ...] = tuple(field_weights)
+        self.weights: Tuple[float, ...] = tuple(field_weights.values())
+        self.k1 = k1
+        self.b = b
+        self.prefix_discount = prefix_discount
+
+        # token -> {doc_id: per-field term frequencies}
+        self.postings: Dict[str, Dict[int, Tuple[int, ...]]] = {}
+        self.field_lengths: Dict[int, Tuple[int, ...]] = {}
+        self.doc_terms: Dict[int, Tuple[str, ...]] = {}
+        self.total_lengths: List[int] = [0] * len(self.fields)
+
+        # Sorted vocabulary for prefix expansion, rebuilt lazily
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+    def __len__(self) -> int:
+        return len(self.field_lengths)
+
+    def __contains__(self, doc_id: int) -> bool:
+        return doc_id in self.field_lengths
+
+    def add(self, doc_id: int, field_values: Dict[str, str]):
+        """Index a document, replacing any previous version with the same id"""
+        self.add_analyzed(doc_id, analyze_fields(self.fields, field_values))
+
+    def add_analyzed(self, doc_id: int, analyzed: AnalyzedFields):
+        """Index a document already run through analyze_fields with this index's fields"""
+        if doc_id in self.field_lengths:
+            self.remove(doc_id)
+
+        frequencies, lengths = analyzed
+        for token, counts in frequencies.items():
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = {}
+                self._vocabulary_dirty = True
+            posting[doc_id] = counts
+
+        self.field_lengths[doc_id] = tuple(lengths)
+        self.doc_terms[doc_id] = tuple(frequencies)
+        for position, length in enumerate(lengths):
+            self.total_lengths[position] += length
+
+    def remove(self, doc_id: int):
+        """Drop a document from the index"""
+        lengths = self.field_lengths.pop(doc_id, None)
+        if lengths is None:
+            return
+
+        for token in self.doc_terms.pop(doc_id, ()):
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self.postings[token]
+                self._vocabulary_dirty = True
+
+        for position, length in enumerate(lengths):
+            self.total_lengths[position] -= length
+
+    def clear(self):
+        """Remove every document"""
+        self.postings.clear()
+        self.field_lengths.clear()
+        self.doc_terms.clear()
+        self.total_lengths = [0] * len(self.fields)
+        self._vocabulary = []
+        self._vocabulary_dirty = False
+
+    def score(self, query_tokens: Sequence[str], candidates: Optional[set] = None) -> Dict[int, float]:
+        """
+        Score documents against the query tokens.
+
+        Tokens without an exact posting list are expanded to vocabulary
+        terms sharing that prefix, at a discount.
+
+        Args:
+            query_tokens: Tokens produced by tokenize()
+            candidates: Optional set of doc ids to restrict scoring to
+
+        Returns:
+            Mapping of doc id to BM25F score
+        """
+        return self.score_many([query_tokens], candidates)[0]
+
+    def score_many(
+        self, token_lists: Sequence[Sequence[str]], candidates: Optional[set] = None
+    ) -> List[Dict[int, float]]:
+        """
+        Score several queries at once.
+
+        Scores add up over distinct tokens, so each token's postings are
+        walked once however many queries share it.
+
+        Returns:
+            One doc id -> BM25F score mapping per token list
+        """
+        results: List[Dict[int, float]] = []
+        doc_count = len(self.field_lengths)
+        if not doc_count:
+            return [{} for _ in token_lists]
+
+        average_lengths = [max(total / doc_count, 1.0) for total in self.total_lengths]
+        token_scores: Dict[str, Dict[int, float]] = {}
+
+        for query_tokens in token_lists:
+            scores: Dict[int, float] = {}
+            for token in dict.fromkeys(query_tokens):
+                contributions = token_scores.get(token)
+                if contributions is None:
+                    contributions = token_scores[token] = self._score_token(
+                        token, candidates, doc_count, average_lengths
+                    )
+                for doc_id, contribution in contributions.items():
+                    scores[doc_id] = scores.get(doc_id, 0.0) + contribution
+            results.append(scores)
+
+        return results
+
+    def _score_token(
+        self, token: str, candidates: Optional[set], doc_count: int, average_lengths: List[float]
+    ) -> Dict[int, float]:
+        """BM25F contribution of one query token (or its prefix expansions) per document"""
+        if token in self.postings:
+            expansions = [(token, 1.0)]
+        else:
+            expansions = [(term, self.prefix_discount) for term in self._expand_prefix(token)]
+
+        scores: Dict[int, float] = {}
+        for term, discount in expansions:
+            posting = self.postings[term]
+            df = len(posting)
+            idf = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+
+            for doc_id, counts in posting.items():
+                if candidates is not None and doc_id not in candidates:
+                    continue
+
+                lengths = self.field_lengths[doc_id]
+                weighted_tf = 0.0
+                for position, tf in enumerate(counts):
+                    if tf:
+                        norm = 1.0 - self.b + self.b * lengths[position] / average_lengths[position]
+                        weighted_tf += self.weights[position] * tf / norm
+
+                contribution = idf * weighted_tf / (self.k1 + weighted_tf) * discount
+                scores[doc_id] = scores.get(doc_id, 0.0) + contribution
+
+        return scores
+
+    def _expand_prefix(self, prefix: str, limit: int = 20) -> List[str]:
+        """Return vocabulary terms starting with prefix"""
+        if len(prefix) < 3:
+            return []
+
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self.postings)
+            self._vocabulary_dirty = False
+
+        terms = []
+        position = bisect_left(self._vocabulary, prefix)
+        while position < len(self._vocabulary) and len(terms) < limit:
+            term = self._vocabulary[position]
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+            position += 1
+        return terms
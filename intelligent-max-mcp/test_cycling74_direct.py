@@ -22,7 +22,7 @@ async def test_metro_docs():
         config = yaml.safe_load(f)
 
     # Create connector
-    cycling74 = Cycling74Connector(config.get("knowledge_sources", {}).get("cycling74_docs", {}))
+    cycling74 = Cycling74Connector(config.get("knowledge_sources", {}).get("cycling74_docs", {}), config.get("cache"))
 
     try:
         await cycling74.initialize()
@@ -25,7 +25,7 @@ async def test_metro_search():
 
     # Create and initialize the knowledge engine
     print("\n🧠 Initializing Knowledge Fusion Engine...")
-    engine = KnowledgeFusionEngine(config.get("knowledge_sources", {}))
+    engine = KnowledgeFusionEngine(config.get("knowledge_sources", {}), config.get("cache"))
 
     try:
         await engine.initialize()
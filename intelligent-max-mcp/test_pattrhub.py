@@ -23,7 +23,7 @@ async def test_pattrhub_search():
 
     # Create and initialize the knowledge engine
     print("🧠 Initializing Knowledge Fusion Engine...")
-    engine = KnowledgeFusionEngine(config.get("knowledge_sources", {}))
+    engine = KnowledgeFusionEngine(config.get("knowledge_sources", {}), config.get("cache"))
 
     try:
         await engine.initialize()
@@ -0,0 +1,102 @@
+"""Tests for conditional revalidation of cached Cycling '74 docs"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import pytest
+import pytest_asyncio
+
+from src.knowledge.cycling74_connector import Cycling74Connector
+
+PAGE = '<html><body><div class="description">{}</div></body></html>'
+
+
+class StubResponse:
+    def __init__(self, status: int, body: str = "", headers: Optional[Dict[str, str]] = None, gate=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.gate = gate
+
+    async def __aenter__(self):
+        if self.gate:
+            await self.gate.wait()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def text(self) -> str:
+        return self.body
+
+
+class StubSession:
+    """Answers every request with the next queued response"""
+
+    def __init__(self, responses: List[StubResponse]):
+        self.responses = responses
+        self.requests: List[Dict[str, str]] = []
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> StubResponse:
+        self.requests.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+    async def close(self):
+        pass
+
+
+@pytest_asyncio.fixture
+async def connector(tmp_path):
+    connector = Cycling74Connector(
+        {"cache_dir": str(tmp_path), "mirror_path": str(tmp_path / "mirror.db"), "cache_duration": 3600}
+    )
+    connector.cache.put("objects/metro", {"object_name": "metro", "description": "Cached"}, {"etag": '"v1"'})
+    # Stored two hours ago, so the entry has expired
+    connector.cache._conn.execute("UPDATE docs SET stored_at = stored_at - 7200")
+    yield connector
+    await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_not_modified_restamps_the_entry_and_keeps_the_body(connector):
+    connector.stale_while_revalidate = False
+    connector.session = StubSession([StubResponse(304)])
+
+    doc = await connector.get_object_doc("metro")
+    assert doc == {"object_name": "metro", "description": "Cached"}
+    assert connector.session.requests == [{"If-None-Match": '"v1"'}]
+
+    entry = connector.cache.get_entry("objects/metro")
+    assert entry.data == doc
+    assert entry.meta == {"etag": '"v1"'}
+    assert time.time() - entry.stored_at < 60
+    assert connector.doc_generation == 0
+
+    # Fresh again: served without another request
+    assert await connector.get_object_doc("metro") == doc
+    assert len(connector.session.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_body_is_served_while_revalidating(connector):
+    gate = asyncio.Event()
+    connector.session = StubSession([StubResponse(200, PAGE.format("Updated"), {"ETag": '"v2"'}, gate=gate)])
+
+    # The expired body comes back at once, with the refresh still waiting on the upstream
+    doc = await asyncio.wait_for(connector.get_object_doc("metro"), timeout=0.5)
+    assert doc == {"object_name": "metro", "description": "Cached"}
+    assert len(connector._background_tasks) == 1
+    assert connector.cache.get_entry("objects/metro").data["description"] == "Cached"
+
+    gate.set()
+    await asyncio.gather(*connector._background_tasks)
+    assert connector.session.requests == [{"If-None-Match": '"v1"'}]
+
+    entry = connector.cache.get_entry("objects/metro")
+    assert entry.data["description"] == "Updated"
+    assert entry.meta == {"etag": '"v2"'}
+    # Fused results built on the old body are invalidated
+    assert connector.doc_generation == 1
+    assert (await connector.get_object_doc("metro"))["description"] == "Updated"
+    assert len(connector.session.requests) == 1
@@ -0,0 +1,71 @@
+"""Tests for Cycling '74 search against its fetch deadline"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+
+from src.knowledge.cycling74_connector import Cycling74Connector, FetchResult
+
+FETCH_LATENCY = 0.5
+
+PAGE = '<html><body><div class="description">Output bangs at a steady rate</div></body></html>'
+
+
+@pytest_asyncio.fixture
+async def connector(tmp_path):
+    connector = Cycling74Connector(
+        {"cache_dir": str(tmp_path), "mirror_path": str(tmp_path / "mirror.db"), "search_deadline": 0.1}
+    )
+    connector.object_index = {
+        "metro": {"description": "metro clock", "category": "timing", "tags": ["timing"]},
+        "counter": {"description": "Count and output numbers", "category": "math", "tags": ["math"]},
+    }
+    connector._build_name_indexes()
+
+    fetched = []
+
+    async def fetch_response(url, headers=None):
+        fetched.append(url)
+        await asyncio.sleep(FETCH_LATENCY)
+        return FetchResult(200, PAGE, None, None)
+
+    connector._fetch_response = fetch_response
+    connector.fetched = fetched
+    yield connector
+    await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_fetch_yields_a_pending_summary(connector):
+    start = time.perf_counter()
+    [result] = await connector.search("metro")
+    assert time.perf_counter() - start < FETCH_LATENCY
+
+    # The summary stands in for the page, which is still being fetched
+    assert result == {
+        "object_name": "metro",
+        "description": "metro clock",
+        "category": "timing",
+        "relevance": 0.8,
+        "doc_pending": True,
+    }
+    assert len(connector._background_tasks) == 1
+
+    # The late fetch finishes in the background and serves the next search from the cache
+    await asyncio.gather(*connector._background_tasks)
+    [result] = await connector.search("metro")
+    assert result["description"] == "Output bangs at a steady rate"
+    assert "doc_pending" not in result
+    assert len(connector.fetched) == 1
+
+
+@pytest.mark.asyncio
+async def test_query_deadline_tightens_the_search_deadline(connector):
+    connector.search_deadline = 10.0
+
+    start = time.perf_counter()
+    [result] = await connector.search("metro", deadline=0.05)
+    assert time.perf_counter() - start < FETCH_LATENCY
+    assert result["doc_pending"]
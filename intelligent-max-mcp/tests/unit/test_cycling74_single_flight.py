@@ -0,0 +1,87 @@
+"""Tests for sharing one fetch among concurrent loads of the same doc"""
+
+import asyncio
+from functools import partial
+
+import pytest
+import pytest_asyncio
+
+from src.knowledge.cycling74_connector import Cycling74Connector, FetchResult
+
+PAGE = '<html><body><div class="description">Output bangs at a steady rate</div></body></html>'
+
+CALLERS = 8
+
+
+@pytest_asyncio.fixture
+async def connector(tmp_path):
+    connector = Cycling74Connector({"cache_dir": str(tmp_path), "mirror_path": str(tmp_path / "mirror.db")})
+
+    # The upstream answers once the gate opens
+    connector.gate = asyncio.Event()
+    connector.fetched = []
+
+    async def fetch_response(url, headers=None):
+        connector.fetched.append(url)
+        await connector.gate.wait()
+        return FetchResult(200, PAGE, None, None)
+
+    connector._fetch_response = fetch_response
+    yield connector
+    await connector.close()
+
+
+def load_metro(connector):
+    parse = partial(connector._parse_object_doc, object_name="metro")
+    return asyncio.ensure_future(connector._load_doc("objects/metro", "/refpages/metro", parse))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_fetch(connector):
+    callers = [load_metro(connector) for _ in range(CALLERS)]
+    await asyncio.sleep(0)
+    assert list(connector._inflight) == ["objects/metro"]
+
+    connector.gate.set()
+    results = await asyncio.gather(*callers)
+
+    assert len(connector.fetched) == 1
+    assert results[0]["description"] == "Output bangs at a steady rate"
+    assert all(result == results[0] for result in results)
+    assert connector._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_fetch(connector):
+    callers = [load_metro(connector) for _ in range(CALLERS)]
+    await asyncio.sleep(0)
+    fetch = connector._inflight["objects/metro"]
+
+    callers[0].cancel()
+    await asyncio.sleep(0)
+    assert callers[0].cancelled()
+    assert not fetch.done()
+
+    connector.gate.set()
+    results = await asyncio.gather(*callers[1:])
+    assert all(result["description"] == "Output bangs at a steady rate" for result in results)
+    assert len(connector.fetched) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_outlives_all_of_its_callers(connector):
+    callers = [load_metro(connector) for _ in range(CALLERS)]
+    await asyncio.sleep(0)
+    fetch = connector._inflight["objects/metro"]
+
+    for caller in callers:
+        caller.cancel()
+    await asyncio.gather(*callers, return_exceptions=True)
+    assert not fetch.done()
+
+    # The page still lands in the cache for the next caller
+    connector.gate.set()
+    await fetch
+    assert connector.cache.get("objects/metro")["description"] == "Output bangs at a steady rate"
+    assert (await load_metro(connector))["description"] == "Output bangs at a steady rate"
+    assert len(connector.fetched) == 1
@@ -0,0 +1,135 @@
+"""Tests that the lxml page parsers match the BeautifulSoup ones"""
+
+from typing import Any, Dict
+
+import pytest
+
+from src.knowledge.doc_parsers import (
+    parse_object_doc_lxml,
+    parse_object_doc_soup,
+    parse_tutorial_lxml,
+    parse_tutorial_soup,
+)
+
+OBJECT_PAGE = """<!DOCTYPE html>
+<html><head><title>metro</title><style>.inlet { color: red }</style></head>
+<body>
+  <h1>metro</h1>
+  <div class="refpage description">
+    Output a <b>bang</b> at   regular intervals <!-- not text -->&amp; keep time.
+    <script>var hidden = 1;</script>
+  </div>
+  <div class="description">A second description is ignored</div>
+  <div class="inlets">
+    <div class="inlet" data-type="bang">Start or stop <em>the</em> metronome</div>
+    <div class="inlet  right">Interval in <code>ms</code></div>
+  </div>
+  <div class="inlets"><div class="inlet">Only the first section counts</div></div>
+  <div class="outlets"><div class="outlet" data-type="bang">Bang on every tick</div></div>
+  <div class="attributes">
+    <div class="attribute" data-type="int"><span class="name">active</span> Turn on and off</div>
+    <div class="attribute"><span class="attr name">interval</span>
+      Time between ticks <template><span class="name">hidden</span></template></div>
+    <div class="attribute">No name span, skipped</div>
+  </div>
+  <div class="examples">
+    <div class="example">Basic use <code>  metro 500
+  </code> then more text</div>
+    <div class="example">Without code</div>
+  </div>
+  <div class="seealso"><a href="/refpages/counter">counter</a> <a href="/refpages/tempo"> tempo </a></div>
+</body></html>
+"""
+
+TUTORIAL_PAGE = """<?xml version="1.0" encoding="utf-8"?>
+<html><body>
+  <h1>Basic <i>Chapter</i> 1</h1>
+  <h2>Introduction</h2>
+  <p>Open the patch and <code>click</code> the toggle.</p>
+  <h3>Details <!-- aside --></h3>
+  <p>   </p>
+  <p>Unclosed paragraph
+  <pre><code>metro 100 -&gt; counter</code></pre>
+  <h2>Summary</h2><p>Time is <b>structure</b>.</p>
+</body></html>
+"""
+
+# A listing page: links grouped under headings, parsed like tutorials and guides
+LISTING_PAGE = """<html><body>
+  <h1>Max Object Functional Listing</h1>
+  <h2>Timing</h2>
+  <p><a href="/refpages/metro">metro</a> <a href="/refpages/delay">delay</a></p>
+  <h2>Lists</h2>
+  <p><a href="/refpages/zl">zl</a> &mdash; list processing</p>
+  <h3>Reference page</h3>
+  <style>h2 { margin: 0 }</style>
+  <p><a href="/refpages/iter">iter</a></p>
+</body></html>
+"""
+
+
+def without_timestamp(doc: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in doc.items() if key != "timestamp"}
+
+
+@pytest.mark.parametrize("html", [OBJECT_PAGE, LISTING_PAGE, "", "<p>no sections</p>", "<div class='inlets'>"])
+def test_object_parsers_agree(html):
+    lxml_doc = parse_object_doc_lxml(html, "metro", "https://example.com/refpages/metro")
+    soup_doc = parse_object_doc_soup(html, "metro", "https://example.com/refpages/metro")
+    assert without_timestamp(lxml_doc) == without_timestamp(soup_doc)
+
+
+@pytest.mark.parametrize("html", [TUTORIAL_PAGE, LISTING_PAGE, OBJECT_PAGE, "", "<h2>Heading only"])
+def test_tutorial_parsers_agree(html):
+    lxml_doc = parse_tutorial_lxml(html, "basicchapter01", "https://example.com/tutorials/basicchapter01")
+    soup_doc = parse_tutorial_soup(html, "basicchapter01", "https://example.com/tutorials/basicchapter01")
+    assert without_timestamp(lxml_doc) == without_timestamp(soup_doc)
+
+
+def test_object_page_structure():
+    doc = parse_object_doc_lxml(OBJECT_PAGE, "metro", "/refpages/metro")
+
+    assert doc["description"] == "Output abangat   regular intervals& keep time."
+    assert doc["inlets"] == [
+        {"index": 0, "type": "bang", "description": "Start or stopthemetronome"},
+        {"index": 1, "type": "signal", "description": "Interval inms"},
+    ]
+    assert doc["outlets"] == [{"index": 0, "type": "bang", "description": "Bang on every tick"}]
+    assert doc["attributes"] == {
+        "active": {"type": "int", "description": "activeTurn on and off"},
+        "interval": {"type": "float", "description": "intervalTime between ticks"},
+    }
+    assert doc["examples"] == [
+        {"description": "Basic usemetro 500then more text", "code": "  metro 500\n  "},
+        {"description": "Without code", "code": ""},
+    ]
+    assert doc["related_objects"] == ["counter", "tempo"]
+
+
+def test_tutorial_and_listing_page_structure():
+    tutorial = parse_tutorial_lxml(TUTORIAL_PAGE, "basicchapter01", "/tutorials/basicchapter01")
+    assert tutorial["title"] == "BasicChapter1"
+    assert [section["type"] for section in tutorial["sections"]] == [
+        "h2",
+        "p",
+        "code",
+        "h3",
+        "p",
+        "p",
+        "code",
+        "h2",
+        "p",
+    ]
+    assert tutorial["sections"][1] == {"type": "p", "content": "Open the patch andclickthe toggle."}
+    assert tutorial["sections"][6] == {"type": "code", "content": "metro 100 -> counter"}
+
+    listing = parse_tutorial_lxml(LISTING_PAGE, "listing", "/tutorials/listing")
+    assert listing["title"] == "Max Object Functional Listing"
+    assert [section["content"] for section in listing["sections"]] == [
+        "Timing",
+        "metrodelay",
+        "Lists",
+        "zl— list processing",
+        "Reference page",
+        "iter",
+    ]
@@ -0,0 +1,143 @@
+"""Tests for the SQLite documentation store"""
+
+import sqlite3
+import time
+import types
+
+import pytest
+
+from src.knowledge import doc_store
+from src.knowledge.cycling74_connector import Cycling74Connector
+from src.knowledge.doc_store import DocStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Deterministic store clock, so access order is unambiguous"""
+    fake = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(doc_store, "time", types.SimpleNamespace(time=lambda: fake.now))
+    return fake
+
+
+def test_round_trip_with_metadata(tmp_path, clock):
+    store = DocStore(tmp_path / "docs.db")
+    store.put("objects/metro", {"name": "metro", "inlets": [1, 2]}, {"etag": "abc"})
+
+    entry = store.get_entry("objects/metro")
+    assert entry.data == {"name": "metro", "inlets": [1, 2]}
+    assert entry.meta == {"etag": "abc"}
+    assert entry.stored_at == 1000.0
+    assert store.get("objects/missing") is None
+    assert "objects/metro" in store and len(store) == 1
+    assert store.keys("objects/") == ["objects/metro"]
+    store.close()
+
+
+def test_capped_store_evicts_least_recently_used(tmp_path, clock):
+    doc = {"text": "x" * 200}
+    probe = DocStore(tmp_path / "probe.db")
+    probe.put("objects/a", doc)
+    entry_size = probe.size_bytes()
+    probe.close()
+
+    store = DocStore(tmp_path / "docs.db", max_size_bytes=int(entry_size * 3.5))
+    for key in ("objects/a", "objects/b", "objects/c"):
+        store.put(key, doc)
+        clock.now += 100
+
+    # Reading "a" refreshes it once the access granularity has passed
+    assert store.get("objects/a") == doc
+    clock.now += 100
+
+    store.put("objects/d", doc)
+    assert store.keys() == ["objects/a", "objects/c", "objects/d"]
+    assert store.evictions == 1
+    assert store.size_bytes() <= store.max_size_bytes
+    store.close()
+
+
+def test_eviction_frees_down_to_low_water(tmp_path, clock):
+    doc = {"text": "y" * 200}
+    store = DocStore(tmp_path / "docs.db", max_size_bytes=2_000)
+    for index in range(200):
+        store.put(f"objects/{index:03}", doc)
+        clock.now += 1
+
+    assert store.evictions > 0
+    assert store.size_bytes() <= 2_000
+    # The newest entries survive
+    assert "objects/199" in store
+    assert "objects/000" not in store
+    store.close()
+
+
+def test_uncapped_store_never_evicts(tmp_path, clock):
+    store = DocStore(tmp_path / "docs.db")
+    store.put_many((f"objects/{index}", {"text": "z" * 500}) for index in range(100))
+    assert len(store) == 100
+    assert store.evictions == 0
+    store.close()
+
+
+def test_reads_do_not_wait_for_writers(tmp_path, clock):
+    store = DocStore(tmp_path / "docs.db", max_size_bytes=1_000_000, busy_timeout=5.0)
+    store.put("objects/metro", {"name": "metro"})
+
+    # Another process holds the database write lock, and a writer of this process holds the store lock
+    other = sqlite3.connect(str(tmp_path / "docs.db"), isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    other.execute("UPDATE docs SET stored_at = 0")
+    clock.now += 100
+    with store._lock:
+        start = time.perf_counter()
+        assert store.get("objects/metro") == {"name": "metro"}
+        assert store.get_entry("objects/metro").stored_at == 1000.0
+        assert store.keys() == ["objects/metro"] and len(store) == 1
+        assert time.perf_counter() - start < 0.5
+    other.execute("ROLLBACK")
+    other.close()
+    store.close()
+
+
+def test_access_times_are_written_back_with_the_next_write(tmp_path, clock):
+    path = tmp_path / "docs.db"
+    store = DocStore(path, max_size_bytes=1_000_000)
+    store.put("objects/metro", {"name": "metro"})
+
+    def accessed_at():
+        with sqlite3.connect(str(path)) as conn:
+            return conn.execute("SELECT accessed_at FROM docs WHERE key = 'objects/metro'").fetchone()[0]
+
+    clock.now += 100
+    store.get("objects/metro")
+    assert accessed_at() == 1000.0
+
+    store.put("objects/line", {"name": "line"})
+    assert accessed_at() == 1100.0
+
+    clock.now += 100
+    store.get("objects/metro")
+    store.close()
+    assert accessed_at() == 1200.0
+
+
+def test_connector_removes_the_previous_cache_layout(tmp_path):
+    (tmp_path / "objects").mkdir()
+    (tmp_path / "tutorials").mkdir()
+    legacy = [
+        tmp_path / "objects" / "metro.json",
+        tmp_path / "objects" / "metro.json.meta",
+        tmp_path / "tutorials" / "basicchapter01.json",
+        tmp_path / "object_index.json",
+    ]
+    for path in legacy:
+        path.write_text("{}")
+
+    connector = Cycling74Connector({"cache_dir": str(tmp_path), "mirror_path": str(tmp_path / "mirror.db")})
+    connector.cache.put("objects/metro", {"name": "metro"})
+    connector._remove_legacy_cache()
+
+    assert not any(path.exists() for path in legacy)
+    assert sorted(path.name for path in tmp_path.iterdir() if not path.name.startswith("docs.db")) == []
+    assert connector.cache.get("objects/metro") == {"name": "metro"}
+    connector.cache.close()
@@ -0,0 +1,74 @@
+"""Tests for the engine's cache of fused query results"""
+
+from typing import List
+
+import pytest
+import pytest_asyncio
+
+from src.knowledge import KnowledgeFusionEngine
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    engine = KnowledgeFusionEngine(
+        {
+            "query_budget": None,
+            "pattern_expiry": 86400,
+            "auto_enhance_knowledge": False,
+            "cycling74_docs": {
+                "cache_dir": str(tmp_path),
+                "mirror_path": str(tmp_path / "mirror.db"),
+                "cache_duration": 600,
+            },
+            "minutiae_repo": {"local_path": str(tmp_path), "watch_for_changes": False, "index_snapshot": False},
+        }
+    )
+
+    # Each source search is counted; only a cache miss reaches the sources
+    searched: List[str] = []
+
+    async def search_docs(queries, deadline=None):
+        searched.extend(queries)
+        return [[{"object_name": "metro", "description": "Output bangs", "relevance": 0.8}] for _ in queries]
+
+    async def search_notes(queries, context=None):
+        return [[] for _ in queries]
+
+    engine.cycling74.search_many = search_docs
+    engine.minutiae.search_many = search_notes
+    engine.searched = searched
+    yield engine
+    await engine.cycling74.close()
+
+
+def test_ttl_is_capped_at_the_doc_freshness(engine):
+    assert engine.fusion_cache.ttl == 600
+
+
+@pytest.mark.asyncio
+async def test_context_is_part_of_the_cache_key(engine):
+    await engine.query("metro", {"domain": "timing", "level": 1})
+    await engine.query("Metro ", {"level": 1, "domain": "timing"})
+    assert engine.searched == ["metro"]
+
+    await engine.query("metro", {"domain": "audio", "level": 1})
+    await engine.query("metro")
+    assert engine.searched == ["metro", "metro", "metro"]
+    assert len(engine.fusion_cache) == 3
+
+
+@pytest.mark.asyncio
+async def test_source_generation_bump_invalidates(engine):
+    first = await engine.query("metro")
+    assert await engine.query("metro") == first
+    assert len(engine.searched) == 1
+
+    # A cached doc changed upstream
+    engine.cycling74.doc_generation += 1
+    await engine.query("metro")
+    assert len(engine.searched) == 2
+    assert len(engine.fusion_cache) == 1
+
+    engine.minutiae.index_generation += 1
+    await engine.query("metro")
+    assert len(engine.searched) == 3
@@ -0,0 +1,68 @@
+"""Tests for building the object index from the listing files"""
+
+import pytest
+
+from src.knowledge.cycling74_connector import CATALOG_KEY, Cycling74Connector
+
+OBJECT_LISTING = """## A Functional Listing of all Max Objects
+
+## Timing
+
+[metro](https://docs.cycling74.com/max8/refpages/metro) [delay](https://docs.cycling74.com/max8/refpages/delay)
+"""
+
+TUTORIAL_LISTING = """## Max 8 Tutorials
+
+## Contents
+
+- [Max Basic Tutorial 4: Metro and Toggle](https://docs.cycling74.com/legacy/max8/tutorials/basicchapter04)
+"""
+
+
+@pytest.fixture
+def listings(tmp_path):
+    listings = tmp_path / "listings"
+    listings.mkdir()
+    (listings / "Max Object Functional Listing.md").write_text(OBJECT_LISTING)
+    (listings / "Max Tutorials.md").write_text(TUTORIAL_LISTING)
+    return listings
+
+
+async def load_catalog(tmp_path, listings, monkeypatch, builds):
+    """Load the catalog with a fresh connector over the shared doc cache, counting rebuilds"""
+    connector = Cycling74Connector(
+        {"cache_dir": str(tmp_path), "mirror_path": str(tmp_path / "mirror.db"), "listings_path": str(listings)}
+    )
+    build_catalog = connector._build_catalog
+
+    def counted(sources):
+        builds.append([name for name, _ in sources])
+        return build_catalog(sources)
+
+    monkeypatch.setattr(connector, "_build_catalog", counted)
+    catalog = await connector._load_listing_catalog()
+    stored = connector.cache.get_entry(CATALOG_KEY)
+    await connector.close()
+    return catalog, stored
+
+
+@pytest.mark.asyncio
+async def test_unchanged_listings_reuse_the_cached_catalog(tmp_path, listings, monkeypatch):
+    builds = []
+    first, stored = await load_catalog(tmp_path, listings, monkeypatch, builds)
+    assert builds == [["Max Object Functional Listing.md", "Max Tutorials.md"]]
+    assert set(first) == {"metro", "delay", "Max Basic Tutorial 4: Metro and Toggle"}
+    digest = stored.meta["sources"]
+
+    # Same listing content: the digest matches and nothing is parsed
+    second, stored = await load_catalog(tmp_path, listings, monkeypatch, builds)
+    assert len(builds) == 1
+    assert second == first
+    assert stored.meta["sources"] == digest
+
+    # One listing changes: the catalog is rebuilt under a new digest
+    (listings / "Max Tutorials.md").write_text(TUTORIAL_LISTING.replace("Metro and Toggle", "Metro"))
+    third, stored = await load_catalog(tmp_path, listings, monkeypatch, builds)
+    assert len(builds) == 2
+    assert "Max Basic Tutorial 4: Metro" in third
+    assert stored.meta["sources"] != digest
@@ -0,0 +1,72 @@
+"""Tests for the LRU cache"""
+
+from src.knowledge.lru_cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_entries_expire_after_ttl_from_storage():
+    clock = FakeClock()
+    cache = LRUCache(10, ttl=5.0, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 4.0
+    assert cache.get("a") == 1  # Lookups do not extend the entry's life
+    clock.now = 5.5
+    assert "a" not in cache
+    assert cache.get("a", "default") == "default"
+
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["size"] == 0
+
+    cache.put("a", 2)
+    assert cache.get("a") == 2
+
+
+def test_counters():
+    cache = LRUCache(3)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("missing")
+    cache.put("b", 2)
+    assert cache.invalidate("a")
+    assert not cache.invalidate("a")
+    cache.clear()
+
+    assert cache.stats() == {
+        "size": 0,
+        "max_size": 3,
+        "hits": 2,
+        "misses": 1,
+        "hit_rate": 2 / 3,
+        "evictions": 0,
+        "expirations": 0,
+        "invalidations": 2,
+    }
+
+
+def test_max_size_is_at_least_one():
+    cache = LRUCache(0)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
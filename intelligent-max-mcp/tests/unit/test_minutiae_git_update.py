@@ -0,0 +1,73 @@
+"""Tests for re-indexing the minutiae repository from a git diff"""
+
+from typing import List
+
+import pytest
+from git import Repo
+
+from src.knowledge.minutiae_connector import MinutiaeConnector
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "minutiae"
+    (root / "sample-playback").mkdir(parents=True)
+    (root / "README.md").write_text("# Minutiae\n\nNotes on Max patching.\n")
+    (root / "sample-playback" / "groove.md").write_text("# Groove looping\n\nUse groove~ with a buffer~.\n")
+    (root / "sample-playback" / "stutter.md").write_text("# Stutter\n\nRetrigger play~ quickly.\n")
+    (root / "sample-playback" / "reverse.md").write_text("# Reverse\n\nBackwards playback with a negative rate.\n")
+
+    git = Repo.init(root)
+    git.index.add(
+        ["README.md", "sample-playback/groove.md", "sample-playback/stutter.md", "sample-playback/reverse.md"]
+    )
+    git.index.commit("Initial notes")
+    return root
+
+
+@pytest.mark.asyncio
+async def test_diff_reindexes_only_changed_paths(repo, monkeypatch):
+    connector = MinutiaeConnector(
+        {"local_path": str(repo), "watch_for_changes": False, "index_snapshot": False, "index_executor": "thread"}
+    )
+    await connector.initialize()
+    old_hash = connector.last_commit_hash
+
+    # Second commit: add, modify, delete and rename
+    git = Repo(repo)
+    (repo / "sample-playback" / "granular.md").write_text("# Granular clouds\n\nScatter grains with poly~.\n")
+    (repo / "sample-playback" / "groove.md").write_text("# Groove looping\n\nVarispeed groove~ with sig~.\n")
+    git.index.add(["sample-playback/granular.md", "sample-playback/groove.md"])
+    git.index.remove(["sample-playback/stutter.md"], working_tree=True)
+    git.index.move(["sample-playback/reverse.md", "sample-playback/backwards.md"])
+    new_hash = git.index.commit("Rework sample playback notes").hexsha
+
+    parsed: List[str] = []
+    parse_files = connector._parse_files
+
+    async def record(files):
+        parsed.extend(str(path.relative_to(repo)) for path in files)
+        return await parse_files(files)
+
+    monkeypatch.setattr(connector, "_parse_files", record)
+    await connector._update_index(old_hash, new_hash)
+
+    assert sorted(parsed) == [
+        "sample-playback/backwards.md",
+        "sample-playback/granular.md",
+        "sample-playback/groove.md",
+    ]
+    assert set(connector.path_entries) == {
+        "README.md",
+        "sample-playback/backwards.md",
+        "sample-playback/granular.md",
+        "sample-playback/groove.md",
+    }
+    assert set(connector.file_stats) == set(connector.path_entries)
+    assert all(record.file_path in connector.path_entries for record in connector.entries.values())
+
+    assert [hit["file_path"] for hit in await connector.search("varispeed")] == ["sample-playback/groove.md"]
+    assert [hit["file_path"] for hit in await connector.search("backwards negative")][:1] == [
+        "sample-playback/backwards.md"
+    ]
+    assert await connector.search("retrigger") == []
@@ -0,0 +1,82 @@
+"""Tests for hydrating minutiae search hits from disk"""
+
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from src.knowledge.minutiae_connector import MinutiaeConnector
+from src.knowledge.minutiae_indexers import parse_file
+
+GROOVE = (
+    "# Groove looping\r\n\r\nLoop a buffer~ with groove~ and sync it to the transport.\r\n\r\n"
+    '```js\r\nfunction bang() {\r\n    outlet(0, "café");\r\n}\r\n```\r\n\r\n'
+    + "Varispeed notes. " * 40
+    + "\r\n\r\n```\r\ngroove~ 2\r\n```\r\n"
+)
+STUTTER = "# Stutter\n\nRetrigger groove~ quickly.\n\n```max\nmetro 50\n```\n"
+
+
+def legacy_entry(path: Path, rel_path: str) -> Dict[str, Any]:
+    """The entry as it was kept in memory when previews and code examples were resident"""
+    [(_, entry)] = parse_file(path, rel_path)
+    del entry["preview_chars"], entry["code_spans"], entry["passages"]
+    content = path.read_bytes().decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    entry["code_examples"] = [
+        {"language": language or "text", "code": code}
+        for language, code in re.findall(r"```(\w+)?\n(.*?)\n```", content, re.DOTALL)
+    ]
+    entry["content_preview"] = content[:500]
+    return entry
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / "sample-playback").mkdir()
+    (tmp_path / "sample-playback" / "groove.md").write_bytes(GROOVE.encode("utf-8"))
+    (tmp_path / "sample-playback" / "stutter.md").write_text(STUTTER)
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_hydrated_hits_match_resident_entries(repo):
+    connector = MinutiaeConnector({"local_path": str(repo), "watch_for_changes": False, "index_snapshot": False})
+    await connector._build_index()
+
+    hits = connector.search_hits("retrigger groove looping")
+    assert len(hits) == 2
+    for entry_id, relevance in hits:
+        record = connector.entries[entry_id]
+        assert not hasattr(record, "content_preview") and not hasattr(record, "code_examples")
+
+        expected = legacy_entry(repo / record.file_path, record.file_path)
+        expected.update(relevance=relevance, category=record.category)
+        assert await connector.hydrate(entry_id, relevance) == expected
+
+    groove = next(entry_id for entry_id, _ in hits if connector.entries[entry_id].file_path.endswith("groove.md"))
+    hydrated = await connector.hydrate(groove)
+    assert len(hydrated["content_preview"]) == 500
+    assert [example["language"] for example in hydrated["code_examples"]] == ["js", "text"]
+
+    # search() hydrates the same dictionaries, adding the best matching passage
+    results = await connector.search("retrigger groove looping")
+    for result in results:
+        result.pop("matching_passage", None)
+    assert results == [await connector.hydrate(entry_id, relevance) for entry_id, relevance in hits]
+
+
+@pytest.mark.asyncio
+async def test_files_edited_since_indexing_are_not_read_back(repo):
+    connector = MinutiaeConnector({"local_path": str(repo), "watch_for_changes": False, "index_snapshot": False})
+    await connector._build_index()
+
+    stutter = repo / "sample-playback" / "stutter.md"
+    stat = stutter.stat()
+    os.utime(stutter, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    [(entry_id, _)] = connector.search_hits("retrigger")
+    hydrated = await connector.hydrate(entry_id)
+    assert "content_preview" not in hydrated and "code_examples" not in hydrated
+    assert hydrated["title"] == "Stutter"
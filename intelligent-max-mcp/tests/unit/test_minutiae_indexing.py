@@ -0,0 +1,83 @@
+"""Tests for collecting and parsing the minutiae repository files"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from src.knowledge.minutiae_connector import MinutiaeConnector
+
+SCAFFOLDING = "jsui-temporal-scaffolding"
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "minutiae"
+    scaffolding = root / SCAFFOLDING
+    (scaffolding / "examples").mkdir(parents=True)
+    (scaffolding / "node_modules" / "pkg").mkdir(parents=True)
+    (root / "sample-playback").mkdir()
+    (root / "scratch").mkdir()
+
+    (root / "README.md").write_text("# Minutiae\n\nNotes on Max patching.\n")
+    (root / "TODO.md").write_text("# Not a root file\n")
+    (root / "scratch" / "draft.md").write_text("# Outside the key directories\n")
+    (scaffolding / "README.md").write_text("# Scaffolding\n\nDrive a jsui clock from a metro.\n")
+    (scaffolding / "clock.js").write_text("// Clock\nfunction bang() {\n    outlet(0, 1);\n}\n")
+    (scaffolding / "examples" / "grid.md").write_text("# Grid\n\nQuantize to a transport grid.\n")
+    (scaffolding / "examples" / "image.png").write_bytes(b"\x89PNG")
+    (scaffolding / "node_modules" / "pkg" / "index.js").write_text("module.exports = {};\n")
+    (scaffolding / "clock.maxpat").write_text(
+        json.dumps({"patcher": {"boxes": [{"box": {"maxclass": "newobj", "text": "metro 100"}}], "lines": []}})
+    )
+    (root / "sample-playback" / "groove.md").write_text("# Groove looping\n\nUse groove~ with a buffer~.\n")
+    (root / "sample-playback" / "preset.json").write_text(json.dumps({"name": "loop", "rate": 1.0}))
+
+    # The same file and directory reached again through symlinks, and a symlink loop
+    os.symlink(root / "sample-playback" / "groove.md", scaffolding / "groove-link.md")
+    os.symlink(root / "sample-playback", root / "presets")
+    os.symlink(scaffolding, scaffolding / "examples" / "loop")
+    return root
+
+
+def make_connector(repo, **config) -> MinutiaeConnector:
+    return MinutiaeConnector({"local_path": str(repo), "watch_for_changes": False, "index_snapshot": False, **config})
+
+
+def test_walk_applies_ignore_rules_and_returns_each_file_once(repo):
+    files = make_connector(repo)._collect_files()
+    rel_paths = [str(path.relative_to(repo)) for path in files]
+
+    assert len(rel_paths) == len(set(rel_paths))
+    assert len({os.path.realpath(path) for path in files}) == len(files)
+    # The symlinked copies may win over their targets depending on walk order
+    assert {os.path.realpath(path) for path in files} == {
+        str(repo / "README.md"),
+        str(repo / SCAFFOLDING / "README.md"),
+        str(repo / SCAFFOLDING / "clock.js"),
+        str(repo / SCAFFOLDING / "clock.maxpat"),
+        str(repo / SCAFFOLDING / "examples" / "grid.md"),
+        str(repo / "sample-playback" / "groove.md"),
+        str(repo / "sample-playback" / "preset.json"),
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor, pool_type", [("thread", ThreadPoolExecutor), ("process", ProcessPoolExecutor)])
+async def test_pooled_parse_matches_serial_parse(repo, executor, pool_type):
+    serial = make_connector(repo, index_workers=1)
+    pooled = make_connector(repo, index_executor=executor, index_workers=3, index_batch_size=2)
+    files = serial._collect_files()
+
+    # Two files per batch: the pooled run spreads the batches over a worker pool
+    pool = pooled._create_executor(len(files) // 2)
+    assert isinstance(pool, pool_type)
+    pool.shutdown()
+    assert serial._create_executor(len(files) // 2) is None
+
+    serial_parsed = await serial._parse_files(files)
+    pooled_parsed = await pooled._parse_files(files)
+    assert sorted(pooled_parsed, key=lambda parsed: parsed[0]) == sorted(serial_parsed, key=lambda parsed: parsed[0])
+    assert len(serial_parsed) == len(files)
+    assert all(error is None for _, _, error in serial_parsed)
@@ -0,0 +1,131 @@
+"""Tests for restoring the minutiae index from its on-disk snapshot"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+from git import Repo
+
+from src.knowledge.minutiae_connector import MinutiaeConnector
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "minutiae"
+    (root / "sample-playback").mkdir(parents=True)
+    (root / "README.md").write_text("# Minutiae\n\nNotes on Max patching.\n")
+    (root / "sample-playback" / "groove.md").write_text("# Groove looping\n\nUse groove~ with a buffer~.\n")
+    (root / "sample-playback" / "stutter.md").write_text("# Stutter\n\nRetrigger play~ quickly.\n")
+
+    git = Repo.init(root)
+    git.index.add(["README.md", "sample-playback/groove.md", "sample-playback/stutter.md"])
+    git.index.commit("Initial notes")
+    return root
+
+
+def make_connector(repo, tmp_path, **config) -> MinutiaeConnector:
+    return MinutiaeConnector(
+        {
+            "local_path": str(repo),
+            "watch_for_changes": False,
+            "offline": True,
+            "index_executor": "thread",
+            "snapshot_path": str(tmp_path / "snapshot.pkl"),
+            **config,
+        }
+    )
+
+
+async def restart(repo, tmp_path, monkeypatch) -> MinutiaeConnector:
+    """Initialize a fresh connector, failing if it rebuilds instead of loading the snapshot"""
+    connector = make_connector(repo, tmp_path)
+
+    async def no_rebuild():
+        raise AssertionError("snapshot was not reused")
+
+    monkeypatch.setattr(connector, "_build_index", no_rebuild)
+    await connector.initialize()
+    return connector
+
+
+def touch_later(path):
+    """Move a file's modification time forward, so an edit is seen on coarse-grained filesystems"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.asyncio
+async def test_snapshot_catches_up_on_uncommitted_changes(repo, tmp_path, monkeypatch):
+    first = make_connector(repo, tmp_path)
+    await first.initialize()
+    assert set(first.file_stats) == {"README.md", "sample-playback/groove.md", "sample-playback/stutter.md"}
+
+    # Uncommitted edits while the server is down; HEAD stays the same
+    (repo / "sample-playback" / "granular.md").write_text("# Granular clouds\n\nScatter grains with poly~.\n")
+    (repo / "sample-playback" / "groove.md").write_text("# Groove looping\n\nVarispeed groove~ with sig~.\n")
+    touch_later(repo / "sample-playback" / "groove.md")
+    (repo / "sample-playback" / "stutter.md").unlink()
+
+    second = await restart(repo, tmp_path, monkeypatch)
+    assert set(second.path_entries) == {"README.md", "sample-playback/groove.md", "sample-playback/granular.md"}
+    assert [hit["file_path"] for hit in await second.search("granular clouds")][:1] == ["sample-playback/granular.md"]
+    assert [hit["file_path"] for hit in await second.search("varispeed")] == ["sample-playback/groove.md"]
+    assert await second.search("retrigger") == []
+
+    # The reconciled state was saved, so the next restart has nothing to catch up on
+    reindexed = []
+
+    async def record(changed, removed):
+        reindexed.append((changed, removed))
+
+    third = make_connector(repo, tmp_path)
+    monkeypatch.setattr(third, "_reindex_paths", record)
+    assert third._load_snapshot(Repo(repo).head.commit.hexsha)
+    await third._reconcile_working_tree()
+    assert reindexed == []
+
+
+@pytest.mark.asyncio
+async def test_watcher_flush_saves_the_snapshot(repo, tmp_path, monkeypatch):
+    first = make_connector(repo, tmp_path, snapshot_delay=60.0)
+    await first.initialize()
+
+    (repo / "README.md").write_text("# Minutiae\n\nNotes on polyrhythm scheduling.\n")
+    touch_later(repo / "README.md")
+    first._queue_change(str(repo / "README.md"), False)
+    await asyncio.sleep(first.debounce_interval * 4)
+    assert [hit["file_path"] for hit in await first.search("polyrhythm")] == ["README.md"]
+
+    # The save is still waiting on its debounce; closing writes it out
+    await first.close()
+
+    second = await restart(repo, tmp_path, monkeypatch)
+    assert second.file_stats == first.file_stats
+    assert [hit["file_path"] for hit in await second.search("polyrhythm")] == ["README.md"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_saves_are_coalesced_off_the_loop(repo, tmp_path):
+    connector = make_connector(repo, tmp_path, snapshot_delay=0.2, debounce_interval=0.01)
+    await connector.initialize()
+
+    writes = []
+    write_snapshot = connector._write_snapshot
+
+    def record(header, state):
+        writes.append(threading.current_thread() is threading.main_thread())
+        write_snapshot(header, state)
+
+    connector._write_snapshot = record
+    for index in range(3):
+        (repo / "README.md").write_text(f"# Minutiae\n\nEdit number {index}.\n")
+        touch_later(repo / "README.md")
+        connector._queue_change(str(repo / "README.md"), False)
+        await asyncio.sleep(connector.debounce_interval * 4)
+
+    assert writes == []
+    await asyncio.sleep(connector.snapshot_delay * 2)
+    assert writes == [False]
+    await connector.close()
+    assert writes == [False]
@@ -0,0 +1,132 @@
+"""Tests for working tree event handling in the minutiae connector"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+pytest.importorskip("watchdog")
+from watchdog.events import (  # noqa: E402
+    DirCreatedEvent,
+    DirDeletedEvent,
+    DirModifiedEvent,
+    DirMovedEvent,
+    FileClosedEvent,
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileOpenedEvent,
+)
+
+from src.knowledge.minutiae_connector import MinutiaeConnector, _WorkingTreeHandler  # noqa: E402
+
+SCAFFOLDING = "jsui-temporal-scaffolding"
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / "README.md").write_text("# Minutiae\n")
+    (tmp_path / SCAFFOLDING / "examples").mkdir(parents=True)
+    for name in ("README.md", "clock.md", "phasor.md", "examples/grid.md", "examples/swing.md"):
+        (tmp_path / SCAFFOLDING / name).write_text(f"# {name}\n")
+    (tmp_path / "sample-playback").mkdir()
+    (tmp_path / "sample-playback" / "groove.md").write_text("# groove~\n")
+    return tmp_path
+
+
+@pytest.fixture
+def connector(repo):
+    return MinutiaeConnector(
+        {"local_path": str(repo), "watch_for_changes": False, "index_snapshot": False, "debounce_interval": 0.01}
+    )
+
+
+@pytest.fixture
+def reindexed(connector, monkeypatch) -> List[List[str]]:
+    """Paths handed to each re-index"""
+    calls: List[List[str]] = []
+
+    async def record(changed, removed):
+        calls.append(list(changed))
+
+    monkeypatch.setattr(connector, "_reindex_paths", record)
+    return calls
+
+
+async def deliver(connector, events):
+    """Feed events through the watchdog handler and wait for the debounced flush"""
+    handler = _WorkingTreeHandler(connector._queue_change, asyncio.get_running_loop())
+    for event in events:
+        handler.on_any_event(event)
+    await asyncio.sleep(connector.debounce_interval * 10)
+
+
+@pytest.mark.asyncio
+async def test_atomic_save_reindexes_only_the_saved_file(repo, connector, reindexed):
+    directory = str(repo / SCAFFOLDING)
+    temporary = str(repo / SCAFFOLDING / ".README.md.tmp")
+    # The events watchdog reports for write-to-temp-then-rename
+    await deliver(
+        connector,
+        [
+            FileCreatedEvent(temporary),
+            DirModifiedEvent(directory),
+            FileOpenedEvent(temporary),
+            FileModifiedEvent(temporary),
+            FileClosedEvent(temporary),
+            DirModifiedEvent(directory),
+            FileMovedEvent(temporary, str(repo / SCAFFOLDING / "README.md")),
+            DirModifiedEvent(directory),
+        ],
+    )
+    assert reindexed == [[f"{SCAFFOLDING}/README.md"]]
+
+
+@pytest.mark.asyncio
+async def test_in_place_root_edit_reindexes_only_that_file(repo, connector, reindexed):
+    readme = str(repo / "README.md")
+    await deliver(
+        connector,
+        [FileOpenedEvent(readme), FileModifiedEvent(readme), FileClosedEvent(readme), DirModifiedEvent(str(repo))],
+    )
+    assert reindexed == [["README.md"]]
+
+
+@pytest.mark.asyncio
+async def test_directory_modified_alone_reindexes_nothing(repo, connector, reindexed):
+    await deliver(connector, [DirModifiedEvent(str(repo)), DirModifiedEvent(str(repo / SCAFFOLDING))])
+    assert reindexed == []
+
+
+@pytest.mark.asyncio
+async def test_created_and_moved_directories_expand_to_their_files(repo, connector, reindexed):
+    examples = repo / SCAFFOLDING / "examples"
+    renamed = repo / SCAFFOLDING / "patterns"
+    examples.rename(renamed)
+    connector.path_entries = {f"{SCAFFOLDING}/examples/grid.md": [0], f"{SCAFFOLDING}/examples/swing.md": [1]}
+
+    await deliver(connector, [DirMovedEvent(str(examples), str(renamed)), DirModifiedEvent(str(repo / SCAFFOLDING))])
+    assert reindexed == [
+        [
+            f"{SCAFFOLDING}/examples/grid.md",
+            f"{SCAFFOLDING}/examples/swing.md",
+            f"{SCAFFOLDING}/patterns/grid.md",
+            f"{SCAFFOLDING}/patterns/swing.md",
+        ]
+    ]
+
+    reindexed.clear()
+    (repo / "sample-playback" / "loops").mkdir()
+    (repo / "sample-playback" / "loops" / "stutter.md").write_text("# stutter\n")
+    await deliver(connector, [DirCreatedEvent(str(repo / "sample-playback" / "loops"))])
+    assert reindexed == [["sample-playback/loops/stutter.md"]]
+
+
+@pytest.mark.asyncio
+async def test_deleted_directory_drops_its_indexed_files(repo, connector, reindexed):
+    connector.path_entries = {"sample-playback/groove.md": [0], "README.md": [1]}
+    (repo / "sample-playback" / "groove.md").unlink()
+    (repo / "sample-playback").rmdir()
+
+    await deliver(connector, [DirDeletedEvent(str(repo / "sample-playback")), DirModifiedEvent(str(repo))])
+    assert reindexed == [["sample-playback/groove.md"]]
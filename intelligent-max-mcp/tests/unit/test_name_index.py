@@ -0,0 +1,40 @@
+"""Tests for the n-gram and completion name indexes"""
+
+from src.knowledge.name_index import CompletionIndex, NgramIndex
+
+NAMES = ["groove~", "grab", "gate", "grooveduck~", "gizmo~", "groups", "grow", "glove", "gen~", "rgroove"]
+WEIGHTS = [3, 1, 1, 0, 1, 0, 0, 0, 2, 0]
+
+
+def test_ngram_find_matches_substring_scan():
+    texts = ["metro", "Groove~", "grooveduck~", "jit.matrix", "counter", "ro"]
+    index = NgramIndex(texts)
+    for substring in ["", "r", "ro", "oov", "groove", "GROOVE~", "matrix", "etro", "xyz", "roo ve"]:
+        expected = [i for i, text in enumerate(texts) if substring.lower() in text.lower()]
+        assert list(index.find(substring)) == expected, substring
+
+
+def test_completion_ranks_weight_then_length_then_name():
+    index = CompletionIndex(NAMES, WEIGHTS, top_k=10)
+    assert index.complete("gro", 4) == ["groove~", "grow", "groups", "grooveduck~"]
+
+
+def test_completion_fills_with_near_misses():
+    index = CompletionIndex(NAMES, WEIGHTS, top_k=10)
+    # "grab" shares "gr" and the first letter; "rgroove" starts with another letter
+    assert index.complete("gro") == ["groove~", "grow", "groups", "grooveduck~", "grab"]
+
+
+def test_completion_beyond_precomputed_top_k():
+    small = CompletionIndex(NAMES, WEIGHTS, top_k=2)
+    assert small.top["gro"] == ("groove~", "grow")
+    assert small.complete("gro", 2) == ["groove~", "grow"]
+    assert small.complete("gro", 5) == CompletionIndex(NAMES, WEIGHTS, top_k=10).complete("gro", 5)
+
+
+def test_completion_is_case_insensitive_and_handles_empty_input():
+    index = CompletionIndex(NAMES, WEIGHTS)
+    assert index.complete("GRO", 1) == ["groove~"]
+    assert index.complete("", 5) == []
+    assert index.complete("gro", 0) == []
+    assert index.complete("zzz") == []
@@ -0,0 +1,83 @@
+"""Tests for the Aho-Corasick object tagger"""
+
+import pytest
+
+from src.knowledge import minutiae_indexers
+from src.knowledge.object_tagger import ObjectTagger
+
+CATALOG = ["line", "line~", "jit.line", "metro", "live.dial", "groove~", "t", "+", "jit gl"]
+WORD_CATALOG = CATALOG + ["change", "value", "delay", "print", "gate", "route", "key", "number"]
+
+
+@pytest.fixture(scope="module")
+def tagger() -> ObjectTagger:
+    return ObjectTagger(CATALOG)
+
+
+@pytest.mark.parametrize(
+    "text, objects",
+    [
+        ("use line~ and metro together", {"line~", "metro"}),
+        ("the jit.line object", {"jit.line"}),
+        ("a metronome is not metro-like", set()),
+        ("(metro) and [line~]", {"line~", "metro"}),
+        ("ends with metro.", {"metro"}),
+        ("see line.dial", set()),
+        ("live.dial, then groove~.", {"live.dial", "groove~"}),
+        ("lines of text", set()),
+        ("my_metro abstraction", set()),
+    ],
+)
+def test_objects_match_whole_names_only(tagger, text, objects):
+    assert tagger.tag(text)[0] == objects
+
+
+def test_concepts_match_as_substrings(tagger):
+    objects, concepts = tagger.tag("temporal scaffolding for buffers")
+    assert objects == set()
+    assert concepts == {"temporal", "scaffolding", "buffer"}
+
+
+def test_short_symbolic_and_spaced_names_are_skipped(tagger):
+    assert tagger.object_count == 6
+    assert tagger.ambiguous == {"line"}
+    assert tagger.tag("t + jit gl")[0] == set()
+
+
+def test_ambiguous_names_in_prose_are_not_tagged():
+    tagger = ObjectTagger(WORD_CATALOG)
+    assert tagger.tag("change the value on this line, then print the key number to route the gate") == (set(), set())
+    # Unambiguous names still match anywhere
+    assert tagger.tag("delay the metro by a line~ ramp")[0] == {"metro", "line~"}
+
+
+@pytest.mark.parametrize(
+    "text, objects",
+    [
+        ("use `line 0 500` for a ramp", {"line"}),
+        ("a [change] box drops repeats, a [route 1 2] splits", {"change", "route"}),
+        ("```\ndelay 100\nprint result\n```\nthen delay it", {"delay", "print"}),
+        ("~~~\ngate 2\n~~~", {"gate"}),
+        ("```max\nvalue shared", {"value"}),
+        ("`metro` changes the value", {"metro"}),
+    ],
+)
+def test_ambiguous_names_match_in_code_context(text, objects):
+    assert ObjectTagger(WORD_CATALOG).tag(text)[0] == objects
+
+
+def test_markdown_prose_gets_no_object_tags(tmp_path):
+    note = tmp_path / "note.md"
+    note.write_text("# Ramps\n\nChange the value on this line.\n\n```\nline 0 500\n```\n")
+    minutiae_indexers.set_tagger(ObjectTagger(WORD_CATALOG))
+    try:
+        [(_, entry)] = minutiae_indexers.parse_markdown(note, "note.md", "")
+    finally:
+        minutiae_indexers.set_tagger(None)
+    assert entry["tags"] == ["line"]
+
+
+def test_fingerprint_follows_catalog():
+    assert ObjectTagger(["metro", "line"]).fingerprint == ObjectTagger(["line", "Metro "]).fingerprint
+    assert ObjectTagger(["metro"]).fingerprint != ObjectTagger(["metro", "line"]).fingerprint
+    assert ObjectTagger(["metro", "line"]).fingerprint != ObjectTagger(["metro", "line"], ambiguous=()).fingerprint
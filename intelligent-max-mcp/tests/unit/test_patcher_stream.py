@@ -0,0 +1,115 @@
+"""Tests for the streaming patcher scanner"""
+
+import io
+import json
+from typing import Any, Dict
+
+import pytest
+
+from src.knowledge.patcher_stream import PatcherScanner, scan_patcher
+
+
+def box(maxclass: str, text: str = "", **fields) -> Dict[str, Any]:
+    return {"box": {"id": f"obj-{maxclass}", "maxclass": maxclass, "text": text, "patching_rect": [1.0, 2.0], **fields}}
+
+
+def line(source: str, destination: str) -> Dict[str, Any]:
+    return {"patchline": {"source": [source, 0], "destination": [destination, 0]}}
+
+
+def patcher(boxes, lines=()) -> Dict[str, Any]:
+    return {"fileversion": 1, "rect": [0, 0, 640, 480], "boxes": list(boxes), "lines": list(lines)}
+
+
+# Keys split at every position, escaped quotes and brackets in strings, and a patcher
+# nested inside a subpatcher box
+DOCUMENT = {
+    "patcher": patcher(
+        [
+            box("newobj", "metro 500"),
+            box("comment", 'Say "hi" [not a box] {nor this} \\ ok', outlettype=["", "bang"]),
+            box("message", '\\"quoted\\" ]['),
+            box(
+                "newobj",
+                "p voices",
+                patcher=patcher(
+                    [box("newobj", "cycle~ 440"), box("newobj", "poly~ voice", patcher=patcher([box("inlet")]))],
+                    [line("obj-a", "obj-b")],
+                ),
+            ),
+            {"box": {"id": "obj-x", "class": "jit.matrix", "maxclass": "jit.pwindow"}},
+            box("newobj", "metro 250", varname='"boxes": [{"box": {}}]'),
+        ],
+        [line("obj-a", "obj-b"), line("obj-b", "obj-c")],
+    ),
+    "appversion": {"major": 8, "minor": 6},
+}
+
+EXPECTED = {
+    "object_counts": {
+        "metro": 2,
+        "comment": 1,
+        "message": 1,
+        "p": 1,
+        "cycle~": 1,
+        "poly~": 1,
+        "inlet": 1,
+        "jit.matrix": 1,
+    },
+    "total_lines": 3,
+    "subpatchers": 2,
+    "max_depth": 3,
+}
+
+
+def scan(text: str, chunk_size: int) -> Dict[str, Any]:
+    return scan_patcher(io.StringIO(text), chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize("indent", [None, 1])
+def test_every_chunk_boundary_gives_the_same_summary(indent):
+    text = json.dumps(DOCUMENT, indent=indent)
+    for chunk_size in list(range(1, 90)) + [len(text)]:
+        assert scan(text, chunk_size) == EXPECTED, chunk_size
+
+
+def test_split_escape_before_quote():
+    text = json.dumps({"patcher": patcher([box("message", 'a\\"b"{')])})
+    # The first chunk ends on the backslash that escapes the quote
+    split = text.index('\\\\\\"') + 3
+    scanner = PatcherScanner()
+    scanner.feed(text[:split])
+    assert scanner._escaped
+    scanner.feed(text[split:])
+    assert scanner.summary()["object_counts"] == {"message": 1}
+
+
+def test_long_strings_are_skipped_without_buffering():
+    description = "x" * 100_000 + '"{[' * 1000
+    text = json.dumps({"patcher": patcher([box("comment", "note", description=description)])})
+    scanner = PatcherScanner()
+    for start in range(0, len(text), 1000):
+        scanner.feed(text[start : start + 1000])
+        assert len(scanner._carry) <= 1000
+        assert scanner._parts == []
+    assert scanner.summary()["object_counts"] == {"comment": 1}
+
+
+def test_class_field_outside_a_box_is_ignored():
+    text = json.dumps({"patcher": {"text": "metro", "boxes": [{"box": {"maxclass": "toggle"}}], "lines": []}})
+    assert scan(text, 3)["object_counts"] == {"toggle": 1}
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ('{"patcher": {"boxes": [', "Truncated patcher document"),
+        ('{"patcher": {"boxes": []}, "text"', "Truncated patcher document"),
+        ('{"patcher": {"boxes": [{"box": {"text": "metro', "Unterminated string in patcher"),
+        ('{"patcher": {"description": "' + "x" * 200, "Unterminated string in patcher"),
+        ('{"patcher": {}}]', "Unbalanced brackets in patcher"),
+    ],
+)
+def test_malformed_documents_raise(text, message):
+    with pytest.raises(ValueError, match=message):
+        scan(text, 16)
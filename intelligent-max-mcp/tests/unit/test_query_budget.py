@@ -0,0 +1,82 @@
+"""Tests for the query latency budget against a slow Cycling '74 upstream"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+
+from src.knowledge import KnowledgeFusionEngine
+
+FETCH_LATENCY = 0.5
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    engine = KnowledgeFusionEngine(
+        {
+            "query_budget": 0.3,
+            "source_timeouts": {},
+            "cycling74_docs": {
+                "cache_dir": str(tmp_path),
+                "mirror_path": str(tmp_path / "mirror.db"),
+                "offline": True,
+                "search_deadline": 3.0,
+            },
+            "minutiae_repo": {"local_path": str(tmp_path), "watch_for_changes": False, "index_snapshot": False},
+        }
+    )
+    await engine.cycling74.initialize()
+
+    # Reference pages take longer than the budget on first fetch, then come from the doc cache
+    fetched = {}
+
+    async def get_object_doc(name):
+        if name not in fetched:
+            await asyncio.sleep(FETCH_LATENCY)
+            fetched[name] = {"object_name": name, "description": f"Full reference for {name}", "url": f"/{name}"}
+        return fetched[name]
+
+    engine.cycling74.get_object_doc = get_object_doc
+    yield engine
+    await engine.cycling74.close()
+
+
+@pytest.mark.asyncio
+async def test_summaries_return_within_budget_and_are_not_cached(engine):
+    started = time.perf_counter()
+    first = await engine.query("metro")
+    assert time.perf_counter() - started < FETCH_LATENCY
+
+    assert not first.partial
+    assert "cycling74" in first.sources_queried
+    qmetro = next(entry for entry in first.entries if entry.object_name == "qmetro")
+    assert qmetro.content.get("doc_pending")
+    assert len(engine.fusion_cache) == 0
+
+    # The fetch keeps running in the background and fills the doc cache
+    await asyncio.sleep(FETCH_LATENCY)
+    second = await engine.query("metro")
+    qmetro = next(entry for entry in second.entries if entry.object_name == "qmetro")
+    assert qmetro.description == "Full reference for qmetro"
+    assert not qmetro.content.get("doc_pending")
+    assert len(engine.fusion_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_doc_deadline_follows_the_source_limit(engine):
+    deadlines = []
+    search_many = engine.cycling74.search_many
+
+    async def record(queries, deadline=None):
+        deadlines.append(deadline)
+        return await search_many(queries, deadline)
+
+    engine.cycling74.search_many = record
+    engine.source_timeouts = {"cycling74": 0.2}
+    await engine.query("metro")
+    engine.query_budget = None
+    engine.source_timeouts = {}
+    await engine.query("counter")
+
+    assert deadlines == [pytest.approx(0.1), None]
@@ -0,0 +1,93 @@
+"""Tests that batch queries give what one query at a time gives"""
+
+from dataclasses import replace
+from datetime import datetime
+from typing import List
+
+import pytest
+import pytest_asyncio
+
+from src.knowledge import KnowledgeFusionEngine
+from src.knowledge.engine import Pattern, SearchResult
+
+QUERIES = ["metro", "groove", "Metro ", "buffer playback", "metro", "GROOVE", "timing", "no such thing"]
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    repo = tmp_path / "minutiae"
+    (repo / "sample-playback").mkdir(parents=True)
+    (repo / "sample-playback" / "groove.md").write_text(
+        "# Groove looping\n\nLoop a buffer~ with groove~, timed by a metro.\n"
+    )
+    (repo / "sample-playback" / "scrub.md").write_text("# Scrubbing\n\nBuffer playback driven by a line~.\n")
+
+    engine = KnowledgeFusionEngine(
+        {
+            "auto_enhance_knowledge": False,
+            "cycling74_docs": {
+                "cache_dir": str(tmp_path / "cache"),
+                "mirror_path": str(tmp_path / "mirror.db"),
+                "offline": True,
+            },
+            "minutiae_repo": {"local_path": str(repo), "watch_for_changes": False, "index_snapshot": False},
+        }
+    )
+    engine.cycling74.object_index = engine.cycling74._get_default_object_index()
+    # Relevant enough for its full reference page, which only the doc cache has
+    engine.cycling74.object_index["metro"]["description"] = "Output a bang every metro interval"
+    engine.cycling74._build_name_indexes()
+    engine.cycling74.cache.put("objects/metro", {"object_name": "metro", "description": "Full metro reference"})
+    await engine.minutiae._build_index()
+    engine.patterns["metro clock"] = Pattern(
+        name="metro clock",
+        description="A metro driving a counter",
+        examples=[],
+        confidence=0.9,
+        usage_count=3,
+        discovered_at=datetime(2024, 1, 1),
+        validated=True,
+        metadata={"tags": ["timing"]},
+    )
+    yield engine
+    await engine.cycling74.close()
+
+
+def comparable(result: SearchResult) -> SearchResult:
+    """A result without its timings and the creation times of its entries"""
+    return replace(
+        result,
+        query_time_ms=0.0,
+        entries=[replace(entry, timestamp=None) for entry in result.entries],
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("context", [None, {"domain": "temporal"}])
+@pytest.mark.parametrize("max_results", [None, 2])
+async def test_batch_matches_single_queries(engine, context, max_results):
+    engine.max_results = max_results
+
+    # One query is already cached when the batch starts
+    await engine.query("groove", context)
+    searched: List[List[str]] = []
+    search_many = engine.minutiae.search_many
+
+    async def record(queries, context=None):
+        searched.append(list(queries))
+        return await search_many(queries, context)
+
+    engine.minutiae.search_many = record
+    hits = engine.fusion_cache.hits
+    batch = await engine.query_many(QUERIES, context)
+
+    # Distinct uncached queries are searched once, in one pass
+    assert searched == [["metro", "buffer playback", "timing", "no such thing"]]
+    assert engine.fusion_cache.hits == hits + 1
+    assert [result.query for result in batch] == QUERIES
+    assert batch[0].entries[0].description == "Full metro reference"
+
+    engine.fusion_cache.clear()
+    await engine.query("groove", context)
+    singles = [await engine.query(query, context) for query in QUERIES]
+    assert [comparable(result) for result in batch] == [comparable(result) for result in singles]
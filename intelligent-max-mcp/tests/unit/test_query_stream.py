@@ -0,0 +1,123 @@
+"""Tests that a streamed query ends on the result query() gives"""
+
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Dict
+
+import pytest
+import pytest_asyncio
+
+from src.knowledge import KnowledgeFusionEngine
+from src.knowledge.engine import KnowledgeEntry
+
+TIMESTAMP = datetime.now() - timedelta(days=3)
+
+# (name, confidence, tags) per source, with ties inside and across sources
+SOURCES = {
+    "cycling74": [
+        ("metro", 0.9, []),
+        ("qmetro", 0.8, []),
+        ("tempo", 0.7, ["rhythm"]),
+        ("delay", 0.7, []),
+        ("pipe", 0.5, []),
+    ],
+    "minutiae": [
+        ("groove", 0.9, ["temporal"]),
+        ("clock", 0.9, []),
+        ("stutter", 0.7, []),
+        ("grid", 0.6, ["rhythm"]),
+        ("scrub", 0.4, []),
+    ],
+    "patterns": [("pulse", 0.85, ["rhythm"]), ("swing", 0.7, [])],
+}
+
+
+def source_result(source: str) -> Dict:
+    """Fresh entries on every call, as the sources return them"""
+    return {
+        "source": source,
+        "entries": [
+            KnowledgeEntry(
+                source=source,
+                object_name=name,
+                pattern_name=None,
+                description=f"{name} notes",
+                content={"name": name},
+                confidence=confidence,
+                tags=list(tags),
+                timestamp=TIMESTAMP,
+                metadata={},
+            )
+            for name, confidence, tags in SOURCES[source]
+        ],
+    }
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    engine = KnowledgeFusionEngine(
+        {
+            "query_budget": None,
+            "auto_enhance_knowledge": False,
+            "cycling74_docs": {"cache_dir": str(tmp_path), "mirror_path": str(tmp_path / "mirror.db")},
+            "minutiae_repo": {"local_path": str(tmp_path), "watch_for_changes": False, "index_snapshot": False},
+        }
+    )
+
+    async def search_cycling74(query, context, doc_deadline=None):
+        # Arrives after the local sources, re-ranking what was streamed
+        await asyncio.sleep(0.01)
+        return source_result("cycling74")
+
+    async def search_minutiae(query, context):
+        return source_result("minutiae")
+
+    async def search_patterns(query, context):
+        return source_result("patterns")
+
+    engine._search_cycling74 = search_cycling74
+    engine._search_minutiae = search_minutiae
+    engine._search_patterns = search_patterns
+    yield engine
+    await engine.cycling74.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_results", [None, 4, 1])
+@pytest.mark.parametrize("context", [None, {"domain": "temporal"}])
+async def test_last_update_matches_query(engine, max_results, context):
+    engine.max_results = max_results
+
+    updates = [update async for update in engine.query_stream("timing", context)]
+    assert [update.done for update in updates] == [False, True]
+
+    held = {}
+    for update in updates:
+        assert not held.keys() & update.added.keys()
+        held.update(update.added)
+        assert set(update.ranking) <= held.keys()
+
+    # The stream cached its complete result; compare it and the final update with a fresh query()
+    streamed = await engine.query("timing", context)
+    engine.fusion_cache.clear()
+    expected = await engine.query("timing", context)
+
+    last = updates[-1]
+    assert [held[key] for key in last.ranking] == expected.entries
+    assert last.suggestions == expected.suggestions
+    assert not last.partial
+    assert replace(streamed, query_time_ms=0.0) == replace(expected, query_time_ms=0.0)
+    assert streamed.total_results == 12
+
+
+@pytest.mark.asyncio
+async def test_local_update_ranks_the_local_sources_as_query_would(engine):
+    engine.max_results = 3
+    stream = engine.query_stream("timing")
+    first = await stream.__anext__()
+    await stream.aclose()
+    await asyncio.gather(*engine._background_tasks)
+
+    assert first.sources == ["minutiae", "patterns"]
+    assert [first.added[key].object_name for key in first.ranking] == ["groove", "clock", "pulse"]
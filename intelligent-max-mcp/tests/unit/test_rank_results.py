@@ -0,0 +1,110 @@
+"""Tests that the vectorized ranking matches the sort-based ranking it replaced"""
+
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.knowledge import KnowledgeFusionEngine
+from src.knowledge.engine import KnowledgeEntry
+
+
+def reference_rank(
+    entries: List[KnowledgeEntry],
+    context: Optional[Dict[str, Any]],
+    priors: Dict[str, float],
+    limit: Optional[int],
+) -> List[KnowledgeEntry]:
+    """The previous pure-Python ranking: sort, boost one entry at a time, sort again, then cut"""
+    ranked = sorted(entries, key=lambda x: x.confidence, reverse=True)
+
+    for entry in ranked:
+        entry.confidence *= priors.get(entry.source, 1.0)
+
+    if context:
+        if context.get("domain") == "temporal":
+            for entry in ranked:
+                if "temporal" in entry.tags or "rhythm" in entry.tags:
+                    entry.confidence *= 1.2
+
+        now = datetime.now()
+        for entry in ranked:
+            age_days = (now - entry.timestamp).days
+            if age_days < 7:
+                entry.confidence *= 1.1
+            elif age_days < 30:
+                entry.confidence *= 1.05
+
+    return sorted(ranked, key=lambda x: x.confidence, reverse=True)[:limit]
+
+
+def make_entries(count: int, seed: int) -> List[KnowledgeEntry]:
+    """Entries with few distinct confidences, so ties within and across sources are common"""
+    rng = random.Random(seed)
+    now = datetime.now()
+    return [
+        KnowledgeEntry(
+            source=rng.choice(["cycling74", "minutiae", "discovery"]),
+            object_name=f"object{index}",
+            pattern_name=None,
+            description="",
+            content={},
+            confidence=rng.choice([0.3, 0.5, 0.6, 0.9, 1.0]),
+            tags=rng.sample(["temporal", "rhythm", "audio", "ui", "timing"], rng.randint(0, 2)),
+            # Half a day off every boundary, so the age in days cannot change mid-test
+            timestamp=now - timedelta(days=rng.choice([0, 3, 10, 29, 45]), hours=12),
+            metadata={"index": index},
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = KnowledgeFusionEngine(
+        {
+            "cycling74_docs": {"cache_dir": str(tmp_path), "mirror_path": str(tmp_path / "mirror.db")},
+            "minutiae_repo": {"local_path": str(tmp_path), "watch_for_changes": False, "index_snapshot": False},
+        }
+    )
+    yield engine
+    engine.cycling74.cache.close()
+
+
+@pytest.mark.parametrize("priors", [{}, {"minutiae": 1.2, "cycling74": 0.9}, {"discovery": 1.0 / 0.9}])
+@pytest.mark.parametrize("context", [None, {"domain": "temporal"}, {"domain": "audio"}])
+@pytest.mark.parametrize("limit", [None, 0, 1, 5, 37, 200, 250])
+@pytest.mark.parametrize("seed", [1, 2])
+def test_matches_the_previous_ranking(engine, priors, context, limit, seed):
+    entries = make_entries(200, seed)
+    engine.source_priors = priors
+
+    expected = reference_rank([replace(entry) for entry in entries], context, priors, limit)
+    ranked = engine._rank_results([replace(entry) for entry in entries], "query", context, limit)
+
+    # Same entries in the same order, with bit-identical boosted confidences
+    assert [(entry.metadata["index"], entry.confidence) for entry in ranked] == [
+        (entry.metadata["index"], entry.confidence) for entry in expected
+    ]
+
+
+def test_ties_at_the_cut_keep_base_confidence_then_input_order(engine):
+    now = datetime.now()
+    entries = [
+        KnowledgeEntry(source, name, None, "", {}, confidence, [], now - timedelta(days=45), {})
+        for source, name, confidence in [
+            ("minutiae", "a", 0.5),
+            ("cycling74", "b", 0.6),
+            ("discovery", "c", 0.6),
+            ("cycling74", "d", 0.75),
+            ("minutiae", "e", 0.6),
+        ]
+    ]
+    # a (0.5 * 1.2) ties with b and c at 0.6, and the cut at 3 falls inside the tie: the higher base wins
+    engine.source_priors = {"minutiae": 1.2}
+    expected = reference_rank([replace(entry) for entry in entries], None, engine.source_priors, 3)
+    ranked = engine._rank_results([replace(entry) for entry in entries], "query", None, 3)
+
+    assert [entry.object_name for entry in ranked] == [entry.object_name for entry in expected] == ["d", "e", "b"]
@@ -0,0 +1,121 @@
+"""Tests for the BM25F inverted index"""
+
+import math
+
+import pytest
+
+from src.knowledge.search_index import InvertedIndex, analyze_fields, tokenize
+
+FIELDS = {"title": 3.0, "body": 1.0}
+
+
+def make_index(**kwargs) -> InvertedIndex:
+    index = InvertedIndex(FIELDS, **kwargs)
+    index.add(1, {"title": "metro timing", "body": "metro bangs at a regular interval"})
+    index.add(2, {"title": "groove~ looping", "body": "sample playback with metro sync"})
+    index.add(3, {"title": "buffer~", "body": "stores audio samples"})
+    return index
+
+
+def bm25f(index: InvertedIndex, doc_id: int, token: str) -> float:
+    """Reference BM25F score of one exact token, computed from the index state"""
+    doc_count = len(index)
+    posting = index.postings[token]
+    idf = math.log(1.0 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+    weighted_tf = 0.0
+    for position, tf in enumerate(posting[doc_id]):
+        average = max(index.total_lengths[position] / doc_count, 1.0)
+        norm = 1.0 - index.b + index.b * index.field_lengths[doc_id][position] / average
+        weighted_tf += index.weights[position] * tf / norm
+    return idf * weighted_tf / (index.k1 + weighted_tf)
+
+
+def test_tokenize_keeps_tilde():
+    assert tokenize("Play groove~ via METRO, jit.matrix") == ["play", "groove~", "via", "metro", "jit", "matrix"]
+
+
+def test_analyze_fields_posts_tilde_variants():
+    frequencies, lengths = analyze_fields(("title", "body"), {"title": "groove~", "body": "groove groove"})
+    assert frequencies["groove~"] == (1, 0)
+    assert frequencies["groove"] == (1, 2)
+    assert lengths == (1, 2)
+
+
+def test_score_matches_bm25f_formula():
+    index = make_index()
+    scores = index.score(["metro"])
+    assert set(scores) == {1, 2}
+    for doc_id in (1, 2):
+        assert scores[doc_id] == pytest.approx(bm25f(index, doc_id, "metro"))
+    # The title match outweighs a body match
+    assert scores[1] > scores[2]
+
+
+def test_scores_add_up_over_distinct_tokens():
+    index = make_index()
+    combined = index.score(["metro", "sample", "metro"])
+    assert combined[2] == pytest.approx(bm25f(index, 2, "metro") + bm25f(index, 2, "sample"))
+
+
+def test_score_many_matches_score():
+    index = make_index()
+    queries = [["metro"], ["audio", "metro"], ["missing"], []]
+    assert index.score_many(queries) == [index.score(tokens) for tokens in queries]
+
+
+def test_candidates_restrict_scoring():
+    index = make_index()
+    assert set(index.score(["metro"], candidates={2, 3})) == {2}
+
+
+def test_remove_and_readd_keep_bookkeeping_consistent():
+    index = make_index()
+    before = index.score(["metro", "audio"])
+    total_lengths = list(index.total_lengths)
+
+    index.remove(3)
+    assert 3 not in index
+    assert "audio" not in index.postings
+    assert "stores" not in index.postings
+    assert index.total_lengths == [total - length for total, length in zip(total_lengths, (1, 3))]
+    assert "audio" not in index._expand_prefix("aud")
+
+    index.add(3, {"title": "buffer~", "body": "stores audio samples"})
+    assert index.total_lengths == total_lengths
+    assert index.score(["metro", "audio"]) == pytest.approx(before)
+
+    # Re-adding an id replaces the previous version
+    index.add(1, {"title": "counter", "body": "counts"})
+    assert len(index) == 3
+    assert 1 not in index.postings.get("metro", {})
+    assert index.doc_terms[1] == ("counter", "counts")
+
+    index.clear()
+    assert len(index) == 0
+    assert index.score(["metro"]) == {}
+
+
+def test_prefix_expansion_is_discounted():
+    index = make_index(prefix_discount=0.5)
+    assert index._expand_prefix("sam") == ["sample", "samples"]
+    assert index._expand_prefix("sa") == []
+
+    scores = index.score(["sam"])
+    assert scores[2] == pytest.approx(0.5 * bm25f(index, 2, "sample"))
+    assert scores[3] == pytest.approx(0.5 * bm25f(index, 3, "samples"))
+
+    # Exact tokens are never expanded
+    assert set(index.score(["metro"])) == {1, 2}
+
+
+def test_prefix_expansion_sees_new_terms():
+    index = make_index()
+    assert index._expand_prefix("seq") == []
+    index.add(4, {"title": "seq~", "body": "sequencer"})
+    assert index._expand_prefix("seq") == ["seq", "sequencer", "seq~"]
+
+
+def test_empty_index_scores_nothing():
+    index = InvertedIndex(FIELDS)
+    assert index.score(["metro"]) == {}
+    assert index.score_many([["a"], ["b"]]) == [{}, {}]